@@ -2,12 +2,15 @@ from tkinter import filedialog  # In order to open file with Explorer
 import customtkinter as ctk
 from PIL import Image
 import os
-import pandas as pd
-from tksheet import Sheet
+import multiprocessing
+import threading
 from tkinter import messagebox
 import webbrowser
 
-import bup_plan_analyzer as bup  # Source file with program functions
+# Analysis modules (pandas, tksheet, bup_plan_analyzer with NumPy/matplotlib, bup_export with openpyxl and bup_session) are only needed after a Scope file
+# or session is chosen. They are imported in background as soon as the Main Screen is shown (see warm_up_analyzer_modules()), so that it appears immediately.
+# Startup imports are measured by benchmarks/bench_import_time.py
+pd, Sheet, bup, bup_export, bup_session = None, None, None, None, None
 
 # App Settings
 active_user = os.getlogin()
@@ -30,10 +33,29 @@ readme_url = r'https://github.com/paulinhok14/BUP-Plan-Analyzer/blob/master/READ
 # readme_path = os.path.join(app_path, 'README.md')
 # TO DO: Make README.md open local file using default web browser (or specific), independent of default ".md" openers from user OS
 
-# These variables will keep the Last Acq Cost canvas showed, so that I can handle it on CTkSwitch toggle (AcqCost/Parts)
+# These variables will keep the Last Acq Cost canvas key showed (see bup.get_canvas()), so that I can handle it on CTkSwitch toggle (AcqCost/Parts)
 last_acq_cost_canvas_eff, last_acq_cost_canvas_hyp, last_cost_avoidance_canvas = None, None, None
 
 
+def load_analyzer_modules() -> None:
+    # Assigns the analysis modules. Instant if already imported by warm_up_analyzer_modules(), otherwise waits for its import to finish
+    global pd, Sheet, bup, bup_export, bup_session
+    import pandas
+    from tksheet import Sheet as tksheet_sheet
+    import bup_plan_analyzer  # Source file with program functions
+    import bup_export as bup_export_engine  # Excel export engine
+    import bup_session as bup_session_files  # Session files (.bups)
+    pd, Sheet, bup, bup_export, bup_session = pandas, tksheet_sheet, bup_plan_analyzer, bup_export_engine, bup_session_files
+
+
+def warm_up_analyzer_modules() -> None:
+    # Background thread: only imports the modules (they are assigned by load_analyzer_modules(), when a Scope file is chosen)
+    try:
+        import pandas, tksheet, bup_plan_analyzer, bup_export, bup_session
+    except Exception:
+        pass  # Import errors are raised again (in the Tk thread) by load_analyzer_modules()
+
+
 def main():
     main_screen = ctk.CTk()  # Main Screen
 
@@ -58,7 +80,11 @@ def main():
         file_path = filedialog.askopenfilename()
         return file_path
 
-    def create_new_window(title: str):  # Function to create new window
+    def select_session_file() -> str:  # Function to select a session file (.bups) and return its path
+        file_path = filedialog.askopenfilename(filetypes=[('BUP Analyzer Session', '*.bups')])
+        return file_path
+
+    def create_new_window(title: str, open_session: bool = False):  # Function to create new window
         # Configures the Execution warning label
         lbl_loading.configure(text="Please wait while complementary data is fetched...")
 
@@ -71,11 +97,28 @@ def main():
         chart_mode_selection_eff = ctk.StringVar(value='Parts (#)')
         chart_mode_selection_hyp = ctk.StringVar(value='Parts (#)')
 
-        # Reading the Scope file before creating the window
-        full_file_path = select_file()  # Selecting Scope file
-
-        # Executing the function that reads complementary info and organizes DataFrame
-        bup_scope = bup.read_scope_file(full_file_path, 'local')
+        # Reading the Scope file (or a saved session) before creating the window
+        full_file_path = select_session_file() if open_session else select_file()
+
+        # Analysis modules (usually already imported in background)
+        load_analyzer_modules()
+
+        if open_session:
+            # Session: Scope already read (no complementary info fetch) and Scenarios results, shown once the window is created
+            if not full_file_path:
+                lbl_loading.configure(text="")
+                return
+            try:
+                session = bup_session.load_session(full_file_path)
+            except Exception as ex:
+                lbl_loading.configure(text="")
+                messagebox.showerror("Error", f"Session could not be opened:\n\n{ex}")
+                return
+            bup_scope, full_file_path = session['bup_scope'], session['scope_file']
+        else:
+            session = None
+            # Executing the function that reads complementary info and organizes DataFrame
+            bup_scope = bup.read_scope_file(full_file_path, 'local')
 
         # Resets the Execution label to empty text
         lbl_loading.configure(text="")
@@ -87,8 +130,11 @@ def main():
         def on_closing_main2() -> None:
             new_window.withdraw()
             main_screen.deiconify()
-            # Reseting IntVar with Scenario counts
+            # Reseting IntVar with Scenario counts and the Scenarios results saved in sessions
             var_scenarios_count.set(0)
+            bup.scenario_results = None
+            # Closing all charts (figures and Canvas) of this window
+            bup.release_all_figures()
 
         # New window settings
         new_window.title(title)
@@ -109,7 +155,8 @@ def main():
         # TabView - Secondary screen elements: Tabs
         tbvmenu = ctk.CTkTabview(new_window, width=650, height=600, corner_radius=20,
                                  segmented_button_fg_color="#009898", segmented_button_unselected_color="#009898",
-                                 segmented_button_selected_color="#006464", bg_color='#ebebeb', fg_color='#dbdbdb')
+                                 segmented_button_selected_color="#006464", bg_color='#ebebeb', fg_color='#dbdbdb',
+                                 command=lambda: callback_func_tab_change())
 
         tbvmenu.pack()
         tbvmenu.add("Scope")
@@ -118,54 +165,42 @@ def main():
 
         # tbvmenu.add("Stock Analysis")
 
+        # Function called when a Tab is selected. Charts of the Tab are built (only once) when it is shown
+        def callback_func_tab_change() -> None:
+            if tbvmenu.get() == "Leadtime Analysis":
+                bup.get_canvas('leadtime_dispersion')
+                bup.get_canvas('leadtime_histogram')
+
         @bup.function_timer
-        def export_data(xl_spreadsheet: str) -> None:
+        def export_data(xl_spreadsheet: str, tk_widget=None) -> None:
             """ Function that will run when user click on "Export to Excel" button.
             param xl_spreadsheet: It contains the specific spreadsheet that will be exported.
-            Possibilities: 'efficient_chart', 'hypothetical_chart', 'scope', 'batches'.
-            All used variables is consumed from bup_plan_analyzer.py.
+            Possibilities: 'efficient_chart', 'hypothetical_chart', 'scope', 'batches', 'savings_surface', 'all'.
+            param tk_widget: Widget of the window in which the export result is notified. Default: Scope window.
+            All used variables is consumed from bup_plan_analyzer.py. Files are written by bup_export.py, in the format chosen in
+            the Scope tab (Excel workbook, or Parquet/Arrow IPC/CSV files for big outputs), in background (see bup.submit_export_job()).
             """
+            tk_widget = tk_widget or tbvmenu
+
+            def write_export(file_name: str, get_sheets) -> None:
+                # Sheets (list of (sheet name, DataFrame) returned by 'get_sheets') are taken now, and written by the export writer
+                try:
+                    sheets, file_format = get_sheets(), opt_export_format.get()
+                except Exception as ex:
+                    bup.show_notification(tk_widget, f'Export failed: {ex}', 'error')
+                    return
+                full_path = bup_export.get_export_path(export_output_path + '\\' + file_name, sheets, file_format)
+                bup.submit_export_job(tk_widget, full_path, lambda temp_path: bup_export.export_sheets(temp_path, sheets, file_format))
 
             # Switch-case depending on which spreadsheet should be exported
             match xl_spreadsheet:
                 case 'efficient_chart':
-                    try:
-                        full_path = export_output_path + r'\BUP_Eficient_Chart_Data.xlsx'
-                        with pd.ExcelWriter(full_path) as writer:
-
-                            eff_consolidated_scenarios = pd.DataFrame()
-                            for scenario_name, scenario_df_list in bup.scenario_dataframes.items():
-                                eff_consolidated_scenarios = pd.concat(
-                                    [eff_consolidated_scenarios, scenario_df_list[0]],
-                                    ignore_index=True)
-
-                            eff_consolidated_scenarios.to_excel(writer, sheet_name='Efficient Chart Data', index=False)
-                        messagebox.showinfo(title="Success!", message=str("Excel sheet was exported to: " + full_path))
-
-                    except Exception as ex:
-                        messagebox.showinfo(title="Error!",
-                                            message=str(ex) + "\n\nPlease make sure that the Excel file is "
-                                                              "closed and you have access to the Downloads folder.")
+                    write_export('BUP_Eficient_Chart_Data',
+                                 lambda: [('Efficient Chart Data', bup_export.consolidate_scenarios(bup.scenario_dataframes, 0))])
 
                 case 'hypothetical_chart':
-                    try:
-                        full_path = export_output_path + r'\BUP_Hypothetical_Chart_Data.xlsx'
-                        with pd.ExcelWriter(full_path) as writer:
-
-                            hyp_consolidated_scenarios = pd.DataFrame()
-                            for scenario_name, scenario_df_list in bup.scenario_dataframes.items():
-                                hyp_consolidated_scenarios = pd.concat(
-                                    [hyp_consolidated_scenarios, scenario_df_list[1]],
-                                    ignore_index=True)
-
-                            hyp_consolidated_scenarios.to_excel(writer, sheet_name='Hypothetical Chart Data',
-                                                                index=False)
-                        messagebox.showinfo(title="Success!", message=str("Excel sheet was exported to: " + full_path))
-
-                    except Exception as ex:
-                        messagebox.showinfo(title="Error!",
-                                            message=str(ex) + "\n\nPlease make sure that the Excel file is "
-                                                              "closed and you have access to the Downloads folder.")
+                    write_export('BUP_Hypothetical_Chart_Data',
+                                 lambda: [('Hypothetical Chart Data', bup_export.consolidate_scenarios(bup.scenario_dataframes, 1))])
 
                 case 'scope':
                     '''
@@ -173,41 +208,26 @@ def main():
                     Else, only Scope information will be exported.
                     '''
                     if not isinstance(bup.df_scope_with_scenarios, pd.DataFrame):
-                        try:
-                            full_path = export_output_path + r'\BUP_Scope_Data.xlsx'
-                            with pd.ExcelWriter(full_path) as writer:
-                                bup_scope.to_excel(writer, sheet_name='Scope', index=False)
-                            messagebox.showinfo(title="Success!",
-                                                message=str("Excel sheet was exported to: " + full_path))
-                        except Exception as ex:
-                            messagebox.showinfo(title="Error!",
-                                                message=str(ex) + "\n\nPlease make sure that the Excel file is "
-                                                                  "closed and you have access to the Downloads folder.")
+                        write_export('BUP_Scope_Data', lambda: [('Scope', bup_scope)])
                     else:
-                        try:
-                            full_path = export_output_path + r'\BUP_Scope_with_Scenarios_Data.xlsx'
-                            with pd.ExcelWriter(full_path) as writer:
-                                bup.df_scope_with_scenarios.to_excel(writer, sheet_name='Scope with Scenarios',
-                                                                     index=False)
-                            messagebox.showinfo(title="Success!",
-                                                message=str("Excel sheet was exported to: " + full_path))
-                        except Exception as ex:
-                            messagebox.showinfo(title="Error!",
-                                                message=str(ex) + "\n\nPlease make sure that the Excel file is "
-                                                                  "closed and you have access to the Downloads folder.")
+                        # Scope with Scenarios and PN Net Present Value (Efficient x Hypothetical purchase) aggregated by SPC and EIS Critical
+                        write_export('BUP_Scope_with_Scenarios_Data',
+                                     lambda: [('Scope with Scenarios', bup.df_scope_with_scenarios),
+                                              ('NPV by SPC', bup.aggregate_parts_npv(bup.df_scope_with_scenarios, 'SPC')),
+                                              ('NPV by EIS Critical', bup.aggregate_parts_npv(bup.df_scope_with_scenarios, 'EIS Critical'))])
 
-                case 'batches':
-                    try:
-                        full_path = export_output_path + r'\BUP_Analyzer_Batches_Data.xlsx'
-                        with pd.ExcelWriter(full_path) as writer:
-                            bup.df_batches_full_info.to_excel(writer, sheet_name='Batches Info', index=False)
+                case 'savings_surface':
+                    write_export('BUP_Savings_Sensitivity_Data',
+                                 lambda: [('WACC x Efficiency Savings', bup.get_savings_surface_dataframe())])
 
-                        messagebox.showinfo(title="Success!", message=str("Excel sheet was exported to: " + full_path))
+                case 'batches':
+                    write_export('BUP_Analyzer_Batches_Data', lambda: [('Batches Info', bup.df_batches_full_info)])
 
-                    except Exception as ex:
-                        messagebox.showinfo(title="Error!",
-                                            message=str(ex) + "\n\nPlease make sure that the Excel file is "
-                                                              "closed and you have access to the Downloads folder.")
+                case 'all':
+                    # Scope, Scope with Scenarios, all curves, Cost Avoidance and Batches in a single workbook
+                    write_export('BUP_Analyzer_All_Data',
+                                 lambda: bup_export.application_sheets(bup_scope, bup.df_scope_with_scenarios, bup.scenario_dataframes,
+                                                                       bup.df_batches_full_info))
 
         # Tab 1 - Scope
         bup_cost: float = bup_scope.apply(lambda linha: linha['Acq Cost'] * linha['Qty'], axis=1).sum()
@@ -235,10 +255,149 @@ def main():
         lbl_export_xl.place(rely=0, relx=0)
         lbl_export_xl.bind(sequence='<Button-1>', command=lambda _: export_data('scope'))
 
+        # Export All Label: every data of the application (Scope, Scenarios curves, Cost Avoidance and Batches) in a single workbook
+        lbl_export_all_xl = ctk.CTkLabel(tbvmenu.tab("Scope"),
+                                         text='Export All ',
+                                         font=ctk.CTkFont('open sans', size=12, underline=True),
+                                         text_color='#25a848',
+                                         image=img_xl_icon_label,
+                                         compound="right",
+                                         cursor="hand2"
+                                         )
+        lbl_export_all_xl.place(rely=0, x=130)
+        lbl_export_all_xl.bind(sequence='<Button-1>', command=lambda _: export_data('all'))
+
+        # Export format of all exports: columnar formats (typed dates) for outputs too big for Excel
+        opt_export_format = ctk.CTkOptionMenu(tbvmenu.tab("Scope"), values=bup_export.get_export_formats(), width=95, height=22,
+                                              font=ctk.CTkFont('open sans', size=11))
+        opt_export_format.place(rely=0, x=225)
+
+        # Function that saves the session (Scope and Scenarios results) in background, so that it is reopened without recalculating
+        def save_session() -> None:
+            session_path = filedialog.asksaveasfilename(initialdir=export_output_path, initialfile='BUP_Analyzer_Session',
+                                                        defaultextension=bup_session.session_extension,
+                                                        filetypes=[('BUP Analyzer Session', '*' + bup_session.session_extension)])
+            if not session_path:
+                return
+            session_data = {'scope_file': os.path.basename(full_file_path), 'bup_scope': bup_scope,
+                            'scenario_results': bup.scenario_results}
+            bup.submit_export_job(tbvmenu, session_path, lambda temp_path: bup_session.save_session(temp_path, session_data))
+
+        # Save Session Label
+        lbl_save_session = ctk.CTkLabel(tbvmenu.tab("Scope"),
+                                        text='Save Session',
+                                        font=ctk.CTkFont('open sans', size=12, underline=True),
+                                        text_color='#009898',
+                                        cursor="hand2"
+                                        )
+        lbl_save_session.place(rely=0, x=330)
+        lbl_save_session.bind(sequence='<Button-1>', command=lambda _: save_session())
+
+        # Table model of the Sheet: rows are read from the Scope columns only when shown (see bup.build_scope_table())
+        scope_table = bup.build_scope_table(bup_scope)
+
+        # Filter bar: text filter of the selected column, search (PN, Ecode and Description) and Leadtime/Acq Cost ranges
+        frm_scope_filter = ctk.CTkFrame(tbvmenu.tab("Scope"), fg_color='transparent')
+        frm_scope_filter.pack(fill="x", pady=(0, 3))
+
+        opt_filter_column = ctk.CTkOptionMenu(frm_scope_filter, values=scope_table['headers'], width=140, height=24,
+                                              font=ctk.CTkFont('open sans', size=11),
+                                              command=lambda _: ent_filter_text.delete(0, ctk.END))
+        opt_filter_column.pack(side="left", padx=(0, 5))
+
+        ent_filter_text = ctk.CTkEntry(frm_scope_filter, placeholder_text='Filter...', width=180, height=24,
+                                       font=ctk.CTkFont('open sans', size=11))
+        ent_filter_text.pack(side="left")
+
+        ent_search_text = ctk.CTkEntry(frm_scope_filter, placeholder_text='Search PN, Ecode or Description...', width=230, height=24,
+                                       font=ctk.CTkFont('open sans', size=11))
+        ent_search_text.pack(side="right")
+
+        # Range entries (min, max) of numeric columns, in a second row
+        frm_scope_ranges = ctk.CTkFrame(tbvmenu.tab("Scope"), fg_color='transparent')
+        frm_scope_ranges.pack(fill="x", pady=(0, 3))
+
+        range_entries = {}
+        for range_header in ['Leadtime', 'Acq Cost']:
+            ctk.CTkLabel(frm_scope_ranges, text=f'{range_header}:', font=ctk.CTkFont('open sans', size=11),
+                         text_color='#000000').pack(side="left", padx=(0, 3))
+            ent_range_min = ctk.CTkEntry(frm_scope_ranges, placeholder_text='Min', width=70, height=24, font=ctk.CTkFont('open sans', size=11))
+            ent_range_min.pack(side="left")
+            ent_range_max = ctk.CTkEntry(frm_scope_ranges, placeholder_text='Max', width=70, height=24, font=ctk.CTkFont('open sans', size=11))
+            ent_range_max.pack(side="left", padx=(3, 20))
+            range_entries[range_header] = (ent_range_min, ent_range_max)
+
         # Creating Sheet object to display dataframe
-        sheet = Sheet(tbvmenu.tab("Scope"), data=bup_scope.values.tolist(), headers=bup_scope.columns.tolist())
+        sheet = Sheet(tbvmenu.tab("Scope"), data=scope_table['rows'], headers=scope_table['headers'])
         sheet.pack(fill="both", expand=True)
 
+        def refresh_scope_sheet() -> None:
+            # Sheet rows were sorted/filtered in the table model: only rows positions, headers and rows count are updated
+            headers = scope_table['headers'].copy()
+            if scope_table['sort'] is not None:
+                sort_column, ascending = scope_table['sort']
+                headers[sort_column] += ' ▲' if ascending else ' ▼'
+            sheet.headers(headers)
+            sheet.data_reference(scope_table['rows'], reset_col_positions=False, reset_row_positions=True, redraw=True)
+            lbl_rows_count.configure(text=f"Rows: {len(scope_table['view'])}" if not scope_table['filters']
+                                     else f"Rows: {len(scope_table['view'])} of {bup_scope.shape[0]}")
+
+        # Filtering after the user stops typing. Search and ranges are indexed, so they follow the typing closely
+        filter_jobs = {}  # Pending job of each filter
+
+        def apply_scope_filter() -> None:
+            column_position = scope_table['headers'].index(opt_filter_column.get())
+            bup.filter_scope_table(scope_table, column_position, ent_filter_text.get().strip())
+            refresh_scope_sheet()
+
+        def apply_scope_search() -> None:
+            bup.search_scope_table(scope_table, ent_search_text.get())
+            refresh_scope_sheet()
+
+        def apply_scope_ranges() -> None:
+            for range_header, range_entry_pair in range_entries.items():
+                range_values = []
+                for range_entry in range_entry_pair:
+                    try:
+                        range_values.append(float(range_entry.get().replace(',', '')) if range_entry.get().strip() else None)
+                        range_entry.configure(border_color=ctk.ThemeManager.theme['CTkEntry']['border_color'])
+                    except ValueError:  # Invalid number: limit is ignored
+                        range_values.append(None)
+                        range_entry.configure(border_color='#e84343')
+                bup.filter_scope_table_range(scope_table, scope_table['headers'].index(range_header), *range_values)
+            refresh_scope_sheet()
+
+        def schedule_scope_filter(apply_function, delay: int) -> None:
+            if apply_function in filter_jobs:
+                ent_filter_text.after_cancel(filter_jobs[apply_function])
+            filter_jobs[apply_function] = ent_filter_text.after(delay, apply_function)
+
+        ent_filter_text.bind('<KeyRelease>', lambda _: schedule_scope_filter(apply_scope_filter, 300))
+        ent_search_text.bind('<KeyRelease>', lambda _: schedule_scope_filter(apply_scope_search, 80))
+        for range_entry_pair in range_entries.values():
+            for range_entry in range_entry_pair:
+                range_entry.bind('<KeyRelease>', lambda _: schedule_scope_filter(apply_scope_ranges, 150))
+
+        # The search index is built when the search box gets focus, so that the first keystroke is not delayed
+        def build_search_index(_) -> None:
+            if scope_table['search_index'] is None:
+                scope_table['search_index'] = bup.build_scope_search_index(scope_table)
+
+        ent_search_text.bind('<FocusIn>', build_search_index, add='+')
+
+        # Double click on a column header sorts the rows by it (ascending, then descending)
+        def sort_scope_sheet(event) -> None:
+            if sheet.CH.rsz_w is not None:  # Double click on column border resizes it
+                return
+            column_position = sheet.identify_column(event)
+            if column_position is None or column_position >= len(scope_table['headers']):
+                return
+            ascending = scope_table['sort'] != (column_position, True)
+            bup.sort_scope_table(scope_table, column_position, ascending)
+            refresh_scope_sheet()
+
+        sheet.CH.bind('<Double-Button-1>', sort_scope_sheet, add='+')
+
         # Label with information: file name and rows number
         lbl_file_name = ctk.CTkLabel(tbvmenu.tab("Scope"), text="File: " + os.path.basename(full_file_path),
                                      font=ctk.CTkFont('open sans', size=10, weight='bold'),
@@ -252,11 +411,11 @@ def main():
 
         # Tab 2 - Leadtime Analysis
 
-        # Inserting Acq Cost x Leadtime Scatter and returning CTk Image object
-        dispersion_image = bup.generate_dispersion_chart(bup_scope, tbvmenu.tab("Leadtime Analysis"))
-
-        # Inserting Histogram Chart and returning CTk Image object
-        histogram_image = bup.generate_histogram(bup_scope, tbvmenu.tab("Leadtime Analysis"))
+        # Registering Acq Cost x Leadtime Scatter and Histogram charts. They are only built when the tab is opened
+        bup.register_canvas('leadtime_dispersion',
+                            lambda: bup.generate_dispersion_chart(bup_scope, tbvmenu.tab("Leadtime Analysis")))
+        bup.register_canvas('leadtime_histogram',
+                            lambda: bup.generate_histogram(bup_scope, tbvmenu.tab("Leadtime Analysis")))
 
         # Tab 3 - Scenarios
 
@@ -373,7 +532,11 @@ def main():
         # Function that will be called to evaluate the control variable and Show/Hide buttons (Export Date/Save Image)
         def callback_func_scenario_add(scenarios_count) -> None:
 
-            global last_acq_cost_canvas_eff, last_acq_cost_canvas_hyp
+            global last_acq_cost_canvas_eff, last_acq_cost_canvas_hyp, last_cost_avoidance_canvas
+
+            # Scenario count is reset when the Scope window is closed. There is nothing to show
+            if scenarios_count.get() == 0:
+                return
 
             # When a Scenario is created, the ComboBox values will also be updated
             cbx_selected_scenario_eff.configure(values=list(bup.scenario_dataframes.keys()))
@@ -402,7 +565,7 @@ def main():
                                                               image=excel_icon, compound="top", fg_color="transparent",
                                                               bg_color='#cfcfcf',
                                                               text_color="#000000", hover=False, border_spacing=1,
-                                                              command=lambda: (export_data('batches')))
+                                                              command=lambda: (export_data('batches', bup.tbv_batch_charts)))
 
                 # Export data button - Batches (Acq Cost)
                 btn_export_data_batches_cost = ctk.CTkButton(master=bup.tbv_batch_charts.tab('Acq Cost'),
@@ -411,7 +574,7 @@ def main():
                                                              image=excel_icon, compound="top", fg_color="transparent",
                                                              bg_color='#cfcfcf',
                                                              text_color="#000000", hover=False, border_spacing=1,
-                                                             command=lambda: (export_data('batches')))
+                                                             command=lambda: (export_data('batches', bup.tbv_batch_charts)))
                 # Placing
                 btn_export_data_batches_parts.place(relx=0.92, rely=0.93, anchor=ctk.CENTER)
                 btn_export_data_batches_cost.place(relx=0.92, rely=0.93, anchor=ctk.CENTER)
@@ -420,19 +583,24 @@ def main():
                 cbx_selected_scenario_eff.set(list(bup.scenario_dataframes.keys())[0])
                 cbx_selected_scenario_hyp.set(list(bup.scenario_dataframes.keys())[0])
 
-                # Also only when a first Scenario is created, I assign this first scenario charts to Acq Cost last showed charts
+                # Also only when a first Scenario is created, I assign this first scenario charts keys to Acq Cost last showed charts
                 last_acq_cost_canvas_eff = bup.canvas_list_acqcost_eff[0]
                 last_acq_cost_canvas_hyp = bup.canvas_list_acqcost_hyp[0]
-                # Same for Cost Avoidance chart
-                last_cost_avoidance_canvas = bup.canvas_list_cost_avoidance[0]
 
                 # Placing Cost Avoidance Screen elements
                 cbx_cost_avoidance.place(relx=0.13, rely=0.02, anchor=ctk.CENTER)
-                # Only in the first time, the ComboBox 'placeholder' will have the first Scenario
-                cbx_cost_avoidance.set(list(bup.scenario_dataframes.keys())[0])
+                btn_savings_heatmap.place(relx=0.45, rely=0.023, anchor=ctk.CENTER)
 
             else:
-                pass
+                # Acq Cost charts were registered again with the new Scenarios set, so the shown one is rebuilt
+                if chart_mode_selection_eff.get() == 'Acq Cost (US$)':
+                    bup.get_canvas(last_acq_cost_canvas_eff).get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
+                if chart_mode_selection_hyp.get() == 'Acq Cost (US$)':
+                    bup.get_canvas(last_acq_cost_canvas_hyp).get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
+
+            # Cost Avoidance screen shows the last created Scenario
+            last_cost_avoidance_canvas = bup.canvas_list_cost_avoidance[-1]
+            cbx_cost_avoidance.set(list(bup.scenario_dataframes.keys())[-1])
 
         def callback_func_chart_mode_toggle(chart_mode: ctk.StringVar, chart_name: str, mpl_canvas_list: list,
                                             cbx_triggered: bool = False, cbx_selected: str = None) -> None:
@@ -446,8 +614,8 @@ def main():
             mpl_canvas_list indexs:
             0: Efficient Chart - Parts
             1: Hypothetical Chart - Parts
-            2: List with Efficient Charts - Acq Cost, for each Scenario created.
-            3: List with Hypothetical Charts - Acq Cost, for each Scenario created.
+            2: List with Efficient Charts keys - Acq Cost, for each Scenario created (see bup.get_canvas()).
+            3: List with Hypothetical Charts keys - Acq Cost, for each Scenario created (see bup.get_canvas()).
             '''
 
             global last_acq_cost_canvas_eff, last_acq_cost_canvas_hyp
@@ -465,30 +633,30 @@ def main():
                         if chart_mode.get() == 'Acq Cost (US$)':
                             # Remove Parts Chart
                             parts_eff_chart.get_tk_widget().place_forget()
-                            # Insert Scenario ComboBox and Acq Cost Chart
+                            # Insert Scenario ComboBox and Acq Cost Chart (built in the first time it is shown)
                             cbx_selected_scenario_eff.place(relx=0.13, rely=0.02, anchor=ctk.CENTER)
-                            last_acq_cost_canvas_eff.get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
+                            bup.get_canvas(last_acq_cost_canvas_eff).get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
                         else:
                             # Insert Parts Chart
                             parts_eff_chart.get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
                             # Remove Scenario ComboBox and Acq Cost Chart
                             cbx_selected_scenario_eff.place_forget()
-                            last_acq_cost_canvas_eff.get_tk_widget().place_forget()
+                            bup.hide_canvas(last_acq_cost_canvas_eff)
 
                     # Hypothetical Window: CTkSwitch toggled
                     case 'hyp':
                         if chart_mode.get() == 'Acq Cost (US$)':
                             # Remove Parts Chart
                             parts_hyp_chart.get_tk_widget().place_forget()
-                            # Insert Scenario ComboBox and Acq Cost Chart
+                            # Insert Scenario ComboBox and Acq Cost Chart (built in the first time it is shown)
                             cbx_selected_scenario_hyp.place(relx=0.13, rely=0.02, anchor=ctk.CENTER)
-                            last_acq_cost_canvas_hyp.get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
+                            bup.get_canvas(last_acq_cost_canvas_hyp).get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
                         else:
                             # Insert Parts Chart
                             parts_hyp_chart.get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
                             # Remove Scenario ComboBox and Acq Cost Chart
                             cbx_selected_scenario_hyp.place_forget()
-                            last_acq_cost_canvas_hyp.get_tk_widget().place_forget()
+                            bup.hide_canvas(last_acq_cost_canvas_hyp)
 
             elif cbx_triggered == True:
                 # Getting the index to search on the list, based on the last char of value, ex: 0 for 'Scenario_0'
@@ -496,14 +664,14 @@ def main():
 
                 # Efficient Screen Switching
                 if chart_name == 'eff':
-                    last_acq_cost_canvas_eff.get_tk_widget().place_forget()
-                    list_acqcost_eff_charts[chart_index].get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
+                    bup.hide_canvas(last_acq_cost_canvas_eff)
+                    bup.get_canvas(list_acqcost_eff_charts[chart_index]).get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
                     last_acq_cost_canvas_eff = list_acqcost_eff_charts[chart_index]
 
                 # Hypothetical Screen Switching
                 elif chart_name == 'hyp':
-                    last_acq_cost_canvas_hyp.get_tk_widget().place_forget()
-                    list_acqcost_hyp_charts[chart_index].get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
+                    bup.hide_canvas(last_acq_cost_canvas_hyp)
+                    bup.get_canvas(list_acqcost_hyp_charts[chart_index]).get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
                     last_acq_cost_canvas_hyp = list_acqcost_hyp_charts[chart_index]
 
         def callback_func_costavoid_cbx(cbx_selected, costavoid_canvas_list: list):
@@ -511,12 +679,11 @@ def main():
             This function will handle charts/components exhibition based on selected Scenario on Cost Avoidance screen ComboBox
             '''
 
-            # Getting the index to search on the list, based on the last char of value, ex: 0 for 'Scenario_0'
-            chart_index = int(cbx_selected[-1])
+            global last_cost_avoidance_canvas
 
-            # TO DO: Cost Avoidance screen with different scenarios
-            # print('Cost Avoidance ComboBox was triggered!')
-            # print(cbx_selected)
+            # Showing the selected Scenario chart and Savings (the chart is built in the first time it is shown)
+            bup.select_cost_avoidance_scenario(cbx_selected)
+            last_cost_avoidance_canvas = costavoid_canvas_list[list(bup.scenario_dataframes.keys()).index(cbx_selected)]
 
         # Tracing Scenario creation variable and calling the respective functions every time the variable changes
         var_scenarios_count.trace_add("write", callback=lambda *args: callback_func_scenario_add(var_scenarios_count))
@@ -548,14 +715,14 @@ def main():
                                             font=ctk.CTkFont('open sans', size=10, weight='bold'),
                                             image=excel_icon, compound="top", fg_color="transparent",
                                             text_color="#000000", hover=False, border_spacing=1,
-                                            command=lambda: (export_data('efficient_chart')))
+                                            command=lambda: (export_data('efficient_chart', tbv_curve_charts)))
 
         # Export data button - Hypothetical
         btn_export_data_hyp = ctk.CTkButton(master=tbv_curve_charts.tab('Hypothetical Curve'), text="Export to Excel",
                                             font=ctk.CTkFont('open sans', size=10, weight='bold'),
                                             image=excel_icon, compound="top", fg_color="transparent",
                                             text_color="#000000", hover=False, border_spacing=1,
-                                            command=lambda: (export_data('hypothetical_chart')))
+                                            command=lambda: (export_data('hypothetical_chart', tbv_curve_charts)))
 
         # Label with the instruction to create a Scenario
         lbl_pending_scenario = ctk.CTkLabel(tbvmenu.tab("Scenarios"),
@@ -622,6 +789,39 @@ def main():
                                                                                                 costavoid_canvas_list=bup.canvas_list_cost_avoidance))
                                              )
 
+        # Function that opens the WACC x Procurement Efficiency Savings heatmap for the selected Scenario
+        def open_savings_heatmap() -> None:
+            heatmap_window = ctk.CTkToplevel(cost_avoidance_screen, fg_color='#ebebeb')
+            heatmap_window.title("Savings Sensitivity: WACC x Procurement Efficiency")
+            heatmap_window.resizable(width=False, height=False)
+            # Releasing the heatmap figure when the window is closed
+            heatmap_window.protocol("WM_DELETE_WINDOW", lambda: (bup.release_canvas('savings_heatmap'),
+                                                                 heatmap_window.destroy()))
+
+            # Heatmap Canvas is owned by the Canvas registry, so that the previous one is released
+            bup.register_canvas('savings_heatmap',
+                                lambda: bup.generate_savings_heatmap(heatmap_window, cbx_cost_avoidance.get()))
+            bup.get_canvas('savings_heatmap')
+
+            # Export data button - Savings Sensitivity
+            btn_export_savings_surface = ctk.CTkButton(heatmap_window, text="Export to Excel",
+                                                       font=ctk.CTkFont('open sans', size=10, weight='bold'),
+                                                       image=excel_icon, compound="top", fg_color="transparent",
+                                                       text_color="#000000", hover=False, border_spacing=1,
+                                                       command=lambda: (export_data('savings_surface', heatmap_window)))
+            btn_export_savings_surface.pack(pady=(0, 10))
+
+            # Setting (capturing) focus to the window
+            heatmap_window.grab_set()
+
+        # Button that opens the Savings Sensitivity heatmap
+        btn_savings_heatmap = ctk.CTkButton(cost_avoidance_screen, text='WACC x Efficiency',
+                                            command=open_savings_heatmap,
+                                            font=ctk.CTkFont('open sans', size=10, weight='bold'),
+                                            bg_color="#cfcfcf", fg_color="#009898", hover_color="#006464",
+                                            width=120, height=20, corner_radius=30, cursor="hand2"
+                                            )
+
         # Tab 4 - Stock Analysis
         # btn_read_stock_data = ctk.CTkButton(tbvmenu.tab("Stock Analysis"), text='Read Stock Data',
         #                               command=lambda: print('Stock read!'),
@@ -631,6 +831,12 @@ def main():
         #                               )
         # btn_read_stock_data.pack()
 
+        # Scenarios of the opened session (charts are shown as in Scenario creation, without recalculating the curves)
+        if session is not None and session['scenario_results'] is not None:
+            bup.restore_session_scenarios(session['scenario_results'], tbv_curve_charts.tab("Efficient Curve"),
+                                          tbv_curve_charts.tab("Hypothetical Curve"), tbv_curve_charts.tab("Cost Avoidance"),
+                                          tbv_curve_charts.tab("Batches Curve"), var_scenarios_count, bup_cost)
+
         # Hiding Main Screen
         main_screen.withdraw()
 
@@ -649,6 +855,15 @@ def main():
                                   )
     btnSearchFile.place(relx=0.5, rely=0.82, anchor=ctk.CENTER)
 
+    # Open Session button: analysis saved with "Save Session" (Scope tab)
+    btnOpenSession = ctk.CTkButton(master=main_screen, text='Open Session',
+                                   command=lambda: (create_new_window("Build-Up Plan Analyzer", open_session=True)),
+                                   font=ctk.CTkFont('open sans', size=11, weight='bold'),
+                                   bg_color="#242424", fg_color="#4a4a4a", hover_color="#006464",
+                                   width=150, height=26, corner_radius=30, cursor="hand2"
+                                   )
+    btnOpenSession.place(relx=0.5, rely=0.885, anchor=ctk.CENTER)
+
     # Loading label - will be displayed while the file and related information are being read
     lbl_loading = ctk.CTkLabel(master=main_screen, text='', fg_color='#242424', bg_color='#242424',
                                font=ctk.CTkFont('open sans', size=13, weight='bold'), text_color='#ffff00')
@@ -708,8 +923,13 @@ def main():
                             )
     lbl_mrse.place(relx=0.45, rely=0.93)
 
+    # Importing the analysis modules in background, once the Main Screen is shown
+    main_screen.after(200, lambda: threading.Thread(target=warm_up_analyzer_modules, name='WarmUpImports', daemon=True).start())
+
     main_screen.mainloop()  # Main Screen running loop
 
 
 if __name__ == "__main__":
+    # Chart rendering workers (see chart_rendering.py) are spawned processes, also when running as a frozen executable
+    multiprocessing.freeze_support()
     main()
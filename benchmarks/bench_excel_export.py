@@ -0,0 +1,79 @@
+'''
+Benchmark of the export of a Scope with Scenarios sized DataFrame (parts x Scenarios rows).
+
+1- pandas ExcelWriter (openpyxl, all cells kept in memory until the workbook is saved) - previous export
+2- bup_export.write_workbook: openpyxl write-only mode, rows streamed to disk by chunks
+3- bup_export.export_sheets in columnar formats: Parquet/Arrow IPC (with pyarrow installed) and chunked CSV
+
+Time and Python memory peak (tracemalloc, in a second run, as it slows down allocations) of each one are compared.
+
+Usage (from repository root): python benchmarks/bench_excel_export.py [rows]
+'''
+import os, sys, time, tempfile, tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import bup_export
+
+
+def build_dataframe(rows: int) -> pd.DataFrame:
+    '''
+    :param rows: Number of rows
+    :return: DataFrame with the kinds of columns of Scope with Scenarios (text, integers, costs, dates, months)
+    '''
+    rng = np.random.default_rng(0)
+    order_dates = pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 900, rows), unit='D')
+    return pd.DataFrame({
+        'PN': [f'PN{number:07d}' for number in rng.integers(0, 10**7, rows)],
+        'Ecode': rng.integers(10**7, 10**8, rows),
+        'Qty': rng.integers(1, 10, rows),
+        'SPC': rng.choice(['Expendable', 'Repairable', 'Rotable'], rows),
+        'Leadtime': rng.integers(10, 400, rows),
+        'Acq Cost': rng.gamma(1.5, 2000, rows),
+        'Scenario': rng.integers(0, 5, rows),
+        'PN Order Date': order_dates,
+        'PN Delivery Date': order_dates + pd.to_timedelta(rng.integers(30, 400, rows), unit='D'),
+        'Delivery Month': order_dates.to_period('M'),
+        'PV Efficient (US$)': rng.gamma(1.5, 2000, rows).round(2)
+    })
+
+
+def measure(function, *args) -> tuple:
+    # Time (s) and Python memory peak (MB)
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1] / 1024**2
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def pandas_export(full_path: str, df: pd.DataFrame) -> None:
+    with pd.ExcelWriter(full_path) as writer:
+        df.to_excel(writer, sheet_name='Scope with Scenarios', index=False)
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    df = build_dataframe(rows)
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        pandas_time, pandas_peak = measure(pandas_export, os.path.join(temp_folder, 'pandas.xlsx'), df)
+        streamed_time, streamed_peak = measure(bup_export.write_workbook, os.path.join(temp_folder, 'streamed.xlsx'),
+                                               [('Scope with Scenarios', df)])
+
+        print(f'Rows: {rows} | Columns: {df.shape[1]}')
+        print(f'pandas ExcelWriter:         {pandas_time:7.1f} s | memory peak {pandas_peak:8.1f} MB')
+        print(f'bup_export.write_workbook:  {streamed_time:7.1f} s | memory peak {streamed_peak:8.1f} MB')
+
+        for file_format in bup_export.get_export_formats()[1:]:
+            sheets = [('Scope with Scenarios', df)]
+            full_path = bup_export.get_export_path(os.path.join(temp_folder, file_format.replace(' ', '_')), sheets, file_format)
+            format_time, format_peak = measure(bup_export.export_sheets, full_path, sheets, file_format)
+            file_size = os.path.getsize(full_path) / 1024**2
+            print(f'{file_format + ":":27} {format_time:7.1f} s | memory peak {format_peak:8.1f} MB | {file_size:.1f} MB file')
@@ -0,0 +1,83 @@
+'''
+Import-time benchmark of the application startup (what is imported before the Main Screen is shown).
+
+The startup imports are the top-level imports of BUP_GUI.py, run in a fresh interpreter (without executing the GUI):
+1- Wall time of the startup imports (median of the runs) must be within the budget
+2- Analysis modules, deferred until a Scope file is chosen (see BUP_GUI.load_analyzer_modules()), must not be imported at startup
+The heaviest startup imports (cumulative time of "-X importtime") are listed, to find what to defer next.
+
+Usage (from repository root): python benchmarks/bench_import_time.py [--budget-ms 1500] [--runs 3] [--top 15]
+Exit code is 1 when the budget is exceeded or a deferred module is imported at startup.
+'''
+import os, sys, ast, argparse, statistics, subprocess
+
+repository_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported after a Scope file is chosen
+deferred_modules = ['pandas', 'numpy', 'matplotlib', 'mplcursors', 'tksheet', 'openpyxl', 'pyarrow', 'bup_plan_analyzer', 'chart_rendering', 'bup_export',
+                    'bup_session']
+
+
+def startup_import_statements() -> list:
+    '''
+    :return: Top-level import statements of BUP_GUI.py (source code of each one)
+    '''
+    with open(os.path.join(repository_path, 'BUP_GUI.py'), encoding='utf-8') as gui_file:
+        gui_tree = ast.parse(gui_file.read())
+    return [ast.unparse(node) for node in gui_tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def measure_imports(statements: list) -> tuple:
+    '''
+    Runs the import statements in a fresh interpreter.
+    :param statements: Import statements (source code)
+    :return: Wall time (ms) and a dict with the cumulative time (ms) of each imported module
+    '''
+    code = '\n'.join(['import time', 'start = time.perf_counter()', *statements,
+                      'print((time.perf_counter() - start) * 1000)'])
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=repository_path,
+                            capture_output=True, text=True, check=True)
+
+    # "-X importtime" lines: "import time: self [us] | cumulative | imported package"
+    modules_ms = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, module_name = line[len('import time:'):].split('|')
+            if cumulative.strip().isdigit():
+                modules_ms[module_name.strip()] = int(cumulative) / 1000
+    return float(result.stdout.strip().splitlines()[-1]), modules_ms
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Startup import-time benchmark')
+    parser.add_argument('--budget-ms', type=float, default=1500, help='Maximum wall time of the startup imports. Default: 1500')
+    parser.add_argument('--runs', type=int, default=3, help='Fresh interpreter runs (the median is compared). Default: 3')
+    parser.add_argument('--top', type=int, default=15, help='Heaviest imports listed. Default: 15')
+    args = parser.parse_args()
+
+    statements = startup_import_statements()
+    runs = [measure_imports(statements) for _ in range(args.runs)]
+    wall_ms = statistics.median(wall for wall, _ in runs)
+    modules_ms = runs[-1][1]
+
+    print('Startup imports (BUP_GUI.py):')
+    for statement in statements:
+        print(f'    {statement}')
+
+    print(f'\nHeaviest imports (cumulative, last run):')
+    for module_name, module_ms in sorted(modules_ms.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f'    {module_ms:9.1f} ms  {module_name}')
+
+    failed = False
+    imported_deferred = sorted({module_name.split('.')[0] for module_name in modules_ms} & set(deferred_modules))
+    if imported_deferred:
+        print(f'\nDeferred modules imported at startup: {", ".join(imported_deferred)}')
+        failed = True
+
+    print(f'\nStartup imports wall time: {wall_ms:.1f} ms (median of {args.runs} runs: '
+          f'{", ".join(f"{wall:.1f}" for wall, _ in runs)}) | Budget: {args.budget_ms:.0f} ms')
+    if wall_ms > args.budget_ms:
+        print('Over budget.')
+        failed = True
+
+    sys.exit(1 if failed else 0)
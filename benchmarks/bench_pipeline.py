@@ -0,0 +1,158 @@
+'''
+Benchmark of the ingestion and Scenario pipeline on synthetic inputs (see synthetic_data.py), headless (Agg backend, no Tk window):
+1- bup.read_scope_file: Scope workbook, marcsa.txt and DB_Ecode-Data.txt reading ('local' mode)
+2- bup.calculate_scenarios_curves: Scope x Scenarios combination and Efficient/Hypothetical curves
+3- bup.calculate_acqcost_curves
+4- bup.calculate_cost_avoidance_curves
+5- bup.calculate_batches (Batches of the first Scenario)
+
+Each stage is timed 'repeat' times for every Scope size and Scenarios count. Results are saved as JSON (environment, git commit,
+runs of each stage and the function_timer aggregates of the nested functions), so that runs can be compared: with --compare, the
+median of each stage is shown against a previous results file. Results are saved in benchmarks/results/ by default (ignored by git).
+Synthetic inputs are generated once for each size and seed, and reused (--data-dir).
+
+Usage (from repository root):
+    python benchmarks/bench_pipeline.py [--parts 1000 10000 100000] [--scenarios 1 5 10] [--repeat 3] [--seed 0]
+                                        [--data-dir FOLDER] [--output FILE.json] [--compare BASELINE.json]
+'''
+import os, sys, json, time, argparse, atexit, platform, subprocess, tempfile
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+repository_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repository_path)
+import bup_plan_analyzer as bup
+import bup_report
+import synthetic_data
+
+# Only the in-process aggregates are kept (no records file), and they are saved in the results instead of being dumped on exit
+bup.timing_log_path = None
+atexit.unregister(bup.dump_timing_summary)
+
+scenario_stages = ['calculate_scenarios_curves', 'calculate_acqcost_curves', 'calculate_cost_avoidance_curves', 'calculate_batches']
+
+
+def get_inputs_folder(data_path: str, parts: int, seed: int) -> str:
+    # Synthetic inputs of a Scope size, generated only if they do not exist yet
+    inputs_folder = os.path.join(data_path, f'parts_{parts}_seed_{seed}')
+    if not os.path.exists(os.path.join(inputs_folder, synthetic_data.scope_file_name)):
+        start = time.perf_counter()
+        synthetic_data.write_synthetic_inputs(inputs_folder, parts, seed=seed)
+        print(f'Synthetic inputs of {parts} parts generated in {time.perf_counter() - start:.1f} s ({inputs_folder})')
+    return inputs_folder
+
+
+def read_scope(inputs_folder: str) -> pd.DataFrame:
+    # Complementary info files are read from the working directory in 'local' mode
+    current_path = os.getcwd()
+    os.chdir(inputs_folder)
+    try:
+        return bup.read_scope_file(synthetic_data.scope_file_name, 'local')
+    finally:
+        os.chdir(current_path)
+
+
+def run_scenario_stages(bup_scope: pd.DataFrame, scenarios: list) -> dict:
+    '''
+    Runs the Scenario pipeline once, as bup_report.generate_report() does.
+    :param bup_scope: Scope read by bup.read_scope_file()
+    :param scenarios: Scenarios built by bup_report.load_scenarios()
+    :return: Time (ms) of each stage
+    '''
+    stages_ms = {}
+
+    def timed(stage: str, function, *args):
+        start = time.perf_counter()
+        result = function(*args)
+        stages_ms[stage] = (time.perf_counter() - start) * 1000
+        return result
+
+    bup_cost = (bup_scope['Acq Cost'] * bup_scope['Qty']).sum()
+    scenario_dataframes = {}
+    df_scope_with_scenarios, df_dates_eff, df_dates_hyp = timed('calculate_scenarios_curves', bup.calculate_scenarios_curves,
+                                                                bup_scope, scenarios, scenario_dataframes)
+    timed('calculate_acqcost_curves', bup.calculate_acqcost_curves, df_scope_with_scenarios, df_dates_eff, df_dates_hyp, scenario_dataframes)
+    timed('calculate_cost_avoidance_curves', bup.calculate_cost_avoidance_curves, scenario_dataframes, scenarios, df_scope_with_scenarios,
+          df_dates_eff, df_dates_hyp, bup_cost, bup.calculate_monthly_wacc(bup.default_wacc_value))
+    timed('calculate_batches', bup.calculate_batches, scenarios, df_scope_with_scenarios)
+    return stages_ms
+
+
+def stage_result(parts: int, scope_rows: int, scenarios_count, stage: str, runs_ms: list) -> dict:
+    return {'parts': parts, 'scope_rows': scope_rows, 'scenarios': scenarios_count, 'stage': stage,
+            'runs_ms': [round(run_ms, 3) for run_ms in runs_ms], 'best_ms': round(min(runs_ms), 3),
+            'median_ms': round(float(np.median(runs_ms)), 3)}
+
+
+def get_environment() -> dict:
+    # Where the results were measured (results of different machines are not comparable)
+    try:
+        git_commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=repository_path, capture_output=True, text=True,
+                                    check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        git_commit = None
+    return {'git_commit': git_commit, 'python': platform.python_version(), 'platform': platform.platform(),
+            'processor': platform.processor(), 'cpu_count': os.cpu_count(), 'numpy': np.__version__, 'pandas': pd.__version__,
+            'matplotlib_backend': matplotlib.get_backend()}
+
+
+def print_comparison(results: list, baseline_path: str) -> None:
+    # Median of each stage against the same stage (parts, Scenarios) of a previous results file
+    with open(baseline_path, encoding='utf-8') as baseline_file:
+        baseline = {(result['parts'], result['scenarios'], result['stage']): result for result in json.load(baseline_file)['results']}
+
+    print(f'\nComparison with {baseline_path} (median ms, ratio < 1 is faster):')
+    for result in results:
+        previous = baseline.get((result['parts'], result['scenarios'], result['stage']))
+        if previous is not None:
+            print(f"{result['parts']:>7} parts | {str(result['scenarios'] or '-'):>2} Scenarios | {result['stage']:<32} "
+                  f"{previous['median_ms']:>10.1f} -> {result['median_ms']:>10.1f} ({result['median_ms'] / previous['median_ms']:.2f}x)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Ingestion and Scenario pipeline benchmark on synthetic inputs.')
+    parser.add_argument('--parts', type=int, nargs='+', default=[1000, 10000, 100000], help='Scope sizes')
+    parser.add_argument('--scenarios', type=int, nargs='+', default=[1, 5, 10], help='Scenarios counts (1 to 10)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs of each stage')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed of the synthetic inputs')
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'bup_benchmark_data'), help='Synthetic inputs folder')
+    parser.add_argument('--output', default=None, help='Results file. Default: benchmarks/results/pipeline_<date_time>.json')
+    parser.add_argument('--compare', default=None, help='Previous results file')
+    args = parser.parse_args()
+
+    results = []
+    for parts in args.parts:
+        inputs_folder = get_inputs_folder(args.data_dir, parts, args.seed)
+
+        read_runs_ms = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            bup_scope = read_scope(inputs_folder)
+            read_runs_ms.append((time.perf_counter() - start) * 1000)
+        results.append(stage_result(parts, len(bup_scope), None, 'read_scope_file', read_runs_ms))
+        print(f'{parts:>7} parts | {len(bup_scope)} Scope rows | read_scope_file: {results[-1]["median_ms"]:.1f} ms')
+
+        for scenarios_count in args.scenarios:
+            scenarios = bup_report.load_scenarios(synthetic_data.write_scenarios_file(inputs_folder, scenarios_count), bup_scope)
+            stage_runs_ms = {stage: [] for stage in scenario_stages}
+            for _ in range(args.repeat):
+                for stage, stage_ms in run_scenario_stages(bup_scope, scenarios).items():
+                    stage_runs_ms[stage].append(stage_ms)
+            results.extend(stage_result(parts, len(bup_scope), scenarios_count, stage, runs_ms) for stage, runs_ms in stage_runs_ms.items())
+            print(f'{parts:>7} parts | {scenarios_count:>2} Scenarios | ' +
+                  ' | '.join(f'{stage}: {np.median(runs_ms):.1f} ms' for stage, runs_ms in stage_runs_ms.items()))
+
+    output_path = args.output or os.path.join(repository_path, 'benchmarks', 'results',
+                                              f'pipeline_{time.strftime("%Y%m%d_%H%M%S")}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as output_file:
+        json.dump({'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'environment': get_environment(),
+                   'settings': {'parts': args.parts, 'scenarios': args.scenarios, 'repeat': args.repeat, 'seed': args.seed},
+                   'results': results, 'function_timings': bup.timing_summary()}, output_file, indent=2)
+    print(f'Results saved in {output_path}')
+
+    if args.compare:
+        print_comparison(results, args.compare)
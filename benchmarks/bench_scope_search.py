@@ -0,0 +1,85 @@
+'''
+Benchmark of the Scope Sheet search (bup.search_scope_table) and range filters (bup.filter_scope_table_range) on a synthetic Scope.
+
+Each keystroke of a PN and of a Description search is timed (filter + Sheet view update), as well as the Leadtime and Acq Cost ranges
+combined with the search. Results are checked against a naive substring scan of the DataFrame.
+
+Usage (from repository root): python benchmarks/bench_scope_search.py [rows]
+'''
+import os, sys, re, time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import bup_plan_analyzer as bup
+
+description_words = ['valve', 'assy', 'bracket', 'seal', 'bolt', 'nut', 'washer', 'harness', 'sensor', 'pump', 'filter', 'duct',
+                     'panel', 'clamp', 'actuator', 'hose', 'fitting', 'gasket', 'relay', 'switch', 'lh', 'rh', 'fwd', 'aft']
+
+
+def build_scope(rows: int) -> pd.DataFrame:
+    '''
+    Synthetic Scope, with the columns of bup.read_scope_file().
+    :param rows: Number of PNs
+    :return: Scope DataFrame
+    '''
+    rng = np.random.default_rng(0)
+    words = rng.choice(description_words, size=(rows, 3))
+    return pd.DataFrame({
+        'PN': [f'{prefix}{number:07d}-{dash}' for prefix, number, dash in
+               zip(rng.choice(['AB', 'CD', 'EF', 'MS', 'NAS'], rows), rng.integers(0, 10**7, rows), rng.integers(1, 99, rows))],
+        'Ecode': rng.integers(10**7, 10**8, rows),
+        # Descriptions repeat (a few thousand different ones), as in real Scopes
+        'Description': [' '.join(row_words).upper() for row_words in words[rng.integers(0, 5000, rows) % rows]],
+        'Qty': rng.integers(1, 10, rows),
+        'SPC': rng.choice(['Expendable', 'Repairable', 'Rotable'], rows),
+        'Leadtime': rng.integers(10, 400, rows),
+        'Acq Cost': rng.gamma(1.5, 2000, rows).round(2),
+        'EIS Critical': rng.choice(['Yes', 'No'], rows)
+    })
+
+
+def time_ms(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def naive_search(bup_scope: pd.DataFrame, text: str) -> set:
+    text = text.strip().lower()
+    text_words = re.findall(r'[a-z0-9]+', text)
+    descriptions = bup_scope['Description'].str.lower()
+    description_match = np.logical_and.reduce([descriptions.str.contains(rf'\b{word}', regex=True) for word in text_words])
+    match = (bup_scope['PN'].str.lower().str.startswith(text) | bup_scope['Ecode'].astype(str).str.startswith(text) | description_match)
+    return set(np.flatnonzero(match.to_numpy()))
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    bup_scope = build_scope(rows)
+    scope_table = bup.build_scope_table(bup_scope)
+
+    print(f'Scope rows: {rows}')
+    print(f'Index build (first search):  {time_ms(bup.search_scope_table, scope_table, "x"):8.1f} ms')
+    bup.search_scope_table(scope_table, '')
+
+    worst_ms = 0
+    for search_text in [bup_scope['PN'].iloc[rows // 2], 'valve assy lh']:
+        keystrokes_ms = [time_ms(bup.search_scope_table, scope_table, search_text[:length]) for length in range(1, len(search_text) + 1)]
+        worst_ms = max(worst_ms, *keystrokes_ms)
+        assert set(scope_table['view']) == naive_search(bup_scope, search_text)
+        print(f'Typing "{search_text}": max {max(keystrokes_ms):6.1f} ms | mean {np.mean(keystrokes_ms):6.1f} ms per keystroke '
+              f'| {len(scope_table["view"])} rows')
+
+    # Ranges combined with the Description search
+    leadtime_ms = time_ms(bup.filter_scope_table_range, scope_table, bup_scope.columns.get_loc('Leadtime'), 100, 200)
+    acq_cost_ms = time_ms(bup.filter_scope_table_range, scope_table, bup_scope.columns.get_loc('Acq Cost'), None, 5000)
+    expected = naive_search(bup_scope, 'valve assy lh') & set(np.flatnonzero(bup_scope['Leadtime'].between(100, 200) & (bup_scope['Acq Cost'] <= 5000)))
+    assert set(scope_table['view']) == expected
+    worst_ms = max(worst_ms, leadtime_ms, acq_cost_ms)
+    print(f'Leadtime range: {leadtime_ms:6.1f} ms | Acq Cost range: {acq_cost_ms:6.1f} ms | {len(scope_table["view"])} rows')
+
+    clear_ms = time_ms(bup.search_scope_table, scope_table, '')
+    print(f'Search cleared: {clear_ms:6.1f} ms | {len(scope_table["view"])} rows')
+    print(f'Worst response: {max(worst_ms, clear_ms):.1f} ms')
@@ -0,0 +1,126 @@
+'''
+Synthetic input files of bup.read_scope_file(), in the formats of the real sources, so that the pipeline can be measured without the
+network databases:
+- Scope workbook (.xlsx): 'PN', 'ECODE', 'QTY', 'EIS' and 'SPC' columns (plus a description column, not read), with empty/zero
+  quantities and empty Ecodes as in real Scopes
+- marcsa.txt (SAP, '|' separated, latin encoding): 'Material(MATNR)' with some '!' marked materials and 'PrzEntrPrev.(PLIFZ)' leadtimes
+  (some empty), covering more materials than the Scope
+- DB_Ecode-Data.txt (comma separated): 'ECODE', 'ACQCOST' (decimal comma, quoted) and 'ENGDESC', with duplicated Ecodes
+- scenarios.json: Scenarios in the format of bup_report.py (the first one with Batches)
+
+Usage (from repository root): python benchmarks/synthetic_data.py <folder> [parts] [scenarios]
+'''
+import os, sys, json
+
+import numpy as np
+import pandas as pd
+
+description_words = ['VALVE', 'ASSY', 'BRACKET', 'SEAL', 'BOLT', 'NUT', 'WASHER', 'HARNESS', 'SENSOR', 'PUMP', 'FILTER', 'DUCT',
+                     'PANEL', 'CLAMP', 'ACTUATOR', 'HOSE', 'FITTING', 'GASKET', 'RELAY', 'SWITCH', 'LH', 'RH', 'FWD', 'AFT']
+
+# Input file names read by bup.read_scope_file() in 'local' mode (relative to the working directory)
+scope_file_name = 'scope.xlsx'
+marcsa_file_name = 'marcsa.txt'
+ecode_data_file_name = 'DB_Ecode-Data.txt'
+scenarios_file_name = 'scenarios.json'
+
+
+def build_scope_file_data(parts: int, rng: np.random.Generator) -> pd.DataFrame:
+    '''
+    :param parts: Number of Scope rows
+    :param rng: Random generator
+    :return: Scope workbook data (Ecodes are unique, some rows have no Ecode or no quantity and are filtered by the application)
+    '''
+    ecodes = rng.choice(np.arange(10**7, 10**7 + parts * 3), size=parts, replace=False).astype(float)
+    ecodes[rng.random(parts) < 0.01] = np.nan
+    quantities = rng.integers(1, 10, parts).astype(float)
+    quantities[rng.random(parts) < 0.02] = np.nan
+    quantities[rng.random(parts) < 0.02] = 0
+    return pd.DataFrame({
+        'PN': [f'{prefix}{number:07d}-{dash}' for prefix, number, dash in
+               zip(rng.choice(['AB', 'CD', 'EF', 'MS', 'NAS'], parts), rng.integers(0, 10**7, parts), rng.integers(1, 99, parts))],
+        'ECODE': ecodes,
+        'DESCRIPTION': [' '.join(words) for words in rng.choice(description_words, size=(parts, 3))],
+        'QTY': quantities,
+        'EIS': rng.choice(['X', None], parts, p=[0.2, 0.8]),
+        'SPC': rng.choice([1, 2, 3, 6], parts)
+    })
+
+
+def build_marcsa_data(ecodes: np.ndarray, rng: np.random.Generator) -> pd.DataFrame:
+    '''
+    :param ecodes: Ecodes of the Scope (materials not in the Scope are added, as SAP has all materials)
+    :param rng: Random generator
+    :return: marcsa.txt data (materials as text, some with '!', and leadtimes in days, some empty)
+    '''
+    scope_ecodes = ecodes[~np.isnan(ecodes)].astype(np.int64)
+    other_ecodes = np.setdiff1d(np.arange(10**7, 10**7 + len(ecodes) * 3), scope_ecodes)[:len(ecodes) * 2]
+    materials = rng.permutation(np.concatenate([scope_ecodes, other_ecodes]))
+    leadtimes = pd.array(rng.integers(10, 400, len(materials)), dtype='Int64')
+    leadtimes[rng.random(len(materials)) < 0.03] = pd.NA
+    return pd.DataFrame({
+        'Centro(WERKS)': rng.choice(['1000', '2000'], len(materials)),
+        'Material(MATNR)': [f'{material}!' if marked else str(material)
+                            for material, marked in zip(materials, rng.random(len(materials)) < 0.01)],
+        'PrzEntrPrev.(PLIFZ)': leadtimes,
+        'GrpCompr.(EKGRP)': rng.choice(['E01', 'E02', 'E03'], len(materials))
+    })
+
+
+def build_ecode_data(ecodes: np.ndarray, rng: np.random.Generator) -> pd.DataFrame:
+    '''
+    :param ecodes: Ecodes of the Scope
+    :param rng: Random generator
+    :return: DB_Ecode-Data.txt data (Acq Cost with decimal comma, about 10% of the Ecodes with a second record)
+    '''
+    scope_ecodes = ecodes[~np.isnan(ecodes)].astype(np.int64)
+    record_ecodes = np.concatenate([scope_ecodes, rng.choice(scope_ecodes, len(scope_ecodes) // 10)])
+    acq_costs = rng.gamma(1.5, 2000, len(record_ecodes)) + 1
+    return pd.DataFrame({
+        'ECODE': record_ecodes,
+        'PN': [f'PN{ecode}' for ecode in record_ecodes],
+        'ACQCOST': [f'{acq_cost:.2f}'.replace('.', ',') for acq_cost in acq_costs],
+        'ENGDESC': [' '.join(words) for words in rng.choice(description_words, size=(len(record_ecodes), 3))]
+    })
+
+
+def build_scenarios(scenarios_count: int) -> list:
+    '''
+    :param scenarios_count: Number of Scenarios
+    :return: Scenarios in the format of bup_report.py scenarios.json (the first one with Batches, dates chosen by the solver)
+    '''
+    return [{'t0': '01/03/2025', 'acft_delivery_start': '01/06/2027', 'material_delivery_start': 24 + scenario_index % 6,
+             'material_delivery_end': 30 + scenario_index % 6, 'buffer': 30 + 5 * scenario_index,
+             **({'batches_qty': 4} if scenario_index == 0 else {})} for scenario_index in range(scenarios_count)]
+
+
+def write_synthetic_inputs(folder: str, parts: int, scenarios_count: int = 1, seed: int = 0) -> None:
+    '''
+    Writes the Scope workbook, marcsa.txt, DB_Ecode-Data.txt and scenarios.json in a folder (see file names above).
+    :param folder: Destination folder (created if needed)
+    :param parts: Number of Scope rows
+    :param scenarios_count: Number of Scenarios of scenarios.json
+    :param seed: Random seed (same seed and sizes, same files)
+    '''
+    os.makedirs(folder, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    scope_data = build_scope_file_data(parts, rng)
+    scope_data.to_excel(os.path.join(folder, scope_file_name), index=False)
+    build_marcsa_data(scope_data['ECODE'].to_numpy(), rng).to_csv(os.path.join(folder, marcsa_file_name), sep='|', index=False,
+                                                                   encoding='latin')
+    build_ecode_data(scope_data['ECODE'].to_numpy(), rng).to_csv(os.path.join(folder, ecode_data_file_name), index=False)
+    write_scenarios_file(folder, scenarios_count)
+
+
+def write_scenarios_file(folder: str, scenarios_count: int) -> str:
+    # scenarios.json with the given number of Scenarios. Returns its path
+    scenarios_path = os.path.join(folder, scenarios_file_name)
+    with open(scenarios_path, 'w', encoding='utf-8') as scenarios_file:
+        json.dump(build_scenarios(scenarios_count), scenarios_file, indent=2)
+    return scenarios_path
+
+
+if __name__ == '__main__':
+    write_synthetic_inputs(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 10_000, int(sys.argv[3]) if len(sys.argv) > 3 else 1)
+    print(f'Synthetic inputs written in {os.path.abspath(sys.argv[1])}')
@@ -0,0 +1,212 @@
+'''
+Export engine: application data written to Excel workbooks by streaming rows (openpyxl write-only mode, each row is written to
+disk when appended, so memory does not grow with the number of rows, as it does with pandas default ExcelWriter).
+All Scenarios DataFrames of the same kind are concatenated at once, in a single sheet identified by the Scenario name.
+
+For outputs too big for Excel, the same sheets are exported in columnar formats (Parquet and Arrow IPC, with pyarrow installed) or
+CSV, one file per sheet, with typed date columns (months/dates written as text in the application are converted back to dates).
+'''
+# Data Wrangling
+import pandas as pd
+
+# System
+import os, re
+try:
+    import pyarrow as pa  # Optional: Parquet and Arrow IPC export formats
+    import pyarrow.parquet as pq
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
+
+# Excel
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import KNOWN_TYPES
+from openpyxl.styles import Font
+
+import bup_plan_analyzer as bup  # Source file with program functions
+
+# Rows converted from DataFrame columns at a time (Python objects of a chunk only)
+export_chunk_rows = 20000
+
+# Excel sheet limit (header included). Bigger DataFrames continue in another sheet: 'Sheet (2)', 'Sheet (3)'...
+excel_max_rows = 1048576
+
+# Export formats: file extension of each one. Parquet and Arrow IPC are only available with pyarrow (see get_export_formats())
+export_formats = {'Excel': '.xlsx', 'Parquet': '.parquet', 'Arrow IPC': '.arrow', 'CSV': '.csv'}
+
+# Dates written as text in the application DataFrames (ex: 'Date' of the curves in '%m/%Y', 'Batch Date' in '%d/%m/%Y')
+text_date_formats = [(re.compile(r'^\d{2}/\d{4}$'), '%m/%Y'), (re.compile(r'^\d{2}/\d{2}/\d{4}$'), '%d/%m/%Y')]
+
+# Sheets of the consolidated workbook with all Scenarios DataFrames (position in scenario_dataframes lists, sheet name)
+scenario_sheets = [(0, 'Efficient Chart Data'), (1, 'Hypothetical Chart Data'), (2, 'Efficient Acq Cost Data'),
+                   (3, 'Hypothetical Acq Cost Data'), (4, 'Cost Avoidance Data')]
+
+
+def consolidate_scenarios(scenario_dataframes: dict, df_index: int) -> pd.DataFrame:
+    '''
+    :param scenario_dataframes: DataFrames of each Scenario (see bup.scenario_dataframes)
+    :param df_index: Position of the DataFrame in each Scenario list (0: Efficient parts, 1: Hypothetical parts, 2: Efficient Acq Cost,
+    3: Hypothetical Acq Cost, 4: Cost Avoidance)
+    :return: All Scenarios DataFrames of the same kind in a single DataFrame (one concat), with 'Scenario Name' column
+    '''
+    return pd.concat([scenario_df_list[df_index].assign(**{'Scenario Name': scenario_name})
+                      for scenario_name, scenario_df_list in scenario_dataframes.items() if len(scenario_df_list) > df_index],
+                     ignore_index=True)
+
+
+def column_cell_values(column: pd.Series) -> list:
+    # Values that openpyxl writes (Python objects, empty cells for NaN/NaT). As pandas ExcelWriter does, other types (ex: Period) as text
+    cell_values = column.astype(object).where(column.notna(), None).tolist()
+    if pd.api.types.is_numeric_dtype(column) or pd.api.types.is_datetime64_any_dtype(column):
+        return cell_values
+    return [value if isinstance(value, KNOWN_TYPES) else str(value) for value in cell_values]
+
+
+def append_dataframe_rows(worksheet, df: pd.DataFrame, start: int, end: int) -> None:
+    # Rows of the DataFrame from 'start' to 'end', converted by column in chunks
+    for chunk_start in range(start, end, export_chunk_rows):
+        chunk = df.iloc[chunk_start:min(chunk_start + export_chunk_rows, end)]
+        for row in zip(*[column_cell_values(chunk[column]) for column in chunk.columns]):
+            worksheet.append(row)
+
+
+def write_workbook(full_path: str, sheets: list) -> None:
+    '''
+    Writes DataFrames as sheets of a single workbook, streaming rows (constant memory).
+    :param full_path: Workbook full path (.xlsx)
+    :param sheets: List of (sheet name, DataFrame), in workbook order
+    '''
+    workbook = Workbook(write_only=True)
+    header_font = Font(bold=True)
+
+    for sheet_name, df in sheets:
+        # DataFrames bigger than the Excel sheet limit are split in sheets
+        sheet_rows = excel_max_rows - 1
+        for sheet_number, start in enumerate(range(0, max(len(df), 1), sheet_rows), start=1):
+            worksheet = workbook.create_sheet(sheet_name if sheet_number == 1 else f'{sheet_name} ({sheet_number})')
+            header = []
+            for column in df.columns:
+                header_cell = WriteOnlyCell(worksheet, value=str(column))
+                header_cell.font = header_font
+                header.append(header_cell)
+            worksheet.append(header)
+            append_dataframe_rows(worksheet, df, start, min(start + sheet_rows, len(df)))
+
+    workbook.save(full_path)
+
+
+def application_sheets(bup_scope: pd.DataFrame, df_scope_with_scenarios, scenario_dataframes: dict, df_batches_full_info) -> list:
+    '''
+    All application data, as sheets of a single workbook (only what was already calculated).
+    :param bup_scope: DataFrame with Scope and additional information
+    :param df_scope_with_scenarios: Scope with Scenarios information (None before the first Scenario)
+    :param scenario_dataframes: DataFrames of each Scenario (see bup.scenario_dataframes)
+    :param df_batches_full_info: Parts with Batches information (empty/None without Batches)
+    :return: List of (sheet name, DataFrame)
+    '''
+    sheets = [('Scope', bup_scope)]
+
+    if isinstance(df_scope_with_scenarios, pd.DataFrame):
+        sheets.append(('Scope with Scenarios', df_scope_with_scenarios))
+        # PN Net Present Value (Efficient x Hypothetical purchase) aggregated by SPC and EIS Critical
+        sheets.append(('NPV by SPC', bup.aggregate_parts_npv(df_scope_with_scenarios, 'SPC')))
+        sheets.append(('NPV by EIS Critical', bup.aggregate_parts_npv(df_scope_with_scenarios, 'EIS Critical')))
+
+    if scenario_dataframes:
+        for df_index, sheet_name in scenario_sheets:
+            if any(len(scenario_df_list) > df_index for scenario_df_list in scenario_dataframes.values()):
+                sheets.append((sheet_name, consolidate_scenarios(scenario_dataframes, df_index)))
+
+    if isinstance(df_batches_full_info, pd.DataFrame) and not df_batches_full_info.empty:
+        sheets.append(('Batches Info', df_batches_full_info))
+
+    return sheets
+
+
+def get_export_formats() -> list:
+    # Export formats available in this installation
+    return [file_format for file_format in export_formats if pa is not None or file_format in ['Excel', 'CSV']]
+
+
+def typed_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    '''
+    Columns typed for columnar formats: months/dates as text and Periods converted to dates, and text columns with other values
+    (ex: PNs read as numbers) as text only.
+    :param df: DataFrame to be exported
+    :return: DataFrame with typed columns (columns that did not change are not copied)
+    '''
+    typed_columns = {}
+    for column in df.columns:
+        column_values = df[column]
+        if isinstance(column_values.dtype, pd.PeriodDtype):
+            typed_columns[column] = column_values.dt.to_timestamp()
+        elif column_values.dtype == object:
+            filled_values = column_values.dropna()
+            if filled_values.empty:
+                continue
+            first_value = filled_values.iloc[0]
+            date_format = next((date_format for pattern, date_format in text_date_formats
+                                if isinstance(first_value, str) and pattern.match(first_value)), None)
+            if date_format is not None:
+                dates = pd.to_datetime(column_values, format=date_format, errors='coerce')
+                # Only if all values are dates of the format
+                if dates.notna().sum() == len(filled_values):
+                    typed_columns[column] = dates
+                    continue
+            if not filled_values.map(type).eq(str).all():
+                typed_columns[column] = column_values.where(column_values.isna(), column_values.astype(str))
+
+    return df.assign(**typed_columns) if typed_columns else df
+
+
+def write_columnar_file(full_path: str, df: pd.DataFrame, file_format: str) -> None:
+    '''
+    Writes a DataFrame as a Parquet, Arrow IPC or CSV file (typed columns, see typed_dataframe()).
+    :param full_path: File full path
+    :param df: DataFrame to be exported
+    :param file_format: 'Parquet', 'Arrow IPC' or 'CSV'
+    '''
+    df = typed_dataframe(df)
+    if file_format == 'CSV':
+        # Written by chunks of rows, dates in ISO format
+        df.to_csv(full_path, index=False, chunksize=export_chunk_rows, date_format='%Y-%m-%d')
+        return
+
+    if pa is None:
+        raise RuntimeError(f'{file_format} export requires pyarrow (pip install pyarrow).')
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if file_format == 'Parquet':
+        pq.write_table(table, full_path, row_group_size=export_chunk_rows * 5)
+    else:
+        feather.write_feather(table, full_path)
+
+
+def get_export_path(base_path: str, sheets: list, file_format: str) -> str:
+    '''
+    :param base_path: Full path without extension (ex: Downloads folder and 'BUP_Scope_Data')
+    :param sheets: List of (sheet name, DataFrame)
+    :param file_format: One of export_formats
+    :return: Path exported by export_sheets(): a workbook for Excel, a file for a single sheet in columnar formats, or a folder
+    '''
+    if file_format != 'Excel' and len(sheets) > 1:
+        return base_path
+    return base_path + export_formats[file_format]
+
+
+def export_sheets(full_path: str, sheets: list, file_format: str) -> None:
+    '''
+    Exports sheets in the chosen format: a workbook for Excel, or one file per sheet for columnar formats (in a folder, when there
+    are more than one sheet).
+    :param full_path: Path given by get_export_path() (or a temporary path, renamed to it once written)
+    :param sheets: List of (sheet name, DataFrame)
+    :param file_format: One of export_formats
+    '''
+    if file_format == 'Excel':
+        write_workbook(full_path, sheets)
+    elif len(sheets) == 1:
+        write_columnar_file(full_path, sheets[0][1], file_format)
+    else:
+        os.makedirs(full_path, exist_ok=True)
+        for sheet_name, df in sheets:
+            write_columnar_file(os.path.join(full_path, sheet_name + export_formats[file_format]), df, file_format)
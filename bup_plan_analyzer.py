@@ -6,21 +6,31 @@ from datetime import datetime
 # Data Viz
 import matplotlib.pyplot as plt
 from matplotlib.ticker import FuncFormatter
-from matplotlib.dates import DateFormatter
-import matplotlib.lines as mlines
+from matplotlib.dates import DateFormatter, MonthLocator
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import mplcursors as mpc
 
 # System
-import warnings, time, logging
+import warnings, time, logging, threading, multiprocessing, queue, re, os, shutil, json, atexit, functools, itertools, collections, sys
+from types import SimpleNamespace
+try:
+    import psutil  # Optional: only used to log process memory (RSS)
+except ImportError:
+    psutil = None
+try:
+    import resource  # Stdlib fallback of psutil (POSIX only): peak process memory
+except ImportError:
+    resource = None
 
 # Extras
-from PIL import Image
+from PIL import Image, ImageTk
 from io import BytesIO
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
 
+import chart_rendering  # Off-screen rendering of per Scenario charts in worker processes
+
 
 warnings.filterwarnings("ignore")
 
@@ -49,43 +59,570 @@ scenarios_list = []
 t0_previous_value, hyp_t0_previous_value, acft_delivery_start_previous_value, material_delivery_start_previous_value\
     , material_delivery_end_previous_value = None, None, None, None, None
 
-# Defining global variables that will store Efficient and Hypothetical chart Images when running internal function
+# Defining global variables that will store Efficient and Hypothetical chart Figures when running internal function (rasterized only on "Save Image")
 img_eff_chart, img_hyp_chart = None, None
 
 # Defining global variables that will store pandas DataFrames that will be exported in main file
 # Creating also a dictionary to store scenario DataFrames
 df_scope_with_scenarios, scenario_dataframes = None, {}
 
-# Global variables to store FigureCanvasTkAgg objects to be toggled in SwitchButton. Changing Build-Up curves from Parts/AcqCost and also Cost Avoidance
+# Global variables to store FigureCanvasTkAgg objects to be toggled in SwitchButton. Changing Build-Up curves from Parts/AcqCost and also Cost Avoidance.
+# Acq Cost and Cost Avoidance lists store the Canvas keys of each Scenario (see get_canvas())
 canvas_eff, canvas_hyp, canvas_list_acqcost_eff, canvas_list_acqcost_hyp, canvas_list_cost_avoidance = None, None, [], [], []
 
+# Persistent Efficient/Hypothetical Build-Up charts (figure, Canvas and artists of each Scenario), by chart window.
+# Adding a Scenario only appends its artists and updates the existing ones (see get_buildup_chart())
+buildup_charts = {}
+
+# Lazy Canvas registry. Charts are registered with a builder function (that creates and draws the Canvas) and are only
+# built the first time they are shown. Built Canvas are cached in canvas_registry for reuse (ordered from least to most recently shown)
+canvas_builders, canvas_registry = {}, {}
+# Charts rendered by the workers: interval (ms) in which a pending render is checked, and time (ms) the mouse must rest over a chart
+# image before its interactive (hover) Canvas is built (see build_raster_canvas())
+render_poll_interval = 50
+interactive_hover_delay = 350
+# Maximum number of built Canvas kept alive. Least recently shown ones (not on screen) are destroyed and rebuilt on demand
+canvas_budget = 16
+# Function that selects the Scenario shown on Cost Avoidance screen (assigned by generate_cost_avoidance_screen())
+select_cost_avoidance_scenario = None
+
+# Scenario creation jobs (see submit_scenario_job()). Curves are calculated by a worker thread, one job at a time, and each stage
+# result (charts) is shown by the Tk thread as soon as it is ready, polling the updates queue with after()
+scenario_jobs = queue.Queue()
+scenario_job_updates = queue.Queue()
+scenario_worker = None
+# Jobs submitted and not yet shown. Closing the Scope window starts a new jobs generation, and pending jobs are discarded
+scenario_jobs_pending = 0
+scenario_jobs_generation = 0
+# Progress panel of the Scope window (frame, label and progress bar)
+scenario_progress = None
+# Results of the last Scenario job shown (Scenarios, curves, Cost Avoidance and Batches), saved in session files (see bup_session.py)
+scenario_results = None
+session_result_keys = ['scenario_dataframes', 'df_scope_with_scenarios', 'cost_avoidance', 'batches']
+# Export jobs (see submit_export_job()). Files are written by a writer thread, one at a time, in a temporary path renamed when done,
+# and the Tk thread shows each result in the notifications area of the window, polling the results queue with after()
+export_jobs = queue.Queue()
+export_job_results = queue.Queue()
+export_writer = None
+export_jobs_pending = 0
+# Notifications area (frame) of each window, by window name
+notification_areas = {}
 # Global TabView from batcharts, so as to be accessed in BUP_GUI, insertind Export buttons
 tbv_batch_charts = None
 # Global Batch spreadsheet to be exported by export_data() func in BUP_GUI
 df_batches_full_info = pd.DataFrame()
+# Precomputed Procurement Efficiency sensitivity (Cost Avoidance slider) for each Scenario
+efficiency_savings_curves = {}
+# WACC x Procurement Efficiency Savings surface (all Scenarios), calculated on demand by get_savings_surface()
+savings_surface = None
+sensitivity_wacc_values = np.round(np.linspace(1, 20, 100), 2)
+# Procurement Efficiency changes (%) of the surface and of the Cost Avoidance slider: steps of exactly 1%, with 0% (current Procurement Length)
+sensitivity_efficiency_values = np.linspace(-50, 50, 101)
+
+# Profiling instrumentation (see function_timer()). Each timed call or job stage is a span, written as a JSON record in timing_log_path
+# (with its parent span, so that nested calls can be followed), and its duration is aggregated by span name for the summary dumped on exit:
+# running count, total and max, and the last timing_samples_max durations for p50/p95 (fixed memory in long sessions)
+timing_log_path = 'execution_timing.jsonl'
+timing_summary_path = 'execution_timing_summary.json'
+function_timings = {}
+timing_samples_max = 1024
+timing_lock = threading.Lock()
+timing_log_file = None
+timing_span_ids = itertools.count(1)
+# Open spans of each thread (innermost last)
+timing_stacks = threading.local()
+
+# WACC (% in US$). Mock 07/10/24 as analyzed in cost of debt proportion. Cost of equity are 13,41% as beta for ERJ is 1.54, 10-Year Tresury rates are 4.1% and 6% ERP.
+# Equity to Debt ratio is 63/37% so full WACC, considering equity, would be higher as Cost of Equity considers Equity Risk Premium
+default_wacc_value = 5.42
 
 # Log Configs
-open('execution_info.log', 'w').close()  # Clean log file before system execution
 log_format = "%(asctime)s: %(levelname)s: %(message)s"
-logging.basicConfig(level=logging.INFO,
-                    filename='execution_info.log',
-                    format=log_format)
+# Chart rendering workers import this module again when spawned, and must not clean the log file of the application
+if multiprocessing.current_process().name == 'MainProcess':
+    open('execution_info.log', 'w').close()  # Clean log file before system execution
+    logging.basicConfig(level=logging.INFO,
+                        filename='execution_info.log',
+                        format=log_format)
+else:
+    # Workers only keep their aggregates: the records file belongs to the application process
+    timing_log_path = None
 
 # Setting matplotlib log level higher in order to ignore INFO logs on file
 plt.set_loglevel('WARNING')
 
 
-# Decorator function that calculates how long each function of the system takes to execute
+def start_span(name: str, label: str = None, parent: int = None) -> dict:
+    '''
+    Opens a timing span (not entered in the thread spans: see enter_span() for nested calls).
+    :param name: Span name, by which durations are aggregated (ex: function name)
+    :param label: Optional detail of the record (ex: Scenario name)
+    :param parent: Parent span id. Default: innermost span open in this thread
+    :return: Span dict, closed by finish_span()
+    '''
+    stack = getattr(timing_stacks, 'spans', None)
+    if parent is None and stack:
+        parent = stack[-1]['id']
+    return {'id': next(timing_span_ids), 'parent': parent, 'name': name, 'label': label, 'thread': threading.current_thread().name,
+            'start': time.time(), 'start_ns': time.perf_counter_ns()}
+
+
+def enter_span(name: str, label: str = None, parent: int = None) -> dict:
+    # Opens a span as the innermost one of this thread, so that spans opened until it is finished are nested in it
+    span = start_span(name, label, parent)
+    stack = getattr(timing_stacks, 'spans', None)
+    if stack is None:
+        stack = timing_stacks.spans = []
+    stack.append(span)
+    return span
+
+
+def finish_span(span: dict, error: str = None) -> None:
+    '''
+    Closes a span: its duration is added to the aggregates and its record is written.
+    :param span: Span dict returned by start_span()/enter_span()
+    :param error: Exception type name, if the span failed
+    '''
+    global timing_log_file
+
+    duration_ns = time.perf_counter_ns() - span['start_ns']
+    stack = getattr(timing_stacks, 'spans', None)
+    if stack and stack[-1] is span:
+        stack.pop()
+
+    with timing_lock:
+        aggregate = function_timings.get(span['name'])
+        if aggregate is None:
+            aggregate = function_timings[span['name']] = {'count': 0, 'total_ns': 0, 'max_ns': 0,
+                                                          'samples_ns': collections.deque(maxlen=timing_samples_max)}
+        aggregate['count'] += 1
+        aggregate['total_ns'] += duration_ns
+        aggregate['max_ns'] = max(aggregate['max_ns'], duration_ns)
+        aggregate['samples_ns'].append(duration_ns)
+        if timing_log_path is None:
+            return
+        if timing_log_file is None:
+            # Opened (and cleaned) on the first record, so that importing this module does not touch the records of another execution.
+            # Line buffered: records are kept if the application crashes
+            timing_log_file = open(timing_log_path, 'w', buffering=1)
+        timing_log_file.write(json.dumps({'span': span['id'], 'parent': span['parent'], 'name': span['name'], 'label': span['label'],
+                                          'thread': span['thread'], 'start': round(span['start'], 6),
+                                          'duration_ms': round(duration_ns / 1e6, 3), 'error': error}) + '\n')
+
+
+# Decorator function that calculates how long each function of the system takes to execute (nested calls are child spans)
 def function_timer(func):
-    def wrapper(*args):
-        start_time = time.time()
-        result = func(*args)
-        exec_time = time.time() - start_time
-        logging.info(f"Function '{func.__name__}' took {round(exec_time, 2)} seconds to run.")
+    # Nested functions are named by their enclosing function, ex: 'create_scenario.get_entry_values'
+    span_name = func.__qualname__.replace('.<locals>', '')
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        span = enter_span(span_name)
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as ex:
+            finish_span(span, type(ex).__name__)
+            raise
+        finish_span(span)
         return result
     return wrapper
 
 
+def timing_summary() -> list:
+    '''
+    :return: Aggregates of each span name (count, total, p50, p95 and max, in ms), from the most to the least total time.
+    p50/p95 are taken from the last timing_samples_max durations of each name
+    '''
+    with timing_lock:
+        timings = {name: (aggregate['count'], aggregate['total_ns'], aggregate['max_ns'], np.array(aggregate['samples_ns']))
+                   for name, aggregate in function_timings.items()}
+    summary = [{'name': name, 'count': count, 'total_ms': round(total_ns / 1e6, 3),
+                'p50_ms': round(float(np.percentile(samples_ns, 50)) / 1e6, 3), 'p95_ms': round(float(np.percentile(samples_ns, 95)) / 1e6, 3),
+                'max_ms': round(max_ns / 1e6, 3)} for name, (count, total_ns, max_ns, samples_ns) in timings.items()]
+    return sorted(summary, key=lambda aggregate: aggregate['total_ms'], reverse=True)
+
+
+def dump_timing_summary() -> None:
+    # On exit: timing aggregates saved in timing_summary_path and logged in execution_info.log
+    summary = timing_summary()
+    if not summary:
+        return
+    with open(timing_summary_path, 'w') as summary_file:
+        json.dump(summary, summary_file, indent=2)
+    logging.info('Timing summary (ms):\n' + '\n'.join(f"{aggregate['name']}: count {aggregate['count']}, total {aggregate['total_ms']}, "
+                                                          f"p50 {aggregate['p50_ms']}, p95 {aggregate['p95_ms']}, max {aggregate['max_ms']}"
+                                                          for aggregate in summary))
+
+
+if timing_log_path is not None:
+    atexit.register(dump_timing_summary)
+
+
+def register_canvas(canvas_key: str, builder) -> None:
+    '''
+    Registers the function that builds a chart Canvas, without building it.
+    :param canvas_key: Chart identifier, ex: 'acqcost_eff:Scenario_0'
+    :param builder: Function with no arguments that creates, draws and returns the chart Canvas
+    '''
+    canvas_builders[canvas_key] = builder
+    # A Canvas built by a previous builder is outdated
+    release_canvas(canvas_key)
+
+
+def get_canvas(canvas_key: str):
+    # Returns the chart Canvas of the key, building it only in the first time it is requested
+    if canvas_key in canvas_registry:
+        # Moving it to the end (most recently shown)
+        canvas_registry[canvas_key] = canvas_registry.pop(canvas_key)
+    else:
+        canvas_registry[canvas_key] = canvas_builders[canvas_key]()
+        enforce_canvas_budget()
+        log_figures_memory()
+    return canvas_registry[canvas_key]
+
+
+def hide_canvas(canvas_key: str) -> None:
+    # Removes a Canvas from the screen, if it is built (a released Canvas is not built again only to be hidden)
+    if canvas_key in canvas_registry:
+        canvas_registry[canvas_key].get_tk_widget().place_forget()
+
+
+def release_canvas(canvas_key: str) -> None:
+    # Destroys the Canvas widget and closes its figure. The builder is kept, so that it can be built again
+    canvas = canvas_registry.pop(canvas_key, None)
+    if canvas is not None:
+        canvas.get_tk_widget().destroy()
+        # Raster charts (see build_raster_canvas()) have no figure
+        if canvas.figure is not None:
+            plt.close(canvas.figure)
+
+
+def build_raster_canvas(canvas_key: str, master, render_future, interactive_builder, hover: bool = True):
+    '''
+    Shows a chart rendered by the worker processes (see chart_rendering) as a static image. Nothing waits for the workers on the Tk thread:
+    a placeholder is shown and the image replaces it as soon as the render is done (polled with after()).
+    Charts with hover have their interactive Canvas built only when the mouse rests over the image (moving across it does not redraw the
+    chart on the Tk thread), replacing it in canvas_registry at the same place.
+    :param canvas_key: Chart identifier in canvas_registry
+    :param master: Frame in which the chart will be displayed
+    :param render_future: Future of chart_rendering.submit_chart()
+    :param interactive_builder: Function with no arguments that creates, draws and returns the interactive chart Canvas. Also used if the
+    workers could not render the chart
+    :param hover: If the interactive chart has hover. Otherwise, the image is kept
+    :return: Object with get_tk_widget() and figure (None), as a Canvas
+    '''
+    if render_future.done() and render_future.exception() is not None:
+        logging.warning(f"Chart '{canvas_key}' could not be rendered by workers ({render_future.exception()}). Building it on screen.")
+        return interactive_builder()
+
+    lbl_chart = tk.Label(master, text='Rendering chart...', borderwidth=0, highlightthickness=0, background='#cfcfcf',
+                         font=('open sans', 10))
+    raster_canvas = SimpleNamespace(figure=None, get_tk_widget=lambda: lbl_chart)
+    hover_job = {'id': None}
+
+    def is_shown() -> bool:
+        # The image was not released (nor replaced) meanwhile
+        return canvas_registry.get(canvas_key) is raster_canvas and lbl_chart.winfo_exists()
+
+    def replace_with_interactive() -> None:
+        place_info = lbl_chart.place_info()
+        canvas_registry[canvas_key] = interactive_builder()
+        if place_info:
+            canvas_registry[canvas_key].get_tk_widget().place(relx=place_info['relx'], rely=place_info['rely'],
+                                                              anchor=place_info['anchor'])
+        lbl_chart.destroy()
+        log_figures_memory()
+
+    def show_rendered_chart() -> None:
+        if not lbl_chart.winfo_exists():
+            return
+        if not render_future.done():
+            lbl_chart.after(render_poll_interval, show_rendered_chart)
+            return
+        try:
+            width, height, rgba_bytes = render_future.result()
+        except Exception as ex:
+            logging.warning(f"Chart '{canvas_key}' could not be rendered by workers ({ex}). Building it on screen.")
+            if is_shown():
+                replace_with_interactive()
+            return
+
+        # Transparent chart over Canvas background color
+        chart_image = Image.alpha_composite(Image.new('RGBA', (width, height), '#cfcfcf'),
+                                            Image.frombuffer('RGBA', (width, height), rgba_bytes, 'raw', 'RGBA', 0, 1))
+        photo_image = ImageTk.PhotoImage(chart_image, master=master)
+        lbl_chart.configure(image=photo_image, text='')
+        lbl_chart.image = photo_image  # Keeping a reference, otherwise the image is garbage collected
+        if hover:
+            lbl_chart.bind('<Motion>', schedule_interactive)
+            lbl_chart.bind('<Leave>', cancel_interactive)
+
+    def schedule_interactive(_) -> None:
+        # The interactive chart is built once the mouse stops over the image for interactive_hover_delay
+        cancel_interactive(None)
+        hover_job['id'] = lbl_chart.after(interactive_hover_delay, upgrade_to_interactive)
+
+    def cancel_interactive(_) -> None:
+        if hover_job['id'] is not None:
+            lbl_chart.after_cancel(hover_job['id'])
+            hover_job['id'] = None
+
+    def upgrade_to_interactive() -> None:
+        hover_job['id'] = None
+        if is_shown():
+            replace_with_interactive()
+
+    show_rendered_chart()
+
+    return raster_canvas
+
+
+def enforce_canvas_budget() -> None:
+    # Releasing least recently shown Canvas while over budget. Canvas on screen (placed/packed) are kept
+    for canvas_key in list(canvas_registry)[:-1]:
+        if len(canvas_registry) <= canvas_budget:
+            break
+        canvas_widget = canvas_registry[canvas_key].get_tk_widget()
+        if not canvas_widget.winfo_exists() or canvas_widget.winfo_manager() == '':
+            release_canvas(canvas_key)
+
+
+def release_all_figures() -> None:
+    '''
+    Releases every chart of a closed Scope window: registered Canvas, persistent Build-Up charts and any remaining figure.
+    '''
+    global tbv_batch_charts
+
+    for canvas_key in list(canvas_registry):
+        release_canvas(canvas_key)
+    canvas_builders.clear()
+    canvas_list_acqcost_eff.clear()
+    canvas_list_acqcost_hyp.clear()
+    canvas_list_cost_avoidance.clear()
+
+    for buildup_chart in buildup_charts.values():
+        buildup_chart['canvas'].get_tk_widget().destroy()
+    buildup_charts.clear()
+    tbv_batch_charts = None
+    cancel_scenario_jobs()
+
+    plt.close('all')
+    log_figures_memory()
+
+
+def log_figures_memory() -> None:
+    # Logging live matplotlib figures, built Canvas and process memory (RSS), so that leaks are visible in execution_info.log
+    if psutil is not None:
+        rss = f'{psutil.Process().memory_info().rss / 1024 ** 2:.1f} MB'
+    elif resource is not None:
+        # Without psutil, only the peak RSS is available (ru_maxrss is in KB on Linux and in bytes on macOS)
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        rss = f'{max_rss / 1024 ** (2 if sys.platform == "darwin" else 1):.1f} MB (peak)'
+    else:
+        rss = 'n/a (psutil not installed)'
+    logging.info(f"Live figures: {len(plt.get_fignums())}. Built Canvas: {len(canvas_registry)}/{canvas_budget}. RSS: {rss}. "
+                 f"{chart_rendering.get_chart_cache_stats()}")
+
+
+def connect_hover_annotation(canvas: FigureCanvasTkAgg, ax, find_target) -> None:
+    '''
+    Hover tooltip drawn with blitting: on mouse move, only the annotation is drawn over a copy of the chart saved after each full draw
+    (the chart itself is not redrawn).
+    :param canvas: Chart Canvas
+    :param ax: Axes in which the annotation is shown
+    :param find_target: Function (mouse event) -> (x, y, text) of the hovered item, in data coordinates, or None
+    '''
+    annotation = ax.annotate('', xy=(0, 0), xytext=(12, 12), textcoords='offset points', fontsize=8, annotation_clip=False,
+                             bbox=dict(boxstyle='round', fc='white', alpha=0.9), arrowprops=dict(arrowstyle='->'),
+                             animated=True, visible=False)
+    hover_state = {'background': None, 'target': None}
+
+    def on_draw(event):
+        # Full draws (first show, resize, zoom/pan) invalidate the saved chart
+        hover_state['background'] = canvas.copy_from_bbox(canvas.figure.bbox)
+        hover_state['target'] = None
+        annotation.set_visible(False)
+
+    def on_move(event):
+        target = find_target(event) if event.inaxes is ax else None
+        if hover_state['background'] is None or target == hover_state['target']:
+            return
+        hover_state['target'] = target
+
+        canvas.restore_region(hover_state['background'])
+        annotation.set_visible(target is not None)
+        if target is not None:
+            x, y, text = target
+            annotation.xy = (x, y)
+            annotation.set_text(text)
+            # Tooltip towards the center of the chart, so that it is not cut at the edges
+            right_side = event.x > ax.bbox.x0 + ax.bbox.width * 0.6
+            upper_side = event.y > ax.bbox.y0 + ax.bbox.height * 0.6
+            annotation.set_position((-12 if right_side else 12, -12 if upper_side else 12))
+            annotation.set_horizontalalignment('right' if right_side else 'left')
+            annotation.set_verticalalignment('top' if upper_side else 'bottom')
+            ax.draw_artist(annotation)
+        canvas.blit(canvas.figure.bbox)
+
+    canvas.mpl_connect('draw_event', on_draw)
+    canvas.mpl_connect('motion_notify_event', on_move)
+
+
+def build_scatter_hover_index(canvas: FigureCanvasTkAgg, ax, x_values: np.ndarray, y_values: np.ndarray, cell_size: int = 8):
+    '''
+    Nearest point search for large scatters. Points are bucketed by screen position in a grid of cell_size pixels, so that each
+    mouse move checks only the points of the 3x3 cells around the cursor. The grid is rebuilt after each full draw (resize, zoom).
+    :param canvas: Chart Canvas
+    :param ax: Scatter Axes
+    :param x_values: Points x (data coordinates)
+    :param y_values: Points y (data coordinates)
+    :param cell_size: Grid cell size and hover radius, in pixels
+    :return: Function (mouse event) -> position of the nearest point in x_values/y_values, or None if no point is close to the cursor
+    '''
+    data_points = np.column_stack([x_values, y_values]).astype(float)
+    grid = {}
+
+    def build_grid():
+        screen_points = ax.transData.transform(data_points)
+        valid_positions = np.flatnonzero(np.isfinite(screen_points).all(axis=1))
+        cells = np.floor(screen_points[valid_positions] / cell_size).astype(np.int64)
+        # Cells as a single sortable key, points sorted by key, with the first position of each cell
+        grid['origin'] = cells.min(axis=0) if len(cells) else np.zeros(2, dtype=np.int64)
+        grid['stride'] = int(cells[:, 1].max() - grid['origin'][1] + 3) if len(cells) else 1
+        cell_keys = (cells[:, 0] - grid['origin'][0]) * grid['stride'] + (cells[:, 1] - grid['origin'][1])
+        order = np.argsort(cell_keys, kind='stable')
+        grid['keys'], grid['starts'], grid['counts'] = np.unique(cell_keys[order], return_index=True, return_counts=True)
+        grid['positions'] = valid_positions[order]
+        grid['screen_points'] = screen_points
+
+    def find_point(event):
+        if not grid:
+            build_grid()
+        cell_x, cell_y = np.floor(np.array([event.x, event.y]) / cell_size).astype(np.int64) - grid['origin']
+        # Candidate points of the 3x3 cells around the cursor
+        neighbor_keys = np.array([(cell_x + dx) * grid['stride'] + (cell_y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                                  if 0 <= cell_y + dy < grid['stride']])
+        key_positions = np.searchsorted(grid['keys'], neighbor_keys)
+        found = key_positions < len(grid['keys'])
+        found[found] = grid['keys'][key_positions[found]] == neighbor_keys[found]
+        if not found.any():
+            return None
+        candidates = np.concatenate([grid['positions'][grid['starts'][key]:grid['starts'][key] + grid['counts'][key]]
+                                     for key in key_positions[found]])
+        distances = np.hypot(*(grid['screen_points'][candidates] - [event.x, event.y]).T)
+        nearest = distances.argmin()
+        return int(candidates[nearest]) if distances[nearest] <= cell_size else None
+
+    # Screen positions change with resize/zoom
+    canvas.mpl_connect('draw_event', lambda event: grid.clear())
+
+    return find_point
+
+
+def series_hover_target(ax, line_series, bar_series, hover_radius: int = 10):
+    '''
+    Hover lookup of curve charts (see connect_hover_annotation()), with the annotation texts of each point/bar built beforehand.
+    :param ax: Chart Axes
+    :param line_series: Iterable of (Line2D, texts): the nearest line point within hover_radius pixels is hovered
+    :param bar_series: List of (BarContainer, texts): the bar under the cursor is hovered (when no line point is close)
+    :param hover_radius: Line points hover radius, in pixels
+    :return: Function (mouse event) -> (x, y, text) of the hovered point/bar, or None
+    '''
+    # Bars limits (data coordinates) as arrays, so that the bar under the cursor is found without testing each patch
+    bar_limits = []
+    for bars, texts in bar_series:
+        x0 = np.array([bar.get_x() for bar in bars], dtype=float)
+        y0 = np.array([bar.get_y() for bar in bars], dtype=float)
+        x1 = x0 + np.array([bar.get_width() for bar in bars], dtype=float)
+        y1 = y0 + np.array([bar.get_height() for bar in bars], dtype=float)
+        bar_limits.append((x0, x1, np.minimum(y0, y1), np.maximum(y0, y1), y1, texts))
+
+    def find_target(event):
+        # Lines: nearest point in screen coordinates (lines data may be updated, so it is read on each move)
+        nearest = None
+        for line, texts in line_series:
+            line_points = line.get_xydata()
+            distances = np.hypot(*(ax.transData.transform(line_points) - [event.x, event.y]).T)
+            distances[np.isnan(distances)] = np.inf
+            point_position = distances.argmin() if len(distances) else None
+            if point_position is not None and distances[point_position] <= hover_radius and (nearest is None or distances[point_position] < nearest[0]):
+                nearest = (distances[point_position], *line_points[point_position], texts[point_position])
+        if nearest is not None:
+            return nearest[1:]
+
+        # Bars: bar that contains the cursor
+        x, y = ax.transData.inverted().transform((event.x, event.y))
+        for x0, x1, y_bottom, y_top, y_value, texts in bar_limits:
+            hovered_bars = np.flatnonzero((x0 <= x) & (x <= x1) & (y_bottom <= y) & (y <= y_top))
+            if len(hovered_bars):
+                bar_position = hovered_bars[0]
+                return (x0[bar_position] + x1[bar_position]) / 2, y_value[bar_position], texts[bar_position]
+        return None
+
+    return find_target
+
+
+def get_buildup_chart(root: ctk.CTkFrame, title: str, ylabel: str) -> dict:
+    '''
+    Returns the persistent Build-Up chart of a window, creating its figure and Canvas only in the first Scenario.
+    :param root: CTkFrame in which the Chart will be displayed (Efficient Curve/Hypothetical Curve tabs)
+    :param title: Chart title
+    :param ylabel: y-axis label
+    :return: Dict with 'fig', 'ax', 'canvas', 'lines' (accumulated Line2D of each Scenario name) and 'hover_lines'
+    (Line2D and hover texts of each Scenario name)
+    '''
+    if root not in buildup_charts:
+        # Image size
+        width, height = 680, 435
+
+        # Creating a figure and axes to insert the chart
+        fig, ax = plt.subplots(figsize=(width / 100, height / 100), layout='constrained')
+        # Keeping background transparent
+        fig.patch.set_facecolor("None")
+        fig.patch.set_alpha(0)
+        ax.set_facecolor('None')
+
+        # Real dates on x-axis (a tick each 3 months), so that new Scenarios can extend the timeline
+        ax.xaxis.set_major_locator(MonthLocator(interval=3))
+        ax.xaxis.set_major_formatter(DateFormatter('%m/%Y'))
+        ax.tick_params(axis='x', labelrotation=45)
+
+        # Chart settings
+        ax.set_ylabel(ylabel)
+        ax.set_title(title, color='#ad7102', fontweight='bold')
+        ax.grid(True)
+        ax.tick_params(axis='both', labelsize=9)  # Adjusting labels size
+
+        # Inserting chart into Canvas
+        canvas = FigureCanvasTkAgg(fig, master=root)
+        # Configuring Canvas background
+        canvas.get_tk_widget().configure(background='#cfcfcf')
+        canvas.get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
+
+        buildup_charts[root] = {'fig': fig, 'ax': ax, 'canvas': canvas, 'lines': {}, 'hover_lines': {}}
+        # Hover of all Scenarios lines (the dict values are read on each move, so new Scenarios are included)
+        connect_hover_annotation(canvas, ax, series_hover_target(ax, buildup_charts[root]['hover_lines'].values(), []))
+
+    return buildup_charts[root]
+
+
+def refresh_buildup_chart(buildup_chart: dict, dates: pd.Series) -> None:
+    # Updates limits and legend of a Build-Up chart after its artists were changed, with a single (idle) redraw
+    ax = buildup_chart['ax']
+    ax.set_xlim(dates.min(), dates.max())
+    ax.relim()
+    ax.autoscale_view(scalex=False)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right')
+    ax.legend(loc='upper left', fontsize=7, framealpha=0.8)
+    buildup_chart['canvas'].draw_idle()
+
+
+def calculate_monthly_wacc(wacc_value: float) -> float:
+    # Monthly Cost of Capital (%) based on yearly WACC (% in US$), in compounded mode
+    return ((1 + (wacc_value / 100)) ** (1 / 12) - 1) * 100
+
+
 @function_timer
 def read_scope_file(file_full_path: str, load_mode: str) -> pd.DataFrame:
     # Function that reads scope file and complementary info
@@ -174,13 +711,206 @@ def read_scope_file(file_full_path: str, load_mode: str) -> pd.DataFrame:
     return bup_scope
 
 
+class ScopeTableRow:
+    '''
+    Row of the Scope Sheet. tksheet reads cells as data[row][column] and only for the cells on screen, so values are read from
+    the Scope columns (through the current sort/filter view) when drawn, instead of building a list with all Scope values.
+    '''
+    __slots__ = ('scope_table', 'row_position')
+
+    def __init__(self, scope_table: dict, row_position: int):
+        self.scope_table = scope_table
+        self.row_position = row_position
+
+    def __len__(self):
+        return len(self.scope_table['columns'])
+
+    def __getitem__(self, column_position):
+        if isinstance(column_position, slice):
+            return [self[position] for position in range(len(self))[column_position]]
+        return self.scope_table['columns'][column_position][self.scope_table['view'][self.row_position]]
+
+
+def build_scope_table(bup_scope: pd.DataFrame) -> dict:
+    '''
+    Table model of the Scope Sheet: rows are shown from the DataFrame column arrays (not copied), sorted and filtered on the arrays.
+    :param bup_scope: DataFrame with Scope and additional information
+    :return: Dict with 'headers', 'columns' (arrays), 'order' (sorted row positions), 'sort' (column position, ascending),
+    'filters' (mask of each filter: column position for text filters, 'search', or ('range', column position)),
+    'view' (shown row positions) and 'rows' (Sheet data, see ScopeTableRow)
+    '''
+    scope_table = {
+        'headers': bup_scope.columns.tolist(),
+        'columns': [bup_scope[column].array for column in bup_scope.columns],
+        # Columns as text/numbers, created on the first filter of each column
+        'columns_text': {},
+        'columns_numeric': {},
+        # PN, Ecode and Description index, created on the first search (see build_scope_search_index())
+        'search_index': None,
+        'order': np.arange(len(bup_scope)),
+        'sort': None,
+        'filters': {},
+        'view': None,
+        'rows': []
+    }
+    update_scope_table_view(scope_table)
+
+    return scope_table
+
+
+def update_scope_table_view(scope_table: dict) -> None:
+    # Shown rows: sorted positions that match all filters. Row objects are only created/removed when the rows count changes
+    if scope_table['filters']:
+        filters_mask = np.logical_and.reduce(list(scope_table['filters'].values()))
+        scope_table['view'] = scope_table['order'][filters_mask[scope_table['order']]]
+    else:
+        scope_table['view'] = scope_table['order']
+
+    rows, rows_count = scope_table['rows'], len(scope_table['view'])
+    if len(rows) > rows_count:
+        del rows[rows_count:]
+    else:
+        rows.extend(ScopeTableRow(scope_table, row_position) for row_position in range(len(rows), rows_count))
+
+
+def sort_scope_table(scope_table: dict, column_position: int, ascending: bool) -> None:
+    '''
+    Sorts the Scope Sheet rows by a column (stable, empty values last).
+    :param scope_table: Table model (see build_scope_table())
+    :param column_position: Position of the column in the Scope
+    :param ascending: Sort direction
+    '''
+    column_values = pd.Series(scope_table['columns'][column_position])
+    try:
+        sorted_values = column_values.sort_values(ascending=ascending, kind='stable', na_position='last')
+    except TypeError:
+        # Mixed types (ex: PNs read as numbers and text) are sorted as text
+        sorted_values = column_values.astype(str).sort_values(ascending=ascending, kind='stable')
+    scope_table['order'] = sorted_values.index.to_numpy()
+    scope_table['sort'] = (column_position, ascending)
+    update_scope_table_view(scope_table)
+
+
+def filter_scope_table(scope_table: dict, column_position: int, text: str) -> None:
+    '''
+    Filters the Scope Sheet rows that contain a text in a column (case insensitive). Filters of different columns are combined.
+    :param scope_table: Table model (see build_scope_table())
+    :param column_position: Position of the column in the Scope
+    :param text: Text to be found. Empty text removes the column filter
+    '''
+    if not text:
+        scope_table['filters'].pop(column_position, None)
+    else:
+        if column_position not in scope_table['columns_text']:
+            scope_table['columns_text'][column_position] = pd.Series(scope_table['columns'][column_position]).astype(str).str.lower()
+        scope_table['filters'][column_position] = scope_table['columns_text'][column_position].str.contains(text.lower(), regex=False).to_numpy()
+    update_scope_table_view(scope_table)
+
+
+def build_scope_search_index(scope_table: dict) -> dict:
+    '''
+    Search index of the Scope Sheet: PN and Ecode texts sorted (prefix search by binary search), and Description words sorted, each one
+    with the (unique) Description that contains it (word prefix search, same way).
+    :param scope_table: Table model (see build_scope_table())
+    :return: Dict with 'PN' and 'Ecode' (sorted texts, row positions) and 'Description' (sorted words, Description code of each word,
+    Description code of each row, Descriptions count)
+    '''
+    headers, columns = scope_table['headers'], scope_table['columns']
+    search_index = {}
+
+    for header in ['PN', 'Ecode']:
+        texts = pd.Series(columns[headers.index(header)]).astype(str).str.lower().to_numpy(dtype=str)
+        sorted_positions = np.argsort(texts, kind='stable')
+        search_index[header] = (texts[sorted_positions], sorted_positions)
+
+    # Descriptions repeat a lot: words are indexed once per unique Description
+    descriptions = pd.Series(columns[headers.index('Description')]).fillna('').astype(str).str.lower()
+    description_codes, unique_descriptions = pd.factorize(descriptions)
+    words = pd.Series(unique_descriptions).str.findall(r'[a-z0-9]+').explode().dropna()
+    words = pd.DataFrame({'word': words.to_numpy(dtype=str), 'code': words.index.to_numpy()}).drop_duplicates().sort_values('word', kind='stable')
+    search_index['Description'] = (words['word'].to_numpy(dtype=str), words['code'].to_numpy(), description_codes, len(unique_descriptions))
+
+    return search_index
+
+
+def search_scope_table(scope_table: dict, text: str) -> None:
+    '''
+    Filters the Scope Sheet rows whose PN or Ecode starts with the text, or whose Description has words starting with each word of
+    the text (case insensitive). Combined with the other filters.
+    :param scope_table: Table model (see build_scope_table())
+    :param text: Text to be found. Empty text removes the search
+    '''
+    text = text.strip().lower()
+    if not text:
+        scope_table['filters'].pop('search', None)
+    else:
+        if scope_table['search_index'] is None:
+            scope_table['search_index'] = build_scope_search_index(scope_table)
+        search_index = scope_table['search_index']
+
+        # PN/Ecode: texts between the text and the text followed by the last character are the ones that start with it
+        search_mask = np.zeros(len(scope_table['order']), dtype=bool)
+        for header in ['PN', 'Ecode']:
+            sorted_texts, sorted_positions = search_index[header]
+            start, end = np.searchsorted(sorted_texts, [text, text + '\uffff'])
+            search_mask[sorted_positions[start:end]] = True
+
+        # Description: all words of the text
+        sorted_words, words_codes, description_codes, descriptions_count = search_index['Description']
+        text_words = re.findall(r'[a-z0-9]+', text)
+        if text_words:
+            descriptions_mask = np.ones(descriptions_count, dtype=bool)
+            for text_word in text_words:
+                start, end = np.searchsorted(sorted_words, [text_word, text_word + '\uffff'])
+                word_mask = np.zeros(descriptions_count, dtype=bool)
+                word_mask[words_codes[start:end]] = True
+                descriptions_mask &= word_mask
+            search_mask |= descriptions_mask[description_codes]
+
+        scope_table['filters']['search'] = search_mask
+    update_scope_table_view(scope_table)
+
+
+def filter_scope_table_range(scope_table: dict, column_position: int, minimum: float = None, maximum: float = None) -> None:
+    '''
+    Filters the Scope Sheet rows with a numeric column value within a range (empty values are filtered out). Combined with the other filters.
+    :param scope_table: Table model (see build_scope_table())
+    :param column_position: Position of the column in the Scope
+    :param minimum: Minimum value (inclusive). None for no minimum
+    :param maximum: Maximum value (inclusive). None for no maximum. Without both, the range filter is removed
+    '''
+    if minimum is None and maximum is None:
+        scope_table['filters'].pop(('range', column_position), None)
+    else:
+        if column_position not in scope_table['columns_numeric']:
+            scope_table['columns_numeric'][column_position] = pd.to_numeric(pd.Series(scope_table['columns'][column_position]),
+                                                                             errors='coerce').to_numpy(dtype=float)
+        column_values = scope_table['columns_numeric'][column_position]
+        range_mask = ~np.isnan(column_values)
+        if minimum is not None:
+            range_mask &= column_values >= minimum
+        if maximum is not None:
+            range_mask &= column_values <= maximum
+        scope_table['filters'][('range', column_position)] = range_mask
+    update_scope_table_view(scope_table)
+
+
+def leadtime_chart_spec(bup_scope: pd.DataFrame) -> dict:
+    '''
+    Extracts from the Scope what is needed to draw Leadtime charts (see chart_rendering.draw_dispersion_chart()/draw_histogram()).
+    :param bup_scope: DataFrame with scope and additional information
+    :return: Chart spec, with NumPy arrays (picklable, to be sent to rendering workers)
+    '''
+    return {
+        'leadtime': bup_scope['Leadtime'].to_numpy(),
+        'acq_cost': bup_scope['Acq Cost'].to_numpy(dtype=float),
+        'expendable': (bup_scope['SPC'] == 'Expendable').to_numpy()
+    }
+
+
 @function_timer
 def generate_dispersion_chart(bup_scope: pd.DataFrame, root: ctk.CTkFrame):
-    # This function receives 'bup_scope' paramter as a pandas DataFrame and creates the chart.
-
-    # Function to format y-axis values in thousands
-    def format_acq_cost(value, _):
-        return f'US$ {value / 1000:.0f}k'
+    # This function receives 'bup_scope' paramter as a pandas DataFrame and creates the chart. It returns the chart Canvas.
 
     # Image Size
     width, height = 600, 235
@@ -190,22 +920,9 @@ def generate_dispersion_chart(bup_scope: pd.DataFrame, root: ctk.CTkFrame):
     fig.patch.set_alpha(0)
     ax.set_facecolor('None')
 
-    # Scattering Items
-    conditional_colors = np.where(bup_scope['SPC'] == 'Expendable', 'orange', 'purple')
-    scatter = ax.scatter(bup_scope['Leadtime'], bup_scope['Acq Cost'], color=conditional_colors, marker='o', alpha=0.7)
-
-    # Custom Labels Patches
-    expendable_patch = mlines.Line2D([], [], marker='o', color='orange', markersize=6, lw=0, label='Expendable')
-    repairable_patch = mlines.Line2D([], [], marker='o', color='purple', markersize=6, lw=0, label='Repairable')
-
-    # Adding labels and legends
-    ax.set_xlabel('Leadtime', loc='right')
-    ax.set_ylabel('Acq Cost')
-    ax.set_title('Dispersion Acq Cost x Leadtime', fontsize=10)
-    ax.legend(handles=[expendable_patch, repairable_patch], fontsize=9, framealpha=0.6)
-    plt.grid(True)
-    # Setting personalized format to y-axis
-    ax.yaxis.set_major_formatter(FuncFormatter(format_acq_cost))
+    # Scattering Items (colored by SPC), labels and legends
+    spec = leadtime_chart_spec(bup_scope)
+    chart_rendering.draw_dispersion_chart(ax, spec)
 
     # Inserting chart into Canvas
     canvas_dispersion = FigureCanvasTkAgg(fig, master=root)
@@ -214,29 +931,22 @@ def generate_dispersion_chart(bup_scope: pd.DataFrame, root: ctk.CTkFrame):
     canvas_dispersion.get_tk_widget().configure(background='#dbdbdb',)
     canvas_dispersion.get_tk_widget().pack(fill=ctk.BOTH, expand=True, pady=(0,10))
 
-    # Annotation function to connect with mplcursors
-    def set_annotations(sel):
-        sel.annotation.set_text(
-            'PN: ' + str(bup_scope['PN'][sel.target.index]) + "\n" +
-            'Acq Cost: US$ ' + f"{round(bup_scope['Acq Cost'][sel.target.index]):,}" + "\n" +
-            'Leadtime: ' + str(bup_scope['Leadtime'][sel.target.index]) + "\n" +
-            'EIS Critical: ' + str(bup_scope['EIS Critical'][sel.target.index])
-        )
-
-    # Inserting Hover with mplcursors
-    mpc.cursor(scatter, hover=True).connect('add', lambda sel: set_annotations(sel))
+    # Annotations of all parts built once, so that hovering does not access the DataFrame
+    hover_texts = [f'PN: {pn}\nAcq Cost: US$ {acq_cost:,.0f}\nLeadtime: {leadtime}\nEIS Critical: {eis_critical}'
+                   for pn, acq_cost, leadtime, eis_critical in zip(bup_scope['PN'], bup_scope['Acq Cost'], bup_scope['Leadtime'], bup_scope['EIS Critical'])]
 
-    # --------------- Turning it into an Image to be displayed  ---------------
+    # Inserting Hover (nearest part through the screen grid index)
+    find_point = build_scatter_hover_index(canvas_dispersion, ax, spec['leadtime'], spec['acq_cost'])
 
-    # Saving the matplotlib figure to a BytesIO object (memory), so as not to have to save to an image file
-    tmp_img_dispersion_chart = BytesIO()
-    fig.savefig(tmp_img_dispersion_chart, format='png', transparent=True)
-    tmp_img_dispersion_chart.seek(0)
+    def find_target(event):
+        point_position = find_point(event)
+        if point_position is None:
+            return None
+        return spec['leadtime'][point_position], spec['acq_cost'][point_position], hover_texts[point_position]
 
-    # Loading the chart image into an Image object that will be returned by the function
-    dispersion_image = Image.open(tmp_img_dispersion_chart)
+    connect_hover_annotation(canvas_dispersion, ax, find_target)
 
-    return dispersion_image
+    return canvas_dispersion
 
 
 @function_timer
@@ -244,7 +954,7 @@ def generate_histogram(bup_scope: pd.DataFrame, root: ctk.CTkFrame):
     '''
     :param bup_scope: DataFrame with scope and additional information
     :param root: CTk Frame in which chart will be inserted
-    :return: histogram_image: Chart CTkImage object in order to export
+    :return: canvas_histogram: Chart Canvas, owned by the Canvas registry (see get_canvas())
     '''
 
     # Image size
@@ -257,34 +967,8 @@ def generate_histogram(bup_scope: pd.DataFrame, root: ctk.CTkFrame):
     fig.patch.set_alpha(0)
     ax.set_facecolor('None')
 
-    # Inserting Average and Standard Deviation of Leadtimes - Before histogram plottation
-    avg_leadtimes = bup_scope['Leadtime'].mean()
-    sd_leadtimes = bup_scope['Leadtime'].std()
-    ax.axvline(x=avg_leadtimes, linestyle='--', color='black', label=f'Average: {round(avg_leadtimes)}')
-    ax.axvspan(avg_leadtimes - sd_leadtimes, avg_leadtimes + sd_leadtimes, alpha=0.4, color='#fccf03',
-               label=f'Std: {round(sd_leadtimes)}', hatch='/', edgecolor='black')
-
-    # Creating Histogram and saving the information in control variables
-    n, bins, patches = ax.hist(bup_scope['Leadtime'], bins=20, edgecolor='k', color='#1fa9a4', linewidth=0.7, alpha=0.9)
-
-    # Histogram settings
-    ax.set_ylabel('Materials Count')
-    ax.set_xlabel('Leadtime', loc='right')
-    ax.set_title('Leadtime Histogram (in days)', fontsize=10)
-    # Adjusting the y-axis limit (the largest bar was transcending the upper limit)
-    ax.set_ylim(0, max(n) + 50)  # Adding a margin to accommodate the count at the top of the bar
-
-    # Inserting the count into each bar
-    for count, bar in zip(n, patches):
-        x = bar.get_x() + bar.get_width() / 2
-        y = bar.get_height()
-        ax.text(x, y, f'{int(count)}', ha='center', va='bottom', fontdict={
-            'family': 'open sans',
-            'size': 9
-        })
-
-    # Legend
-    ax.legend(fontsize=9, framealpha=0.6)
+    # Histogram with Average and Standard Deviation of Leadtimes, saving the information in control variables
+    n, bins, patches = chart_rendering.draw_histogram(ax, leadtime_chart_spec(bup_scope))
 
     # Annotation function to connect with mplcursors
     def set_annotations(sel):
@@ -304,20 +988,274 @@ def generate_histogram(bup_scope: pd.DataFrame, root: ctk.CTkFrame):
     canvas_histogram.get_tk_widget().configure(background='#dbdbdb')
     canvas_histogram.get_tk_widget().pack(fill=ctk.BOTH, expand=True)
 
-    # --- Saving the chart image in BytesIO() (memory) so it is not necessary to save as a file ---
-    tmp_img_histogram_chart = BytesIO()
-    fig.savefig(tmp_img_histogram_chart, format='png', transparent=True)
-    tmp_img_histogram_chart.seek(0)
+    return canvas_histogram
+
+
+def scenario_worker_loop() -> None:
+    # Worker thread: calculates the stages of each Scenario job, in order, and posts each stage status to the Tk thread
+    while True:
+        job = scenario_jobs.get()
+        for stage_index, (description, calculate, show) in enumerate(job['stages']):
+            if job['generation'] != scenario_jobs_generation:
+                break
+            scenario_job_updates.put((job, stage_index, 'started', None))
+            span = enter_span(f'{description} (calculate)', job['name'], job['span']['id'])
+            try:
+                calculate(job['results'])
+            except Exception as ex:
+                finish_span(span, type(ex).__name__)
+                logging.exception(f"{job['name']}: {description} failed.")
+                scenario_job_updates.put((job, stage_index, 'failed', ex))
+                break
+            finish_span(span)
+            scenario_job_updates.put((job, stage_index, 'calculated', None))
+
+
+def submit_scenario_job(tk_widget, job: dict) -> None:
+    '''
+    Queues a Scenario job. Its stages are calculated by the worker thread and shown by the Tk thread (see poll_scenario_jobs()),
+    so that the application keeps responding and other Scenarios can be queued meanwhile.
+    :param tk_widget: Any widget of the Scope window (after() scheduling and progress panel)
+    :param job: Dict with 'name', 'stages' and 'on_failure'. Stages are a list of (description, calculate, show): calculate(results)
+    runs in the worker thread and must not access widgets, show(results) runs in the Tk thread after its stage is calculated (or None).
+    on_failure(exception) is called in the Tk thread if any stage fails (next stages are not executed)
+    '''
+    global scenario_worker, scenario_jobs_pending
+
+    # The job span lasts until its last stage is shown. Its stages (calculate/show) are child spans
+    job.update(results={}, generation=scenario_jobs_generation, span=start_span('scenario_job', job['name']))
+    if scenario_worker is None:
+        scenario_worker = threading.Thread(target=scenario_worker_loop, name='ScenarioWorker', daemon=True)
+        scenario_worker.start()
+
+    scenario_jobs_pending += 1
+    scenario_jobs.put(job)
+    # Polling runs while there are pending jobs. Otherwise, the running job progress is kept and only the queued count is updated
+    if scenario_jobs_pending == 1:
+        tk_widget.after(50, poll_scenario_jobs, tk_widget)
+        update_scenario_progress(tk_widget, f"{job['name']}: queued", 0)
+    else:
+        update_scenario_progress(tk_widget)
+
+
+def poll_scenario_jobs(tk_widget) -> None:
+    # Tk thread: handles one stage status per call, so that the window keeps responding between charts
+    global scenario_jobs_pending
+
+    try:
+        job, stage_index, status, error = scenario_job_updates.get_nowait()
+    except queue.Empty:
+        job = None
+
+    if job is not None and job['generation'] == scenario_jobs_generation:
+        description, _, show = job['stages'][stage_index]
+        stage_progress = f"{job['name']}: {description} ({stage_index + 1}/{len(job['stages'])})"
 
-    # Keeping the image in an Image object
-    histogram_chart = Image.open(tmp_img_histogram_chart)
+        if status == 'started':
+            update_scenario_progress(tk_widget, stage_progress, stage_index / len(job['stages']))
+        else:
+            if status == 'calculated' and show is not None:
+                span = enter_span(f'{description} (show)', job['name'], job['span']['id'])
+                try:
+                    show(job['results'])
+                    finish_span(span)
+                except Exception as ex:
+                    finish_span(span, type(ex).__name__)
+                    logging.exception(f"{job['name']}: {description} failed.")
+                    status, error = 'failed', ex
+                    # Next stages of this job must not be shown
+                    job['generation'] = None
+
+            if status == 'failed':
+                scenario_jobs_pending -= 1
+                finish_span(job['span'], type(error).__name__)
+                job['on_failure'](error)
+            elif stage_index == len(job['stages']) - 1:
+                scenario_jobs_pending -= 1
+                finish_span(job['span'])
+            update_scenario_progress(tk_widget, stage_progress, (stage_index + 1) / len(job['stages']))
+
+    if scenario_jobs_pending > 0:
+        # Next stage status right away, if it is already available
+        tk_widget.after(50 if job is None else 1, poll_scenario_jobs, tk_widget)
+    elif scenario_progress is not None:
+        scenario_progress['frame'].place_forget()
+
+
+def update_scenario_progress(tk_widget, text: str = None, progress: float = None) -> None:
+    '''
+    Shows the progress panel at the bottom of the Scope window, with the current job stage and the queued Scenarios count.
+    :param tk_widget: Any widget of the Scope window
+    :param text: Current stage description (None: unchanged)
+    :param progress: Current job progress, from 0 to 1 (None: unchanged)
+    '''
+    global scenario_progress
+
+    if scenario_progress is None:
+        frame = ctk.CTkFrame(tk_widget.winfo_toplevel(), fg_color='#dbdbdb', corner_radius=8)
+        label = ctk.CTkLabel(frame, text='', height=20, font=ctk.CTkFont('open sans', size=10, weight='bold'), text_color='#000000')
+        label.pack(side='left', padx=(8, 5))
+        progress_bar = ctk.CTkProgressBar(frame, width=120, height=8, progress_color='#009898')
+        progress_bar.pack(side='left', padx=(0, 8))
+        scenario_progress = {'frame': frame, 'label': label, 'progress_bar': progress_bar, 'text': ''}
+
+    if text is not None:
+        scenario_progress['text'] = text
+    queued_jobs = scenario_jobs_pending - 1
+    scenario_progress['label'].configure(text=scenario_progress['text'] + (f' - {queued_jobs} more queued' if queued_jobs > 0 else ''))
+    if progress is not None:
+        scenario_progress['progress_bar'].set(progress)
+    scenario_progress['frame'].place(relx=0.99, rely=0.995, anchor='se')
+    scenario_progress['frame'].lift()
+
+
+def cancel_scenario_jobs() -> None:
+    # Discards pending Scenario jobs (Scope window closed). The job being calculated stops at its next stage
+    global scenario_jobs_pending, scenario_jobs_generation, scenario_progress
+
+    scenario_jobs_generation += 1
+    scenario_jobs_pending = 0
+    while not scenario_jobs.empty():
+        try:
+            scenario_jobs.get_nowait()
+        except queue.Empty:
+            break
+    # The progress panel belongs to the closed window
+    scenario_progress = None
+
+
+def export_writer_loop() -> None:
+    # Writer thread: writes each export in a temporary path and renames it to the final path, so that a failed or half written
+    # export never replaces a previous file. Results are posted to the Tk thread
+    while True:
+        job = export_jobs.get()
+        folder, name = os.path.split(job['path'])
+        temp_path = os.path.join(folder, '~' + name)
+        span = enter_span('export_job', name)
+        try:
+            if os.path.isdir(temp_path):  # Left by an interrupted export
+                shutil.rmtree(temp_path)
+            job['write'](temp_path)
+            if os.path.isdir(job['path']):
+                # Folders (one file per sheet) can not replace an existing folder: the previous one is moved away first
+                old_path = temp_path + '.old'
+                os.replace(job['path'], old_path)
+                os.replace(temp_path, job['path'])
+                shutil.rmtree(old_path, ignore_errors=True)
+            else:
+                os.replace(temp_path, job['path'])
+            finish_span(span)
+            export_job_results.put((job, None))
+        except Exception as ex:
+            finish_span(span, type(ex).__name__)
+            logging.exception(f"Export of {job['path']} failed.")
+            if os.path.isdir(temp_path):
+                shutil.rmtree(temp_path, ignore_errors=True)
+            elif os.path.exists(temp_path):
+                os.remove(temp_path)
+            export_job_results.put((job, ex))
+
+
+def submit_export_job(tk_widget, full_path: str, write) -> None:
+    '''
+    Queues a file export (Excel/columnar data, chart images), written by the writer thread while the application keeps responding.
+    Progress and result are shown in the notifications area of the window (see show_notification()), not in message boxes.
+    :param tk_widget: Any widget of the window in which the notification is shown
+    :param full_path: Final path of the file (or folder) exported
+    :param write: write(temp_path) writes the export in the given path. Runs in the writer thread: its data must be already
+    prepared (ex: DataFrames, rasterized images), without accessing widgets
+    '''
+    global export_writer, export_jobs_pending
+
+    if export_writer is None:
+        export_writer = threading.Thread(target=export_writer_loop, name='ExportWriter', daemon=True)
+        export_writer.start()
+
+    job = {'path': full_path, 'write': write,
+           'notification': show_notification(tk_widget, f'Exporting {os.path.basename(full_path)}...', duration=None)}
+    export_jobs_pending += 1
+    export_jobs.put(job)
+    # Polled from the main window, that lives longer than the window of the export
+    if export_jobs_pending == 1:
+        tk_widget.nametowidget('.').after(100, poll_export_jobs, tk_widget.nametowidget('.'))
+
+
+def poll_export_jobs(root) -> None:
+    # Tk thread: shows the result of finished exports in their notifications
+    global export_jobs_pending
+
+    while True:
+        try:
+            job, error = export_job_results.get_nowait()
+        except queue.Empty:
+            break
+        export_jobs_pending -= 1
+        notification = job['notification']
+        if error is None:
+            update_notification(notification, f"Exported to: {job['path']}", 'success')
+        elif notification is not None and notification.winfo_exists():
+            update_notification(notification, f"Export failed: {error}. Please make sure that the file is closed and you have "
+                                              f"access to the folder.", 'error')
+        else:
+            # Window of the export was closed
+            messagebox.showerror(title="Error!", message=f"Export of {job['path']} failed: {error}")
+
+    if export_jobs_pending > 0:
+        root.after(100, poll_export_jobs, root)
 
-    # Loading into a CTk Image object
-    histogram_image = ctk.CTkImage(histogram_chart,
-                                   dark_image=histogram_chart,
-                                   size=(600, 220))
 
-    return histogram_image
+def show_notification(tk_widget, text: str, level: str = 'info', duration: int = 6000):
+    '''
+    Shows a message in the notifications area (bottom left corner of the window), without blocking the window as message boxes do.
+    Notifications are stacked, and closed by clicking on them.
+    :param tk_widget: Any widget of the window
+    :param text: Message
+    :param level: 'info', 'success' or 'error' (text color)
+    :param duration: Milliseconds until the notification is closed. None: kept until it is clicked (or updated)
+    :return: Notification label (see update_notification())
+    '''
+    window = tk_widget.winfo_toplevel()
+    area = notification_areas.get(str(window))
+    if area is None or not area.winfo_exists():
+        area = ctk.CTkFrame(window, fg_color='transparent')
+        notification_areas[str(window)] = area
+
+    notification = ctk.CTkLabel(area, text='', fg_color='#dbdbdb', corner_radius=8, height=22, wraplength=420, justify='left',
+                                font=ctk.CTkFont('open sans', size=10, weight='bold'), cursor='hand2')
+    notification.pack(side='bottom', anchor='w', pady=(3, 0))
+    notification.bind('<Button-1>', lambda _: close_notification(notification))
+    update_notification(notification, text, level, duration)
+
+    area.place(relx=0.01, rely=0.995, anchor='sw')
+    area.lift()
+    return notification
+
+
+def update_notification(notification, text: str, level: str = 'info', duration: int = 6000) -> None:
+    '''
+    Changes the message of a notification (if its window is still open).
+    :param notification: Label returned by show_notification()
+    :param text: Message
+    :param level: 'info', 'success' or 'error'. Error notifications are kept until clicked
+    :param duration: Milliseconds until the notification is closed. None: kept until it is clicked (or updated)
+    '''
+    if not notification.winfo_exists():
+        return
+    notification.configure(text=f' {text} ', text_color={'info': '#000000', 'success': '#1e7d37', 'error': '#c62828'}[level])
+    # Previous closing (if any) is replaced
+    if getattr(notification, 'close_job', None) is not None:
+        notification.after_cancel(notification.close_job)
+    notification.close_job = notification.after(duration, close_notification, notification) if duration and level != 'error' else None
+
+
+def close_notification(notification) -> None:
+    # Removes the notification, and the notifications area with the last one
+    if not notification.winfo_exists():
+        return
+    area = notification.master
+    notification.destroy()
+    if not any(isinstance(child, ctk.CTkLabel) for child in area.winfo_children()):
+        area.place_forget()
 
 
 @function_timer
@@ -326,8 +1264,9 @@ def create_scenario(scenario_window: ctk.CTkFrame, var_scenarios_count: ctk.IntV
                     batches_curve_window: ctk.CTkFrame, bup_cost: float):
     '''
     This is the function that handles Scenarios creating. Here will be created the Scenarios creation window, and also will be
-    the function that calls all other functions that executes subsequently after creating a Scenario. That is:
-    [generate_efficient_curve_buildup_chart(), generate_hypothetical_curve_buildup_chart(), generate_acqcost_curve(), generate_cost_avoidance_screen()]
+    the function that queues the Scenario job (see submit_scenario_job()) that calculates the curves and calls all chart functions. That is:
+    [generate_efficient_curve_buildup_chart(), generate_hypothetical_curve_buildup_chart(), generate_acqcost_curve(), generate_cost_avoidance_screen(),
+    generate_batches_curve()]
     :param scenario_window:
     :param var_scenarios_count:
     :param bup_scope:
@@ -637,14 +1576,13 @@ def create_scenario(scenario_window: ctk.CTkFrame, var_scenarios_count: ctk.IntV
 
     # ----------------- Interaction Buttons -----------------
 
-    # Function to return the values entered by user in the Entry, handling Defaults. It also saves both chart
-    # Images on global scope variables.
+    # Function to return the values entered by user in the Entry, handling Defaults, and to queue the Scenario job. The job also
+    # saves both chart Images on global scope variables.
     def get_entry_values():
         '''
-        As this is an awaiting function, it has to assign the value directly to the global scope variables.
+        As this is an awaiting function, it has to assign the value directly to the global scope variables (see show_buildup_charts()).
         In another way, if tried to return directly from 'create_scenario()' (parent function), it would raise a 'non exists' error
         '''
-        global img_eff_chart, img_hyp_chart, df_scope_with_scenarios, canvas_eff, canvas_hyp, canvas_acqcost_eff, canvas_acqcost_hyp
 
         # --------- Contractual Conditions ---------
 
@@ -799,6 +1737,10 @@ def create_scenario(scenario_window: ctk.CTkFrame, var_scenarios_count: ctk.IntV
             messagebox.showerror("Error",
                                  "Invalid character. Please enter a valid number for Batches Quantity.")
             return
+        if scenario['batches_qty'] is not None and scenario['batches_qty'] < 1:
+            messagebox.showerror("Error",
+                                 "Invalid number. Batches Quantity must be at least 1 (leave it empty for no Batches).")
+            return
         
         # --- Batch Dates ---
         try:
@@ -814,34 +1756,74 @@ def create_scenario(scenario_window: ctk.CTkFrame, var_scenarios_count: ctk.IntV
         # Summing up full Procurement Length values
         scenario['full_procurement_length'] = (scenario['pr_release_approval_vss'] + scenario['po_commercial_condition'] + scenario['po_conversion'] + 
                                                scenario['export_license'] + scenario['buffer'] + scenario['outbound_logistic'])
-        
+
         # Including the scenario in the global Dicts list and closing the screen
         scenarios_list.append(scenario)
         scenario_window.destroy()
 
-        # ----------- Calling the chart generation functions -----------
-
-        # Calling the function to generate the Efficient Build-Up chart. The return of the function is the chart in a
-        # figure (Image object), in addition to the DataFrames/Variables created in the function, as a return to be used
-        # in the Hypothetical chart
-        canvas_eff, bup_eff_chart_whitebg, df_scope_with_scenarios, scenario_dataframes, df_dates_eff, df_dates_hyp = generate_efficient_curve_buildup_chart(bup_scope, scenarios_list, 
-                                                                                                                                                             efficient_curve_window,
-                                                                                                                                                             hypothetical_curve_window)
-
-        # Calling the function to generate Hypothetical Build-Up chart.
-        bup_hyp_chart_whitebg, canvas_hyp = generate_hypothetical_curve_buildup_chart(df_scope_with_scenarios, scenario_dataframes, hypothetical_curve_window)
-
-        # Saving both charts Image on global scope variables
-        img_eff_chart, img_hyp_chart = bup_eff_chart_whitebg, bup_hyp_chart_whitebg
-
-        # Calling function to generate Cost Avoidance Chart
-        generate_cost_avoidance_screen(cost_avoidance_window, scenario_dataframes, scenarios_list, df_scope_with_scenarios, df_dates_eff, df_dates_hyp, bup_cost)
-
-        # Calling function to generate Batches Build-Up chart and return the frames
-        generate_batches_curve(batches_curve_window, scenarios_list, df_scope_with_scenarios)
-
-        # Adding 1 to IntVar with the Scenarios count
-        var_scenarios_count.set(var_scenarios_count.get() + 1)
+        # ----------- Scenario job: curves calculation (worker thread) and charts generation (Tk thread) -----------
+
+        # Scenarios set of this job: taken by the worker when the job starts (see job_stage()), so that Scenarios discarded by previous
+        # jobs are not included. Next Scenarios may be created while it runs
+        job_scenarios = []
+        job = {'name': f'Scenario_{len(scenarios_list) - 1}', 'on_failure': None}
+
+        def job_stage(calculate):
+            # Worker thread: the first stage takes the Scenarios set (up to this Scenario) and the job name of its position. If any stage
+            # fails, the Scenario is discarded right away, before the next job starts
+            def calculate_stage(results):
+                if not job_scenarios:
+                    job_scenarios.extend(scenarios_until(scenario))
+                    job['name'] = job['span']['label'] = f'Scenario_{len(job_scenarios) - 1}'
+                try:
+                    calculate(results)
+                except Exception:
+                    remove_scenario(scenario)
+                    raise
+            return calculate_stage
+
+        # If only the Batches Quantity was filled in, the Batch Dates are chosen by the solver (minimum carrying cost)
+        def calculate_batches_dates(results):
+            batches_dates = optimize_batches_dates(bup_scope, scenario, scenario['batches_qty'])
+            scenario['batches_dates'] = ', '.join([batch_date.strftime('%d/%m/%Y') for batch_date in batches_dates])
+
+        # Efficient and Hypothetical curves (Parts) of all Scenarios
+        def calculate_buildup_curves(results):
+            results['scenario_dataframes'] = {}
+            results['df_scope_with_scenarios'], results['df_dates_eff'], results['df_dates_hyp'] = calculate_scenarios_curves(
+                bup_scope, job_scenarios, results['scenario_dataframes'])
+
+        # Monthly and Accumulated Acq Cost of each Scenario, appended to scenario_dataframes (Eff: [2], Hyp: [3])
+        def calculate_acqcost(results):
+            calculate_acqcost_curves(results['df_scope_with_scenarios'], results['df_dates_eff'], results['df_dates_hyp'], results['scenario_dataframes'])
+
+        # Cost Avoidance DataFrame of each Scenario (appended to scenario_dataframes [4]), with the arrays of all Scenarios
+        def calculate_scenarios_cost_avoidance(results):
+            results['cost_avoidance'] = calculate_cost_avoidance_curves(results['scenario_dataframes'], job_scenarios, results['df_scope_with_scenarios'],
+                                                                        results['df_dates_eff'], results['df_dates_hyp'], bup_cost,
+                                                                        calculate_monthly_wacc(default_wacc_value))
+
+        # Batch of each PN (Batches of the first Scenario)
+        def calculate_scenarios_batches(results):
+            results['batches'] = (calculate_batches(job_scenarios, results['df_scope_with_scenarios'])
+                                  if job_scenarios[0]['batches_dates'] is not None else None)
+
+        # The Scenario is discarded if its curves could not be calculated (or its charts could not be shown)
+        def discard_scenario(error):
+            remove_scenario(scenario)
+            messagebox.showerror("Error", f"Scenario could not be created:\n\n{error}")
+
+        show_functions = scenario_show_functions(efficient_curve_window, hypothetical_curve_window, cost_avoidance_window, batches_curve_window,
+                                                 var_scenarios_count, job_scenarios, bup_cost)
+        job_stages = [('Build-Up curves', job_stage(calculate_buildup_curves), show_functions['Build-Up curves']),
+                      ('Acq Cost curves', job_stage(calculate_acqcost), show_functions['Acq Cost curves']),
+                      ('Cost Avoidance', job_stage(calculate_scenarios_cost_avoidance), show_functions['Cost Avoidance']),
+                      ('Batches', job_stage(calculate_scenarios_batches), show_functions['Batches'])]
+        if scenario['batches_qty'] and scenario['batches_dates'] is None:
+            job_stages.insert(0, ('Batch Dates', job_stage(calculate_batches_dates), None))
+
+        job.update(stages=job_stages, on_failure=discard_scenario)
+        submit_scenario_job(efficient_curve_window, job)
 
 
     # OK button
@@ -861,20 +1843,101 @@ def create_scenario(scenario_window: ctk.CTkFrame, var_scenarios_count: ctk.IntV
     btn_cancel.place(relx=0.7, rely=0.95, anchor=ctk.CENTER)
 
 
+def scenarios_until(scenario: dict) -> list:
+    # Scenarios registered up to the given one (included), by identity: Scenarios with the same values are different Scenarios
+    for position, listed_scenario in enumerate(scenarios_list):
+        if listed_scenario is scenario:
+            return scenarios_list[:position + 1]
+    return []
+
+
+def remove_scenario(scenario: dict) -> None:
+    # Removes a Scenario from scenarios_list (by identity), if it is still registered
+    for position, listed_scenario in enumerate(scenarios_list):
+        if listed_scenario is scenario:
+            del scenarios_list[position]
+            return
+
+
+def scenario_show_functions(efficient_curve_window: ctk.CTkFrame, hypothetical_curve_window: ctk.CTkFrame, cost_avoidance_window: ctk.CTkFrame,
+                            batches_curve_window: ctk.CTkFrame, var_scenarios_count: ctk.IntVar, job_scenarios: list, bup_cost: float) -> dict:
+    '''
+    Tk thread functions of a Scenario job that show the results of each stage (charts). Used by Scenario creation (see create_scenario())
+    and by session opening, in which the results come from the session file (see restore_session_scenarios()).
+    :param job_scenarios: Scenarios set of the job
+    :param bup_cost: Build-Up List Total Cost (US$)
+    :return: Dict with the show function of each stage (by stage description)
+    '''
+    def show_buildup_charts(results):
+        global img_eff_chart, img_hyp_chart, df_scope_with_scenarios, scenario_dataframes, canvas_eff, canvas_hyp
+
+        # The new Scenarios set replaces the previous one
+        df_scope_with_scenarios, scenario_dataframes = results['df_scope_with_scenarios'], results['scenario_dataframes']
+
+        # Efficient and Hypothetical Build-Up charts. Figures are saved on global scope variables (rasterized only when saved)
+        canvas_eff, img_eff_chart = generate_efficient_curve_buildup_chart(df_scope_with_scenarios, scenario_dataframes, efficient_curve_window)
+        img_hyp_chart, canvas_hyp = generate_hypothetical_curve_buildup_chart(df_scope_with_scenarios, scenario_dataframes, hypothetical_curve_window)
+
+    def show_acqcost_charts(results):
+        generate_acqcost_curve(results['df_scope_with_scenarios'], results['scenario_dataframes'], efficient_curve_window, hypothetical_curve_window)
+
+    def show_cost_avoidance(results):
+        generate_cost_avoidance_screen(cost_avoidance_window, results['scenario_dataframes'], job_scenarios, results['df_scope_with_scenarios'],
+                                       results['cost_avoidance'], bup_cost)
+
+    def show_batches_chart(results):
+        global scenario_results
+
+        generate_batches_curve(batches_curve_window, results['df_scope_with_scenarios'], results['batches'])
+        # All charts of the job are shown: its results are the ones saved in a session
+        scenario_results = {'scenarios': job_scenarios, **{key: results[key] for key in session_result_keys}}
+        # Adding 1 to IntVar with the Scenarios count
+        var_scenarios_count.set(var_scenarios_count.get() + 1)
+
+    return {'Build-Up curves': show_buildup_charts, 'Acq Cost curves': show_acqcost_charts,
+            'Cost Avoidance': show_cost_avoidance, 'Batches': show_batches_chart}
+
+
+def restore_session_scenarios(session_results: dict, efficient_curve_window: ctk.CTkFrame, hypothetical_curve_window: ctk.CTkFrame,
+                              cost_avoidance_window: ctk.CTkFrame, batches_curve_window: ctk.CTkFrame, var_scenarios_count: ctk.IntVar,
+                              bup_cost: float) -> None:
+    '''
+    Shows the Scenarios of an opened session: a Scenario job whose stages only show the stored results (no calculation).
+    :param session_results: Results saved in the session (see scenario_results)
+    :param bup_cost: Build-Up List Total Cost (US$)
+    '''
+    global scenarios_list
+
+    # New Scenarios are added to the session ones
+    scenarios_list = list(session_results['scenarios'])
+
+    show_functions = scenario_show_functions(efficient_curve_window, hypothetical_curve_window, cost_avoidance_window, batches_curve_window,
+                                             var_scenarios_count, session_results['scenarios'], bup_cost)
+
+    def load_results(results):
+        results.update(session_results)
+
+    job_stages = [(description, load_results if stage_index == 0 else (lambda results: None), show)
+                  for stage_index, (description, show) in enumerate(show_functions.items())]
+    submit_scenario_job(efficient_curve_window, {'name': 'Session', 'stages': job_stages,
+                                                 'on_failure': lambda error: messagebox.showerror("Error", f"Session Scenarios could not be shown:\n\n{error}")})
+
+
 @function_timer
-def generate_efficient_curve_buildup_chart(bup_scope: pd.DataFrame, scenarios: list, efficient_curve_window: ctk.CTkFrame, hypothetical_curve_window: ctk.CTkFrame):
+def calculate_scenarios_curves(bup_scope: pd.DataFrame, scenarios: list, scenario_dataframes: dict) -> tuple:
     '''
-    :param bup_scope: DataFrame with Scope and Scenarios
+    Combines Scope and Scenarios and calculates the Efficient/Hypothetical (Parts) curves of each Scenario. No chart is created,
+    so that it is also used headless (see bup_report.py).
+    :param bup_scope: DataFrame with Scope and additional information
     :param scenarios: List with all created Scenarios
-    :param root: CTkFrame in which the Chart will be displayed
+    :param scenario_dataframes: Dict in which the list of DataFrames of each Scenario is (re)created, with Efficient and Hypothetical DFs (Parts)
+    :return: df_scope_with_scenarios, df_dates_eff, df_dates_hyp
     '''
     # --------------- Data Processing ---------------
 
     # List to store combinations of Scenarios and Scope
     combinations = []
 
-    global scenario_dataframes
-
     for _, row in bup_scope.iterrows():
         # Going through each element of the dictionaries list (each element is a Scenario in scenarios_list)
         for index, scenario in enumerate(scenarios):
@@ -921,6 +1984,9 @@ def generate_efficient_curve_buildup_chart(bup_scope: pd.DataFrame, scenarios: l
         lambda linha: linha['PN Order Date Hypothetical'] + pd.DateOffset(days=linha['PN Procurement Length'])
         , axis=1)
 
+    # Present Value of each PN purchase in Efficient and Hypothetical timing (default WACC)
+    df_scope_with_scenarios = calculate_parts_npv(df_scope_with_scenarios, default_wacc_value)
+
     '''
     Getting the Maximum and Minimum Date among all possible dates, to delimit the chart's X axis. Efficient and Hypothetical curve have different min/max dates,
     so it is necessary to create two different timelines.
@@ -1025,46 +2091,101 @@ def generate_efficient_curve_buildup_chart(bup_scope: pd.DataFrame, scenarios: l
             # Storing the DataFrame in the dictionary with the scenario name
             scenario_dataframes[f'Scenario_{int(scenario)}'].append(scenario_df)
 
-    # --------------- Chart Generation ---------------
+    return df_scope_with_scenarios, df_dates_eff, df_dates_hyp
 
+
+def buildup_chart_spec(df_scope_with_scenarios: pd.DataFrame, scenario_dataframes: dict, curve: str) -> dict:
+    '''
+    Extracts the Efficient or Hypothetical Build-Up curves (Parts) of all Scenarios to draw a static Build-Up chart
+    (see chart_rendering.draw_buildup_chart()).
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information
+    :param scenario_dataframes: Dict with the list of DataFrames of each Scenario
+    :param curve: 'eff' (Efficient) or 'hyp' (Hypothetical)
+    :return: Chart spec, with plain lists/NumPy arrays (picklable, to be sent to rendering workers)
+    '''
     # Colors list, so that each Scenario has a specific color and facilitates differentiation
     colors_array = ['blue', 'orange', 'black', 'green', 'purple']
+    df_index, accum_column = (0, 'Accum. Ordered Qty (Eff)') if curve == 'eff' else (1, 'Accum. Delivered Qty (Hyp)')
+
+    scenarios_specs = []
+    for index, scenario_df_list in enumerate(scenario_dataframes.values()):
+        scenario_df = scenario_df_list[df_index]
+        dates = pd.to_datetime(scenario_df['Date'], format='%m/%Y')
+        scenario_dates = df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index].iloc[0]
+
+        if curve == 'eff':
+            # Planning Start (first order released) and BUP finish date (avg between End and Start material delivery date)
+            index_first_order = scenario_df.loc[scenario_df['Ordered Qty'] != 0, 'Ordered Qty'].idxmin()
+            markers = [(dates[index_first_order], scenario_df.loc[index_first_order, accum_column], 'o',
+                        f"Planning Start: {scenario_df.loc[index_first_order, 'Date']}"),
+                       (scenario_dates['avg_date_between_materials_deadline'].to_period('M').to_timestamp(), scenario_df[accum_column].max(), 7, None)]
+        else:
+            # BUP Conclusion (all items delivered)
+            index_max_acc_qty = scenario_df[accum_column].idxmax()
+            markers = [(dates[index_max_acc_qty], scenario_df.loc[index_max_acc_qty, accum_column], 'o',
+                        f"BUP Conclusion: {scenario_df.loc[index_max_acc_qty, 'Date']}")]
+
+        scenarios_specs.append({
+            'dates': dates.to_numpy(),
+            'accumulated': scenario_df[accum_column].to_numpy(dtype=float),
+            'label': f'Scen. {index}',
+            'color': colors_array[index % len(colors_array)],
+            't0': scenario_dates['t0'],
+            'acft_delivery_start': scenario_dates['acft_delivery_start'],
+            'material_delivery_start': scenario_dates['material_delivery_start_date'],
+            'material_delivery_end': scenario_dates['material_delivery_end_date'],
+            'markers': markers
+        })
 
-    # Image size
-    width, height = 680, 435
+    return {
+        'scenarios': scenarios_specs,
+        'title': 'Efficient Curve: Build-Up Forecast' if curve == 'eff' else 'Hypothetical Curve: Build-Up Forecast',
+        'ylabel': 'Materials Ordered Qty (Accumulated)' if curve == 'eff' else 'Materials Delivered Qty (Accumulated)'
+    }
 
-    # Creating a figure and axes to insert the chart
-    fig, ax = plt.subplots(figsize=(width / 100, height / 100),  layout='constrained')
-    # Keeping background transparent
-    fig.patch.set_facecolor("None")
-    fig.patch.set_alpha(0)
-    ax.set_facecolor('None')
 
-    # Eff - Plotting the line for each Scenario in the dictionary
-    for index, (scenario_name, scenario_df_list) in enumerate(scenario_dataframes.items()):
-        axs = ax.plot(scenario_df_list[0]['Date'], scenario_df_list[0]['Accum. Ordered Qty (Eff)'], label=f'Scen. {index}', color=colors_array[index])
-        # Configuring the axis
-        plt.xticks(scenario_df_list[0].index[::3], scenario_df_list[0]['Date'][::3], rotation=45, ha='right')
+@function_timer
+def generate_efficient_curve_buildup_chart(df_scope_with_scenarios: pd.DataFrame, scenario_dataframes: dict, efficient_curve_window: ctk.CTkFrame):
+    '''
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information (see calculate_scenarios_curves())
+    :param scenario_dataframes: Dict with the list of DataFrames of each Scenario
+    :param efficient_curve_window: CTkFrame in which the Chart will be displayed
+    :return: Chart Canvas and Figure (to be saved as Image on demand)
+    '''
 
-        # Getting the t0 date for the current Scenario and converting it to MM/YYYY format
-        t0_date = pd.to_datetime(df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index, 't0'].values[0])
-        t0_date = t0_date.strftime('%m/%Y')
-        # Adding a vertical line at t0
-        ax.axvline(x=t0_date, linestyle='--', color=colors_array[index], label=f't0: Scen. {index}')
+    # --------------- Chart Generation ---------------
 
-        # Getting the acft_delivery_start date for the current Scenario and converting it to MM/YYYY format
-        acft_delivery_start_date = pd.to_datetime(df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index, 'acft_delivery_start'].values[0])
-        acft_delivery_start_date = acft_delivery_start_date.strftime('%m/%Y')
-        # Adding a vertical line in acft_delivery_start
-        ax.axvline(x=acft_delivery_start_date, linestyle='dotted', color=colors_array[index], label=f'Acft Delivery Start: Scen. {index}')
+    # Colors list, so that each Scenario has a specific color and facilitates differentiation
+    colors_array = ['blue', 'orange', 'black', 'green', 'purple']
 
-        # Adding a material delivery range between the Start and End dates
-        material_delivery_start_date = pd.to_datetime(df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index, 'material_delivery_start_date'].values[0])
-        material_delivery_start_date = material_delivery_start_date.strftime('%m/%Y')
-        material_delivery_end_date = pd.to_datetime(df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index, 'material_delivery_end_date'].values[0])
-        material_delivery_end_date = material_delivery_end_date.strftime('%m/%Y')
+    # Persistent chart of Efficient Curve window. Only the new Scenario artists are created
+    buildup_chart = get_buildup_chart(efficient_curve_window, 'Efficient Curve: Build-Up Forecast', 'Materials Ordered Qty (Accumulated)')
+    ax, canvas_eff = buildup_chart['ax'], buildup_chart['canvas']
 
-        ax.axvspan(material_delivery_start_date, material_delivery_end_date, alpha=0.5, color=colors_array[index])
+    # Eff - Updating the line of each Scenario (timeline may have been extended) or plotting it for the new Scenario
+    for index, (scenario_name, scenario_df_list) in enumerate(scenario_dataframes.items()):
+        dates = pd.to_datetime(scenario_df_list[0]['Date'], format='%m/%Y')
+        # Hover texts of each point
+        hover_texts = [f'Ordered Qty: {round(accum_qty)}\nDate {scenario_date}'
+                       for accum_qty, scenario_date in zip(scenario_df_list[0]['Accum. Ordered Qty (Eff)'], scenario_df_list[0]['Date'])]
+
+        if scenario_name in buildup_chart['lines']:
+            buildup_chart['lines'][scenario_name].set_data(dates, scenario_df_list[0]['Accum. Ordered Qty (Eff)'])
+            buildup_chart['hover_lines'][scenario_name] = (buildup_chart['lines'][scenario_name], hover_texts)
+            continue
+
+        axs = ax.plot(dates, scenario_df_list[0]['Accum. Ordered Qty (Eff)'], label=f'Scen. {index}', color=colors_array[index])
+        buildup_chart['lines'][scenario_name] = axs[0]
+        buildup_chart['hover_lines'][scenario_name] = (axs[0], hover_texts)
+
+        # Getting the current Scenario dates
+        scenario_dates = df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index].iloc[0]
+        # Adding a vertical line at t0
+        ax.axvline(x=scenario_dates['t0'], linestyle='--', color=colors_array[index], label=f't0: Scen. {index}')
+        # Adding a vertical line in acft_delivery_start
+        ax.axvline(x=scenario_dates['acft_delivery_start'], linestyle='dotted', color=colors_array[index], label=f'Acft Delivery Start: Scen. {index}')
+        # Adding a material delivery range between the Start and End dates
+        ax.axvspan(scenario_dates['material_delivery_start_date'], scenario_dates['material_delivery_end_date'], alpha=0.5, color=colors_array[index])
 
         # Adding a note at the point where Build-Up planning should start (date when first order is released)
         filter_dates_with_order = scenario_df_list[0]['Ordered Qty'] != 0
@@ -1072,59 +2193,19 @@ def generate_efficient_curve_buildup_chart(bup_scope: pd.DataFrame, scenarios: l
         index_first_order = dates_with_order['Ordered Qty'].idxmin()
         x_first_order = scenario_df_list[0].loc[index_first_order, 'Date']
         y_first_order = scenario_df_list[0].loc[index_first_order, 'Accum. Ordered Qty (Eff)']
-        ax.scatter(x_first_order, y_first_order, color=colors_array[index], marker='o', label=f'Planning Start: {x_first_order}')
+        ax.scatter(dates[index_first_order], y_first_order, color=colors_array[index], marker='o', label=f'Planning Start: {x_first_order}')
 
         # Adding a caretdown (not labeling) in BUP finish date (avg between End and Start material delivery date)
-        # x_bup_finished = scenario_df.loc[0, 'avg_date_between_materials_deadline']
         y_bup_finished = scenario_df_list[0]['Accum. Ordered Qty (Eff)'].max()
-        # Getting the avg_date_between_materials_deadline date for the current Scenario and converting it to MM/YYYY
-        x_bup_finished = pd.to_datetime(df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index,
-                                                                    'avg_date_between_materials_deadline']
-                                        .values[0]).strftime('%m/%Y')
+        x_bup_finished = scenario_dates['avg_date_between_materials_deadline'].to_period('M').to_timestamp()
         ax.scatter(x_bup_finished, y_bup_finished, color=colors_array[index], marker=7, label=None)
 
-    # Chart settings
-    ax.set_ylabel('Materials Ordered Qty (Accumulated)')
-    ax.set_title('Efficient Curve: Build-Up Forecast', color='#ad7102', fontweight='bold')
-    ax.grid(True)
-    ax.tick_params(axis='both', labelsize=9)  # Adjusting labels size
+    # Limits, legend and a single redraw
+    refresh_buildup_chart(buildup_chart, dates)
+    # The figure is returned (not an Image), so that it is only rasterized when the user saves it (see save_chart_image())
+    eff_chart_figure = buildup_chart['fig']
 
-    # Adjusting axis spacing to avoid cutting off labels
-    plt.subplots_adjust(left=0.15, right=0.9, bottom=0.2, top=0.9)
-
-    # Legend
-    ax.legend(loc='upper left', fontsize=7, framealpha=0.8)
-
-    # Annotation function to connect with mplcursors
-    def set_annotations(sel):
-        sel.annotation.set_text(
-            'Ordered Qty: ' + str(round(sel.target[1])) + "\n" +
-            'Date ' + str(scenario_df_list[0]['Date'][round(sel.target.index)])
-        )
-    # Inserting Hover with mplcursors
-    mpc.cursor(axs, hover=True).connect('add', lambda sel: set_annotations(sel))
-
-    # Inserting chart into Canvas
-    canvas_eff = FigureCanvasTkAgg(fig, master=efficient_curve_window)
-    canvas_eff.draw()
-    # Configuring Canvas background
-    canvas_eff.get_tk_widget().configure(background='#cfcfcf')
-    canvas_eff.get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
-
-    # --------------- Turning it into an Image to be displayed ---------------
-
-    # It is necessary to save a chart Image with white background. Transparent is to plot. White to save as a file.
-    tmp_img_eff_chart_whitebg = BytesIO()
-    fig.savefig(tmp_img_eff_chart_whitebg, format='png', transparent=False)
-    tmp_img_eff_chart_whitebg.seek(0)
-
-    # Loading the chart image into an Image object that will be returned by the function
-    bup_eff_chart_whitebg = Image.open(tmp_img_eff_chart_whitebg)
-
-    # ----------- At last, calling function to Generate Charts with Acq Cost ----------- #
-    generate_acqcost_curve(df_scope_with_scenarios, df_dates_eff, df_dates_hyp, scenario_dataframes, efficient_curve_window, hypothetical_curve_window)
-
-    return canvas_eff, bup_eff_chart_whitebg, df_scope_with_scenarios, scenario_dataframes, df_dates_eff, df_dates_hyp
+    return canvas_eff, eff_chart_figure
 
 
 @function_timer
@@ -1133,7 +2214,7 @@ def generate_hypothetical_curve_buildup_chart(df_scope_with_scenarios: pd.DataFr
     Function that creates the Hypothetycal Curve BuildUp Chart.
     param df_scope_with_scenarios: Created DataFrame on Efficient Curve Build-Up construction. Combinations Scope/Scenarios.
     param scenario_dataframes: Dictionary with all scenarios dataframes. Each scenario has a list with 2 DF elements. Efficient and Hypothetical, respectively.
-    return: Returns an Image object and also the Chart Canvas object (FigureCanvasTkAgg): canvas_hyp
+    return: Returns the chart Figure (to be saved as Image on demand) and also the Chart Canvas object (FigureCanvasTkAgg): canvas_hyp
     """
 
     # --------------- Chart Generation ---------------
@@ -1141,112 +2222,121 @@ def generate_hypothetical_curve_buildup_chart(df_scope_with_scenarios: pd.DataFr
     # List of colors, so that each Scenario has a specific color and facilitates differentiation
     colors_array = ['blue', 'orange', 'black', 'green', 'purple']
 
-    # Image Size
-    width, height = 680, 435
-
-    # Creating a figure and axes to insert the chart
-    fig, ax = plt.subplots(figsize=(width / 100, height / 100), layout='constrained')
-    # Keeping background transparent
-    fig.patch.set_facecolor("None")
-    fig.patch.set_alpha(0)
-    ax.set_facecolor('None')
+    # Persistent chart of Hypothetical Curve window. Only the new Scenario artists are created
+    buildup_chart = get_buildup_chart(root, 'Hypothetical Curve: Build-Up Forecast', 'Materials Delivered Qty (Accumulated)')
+    ax, canvas_hyp = buildup_chart['ax'], buildup_chart['canvas']
 
-    # Plotting the line for each Scenario in the dictionary
+    # Updating the line of each Scenario (timeline may have been extended) or plotting it for the new Scenario
     for index, (scenario_name, scenario_df_list) in enumerate(scenario_dataframes.items()):
-        axs = ax.plot(scenario_df_list[1]['Date'], scenario_df_list[1]['Accum. Delivered Qty (Hyp)'], label=f'Scen. {index}',
-                   color=colors_array[index])
-        # Configuring the axis
-        plt.xticks(scenario_df_list[1].index[::3], scenario_df_list[1]['Date'][::3], rotation=45, ha='right')
-
-        # Getting the t0 date for the current Scenario and converting it to MM/YYYY format
-        t0_date = pd.to_datetime(
-            df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index, 't0'].values[0])
-        t0_date = t0_date.strftime('%m/%Y')
-        # Adding a vertical line at t0
-        ax.axvline(x=t0_date, linestyle='--', color=colors_array[index], label=f't0: Scen. {index}')
+        dates = pd.to_datetime(scenario_df_list[1]['Date'], format='%m/%Y')
+        # Hover texts of each point
+        hover_texts = [f'Delivered Qty: {round(accum_qty)}\nDate {scenario_date}'
+                       for accum_qty, scenario_date in zip(scenario_df_list[1]['Accum. Delivered Qty (Hyp)'], scenario_df_list[1]['Date'])]
 
-        # Getting the acft_delivery_start date for the current Scenario and converting it to MM/YYYY format
-        acft_delivery_start_date = pd.to_datetime(
-            df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index, 'acft_delivery_start'].values[0])
-        acft_delivery_start_date = acft_delivery_start_date.strftime('%m/%Y')
-        # Adding a vertical line in acft_delivery_start
-        ax.axvline(x=acft_delivery_start_date, linestyle='dotted', color=colors_array[index],
-                      label=f'Acft Delivery Start: Scen. {index}')
+        if scenario_name in buildup_chart['lines']:
+            buildup_chart['lines'][scenario_name].set_data(dates, scenario_df_list[1]['Accum. Delivered Qty (Hyp)'])
+            buildup_chart['hover_lines'][scenario_name] = (buildup_chart['lines'][scenario_name], hover_texts)
+            continue
 
-        # Adding a material delivery range between the Start and End dates
-        material_delivery_start_date = pd.to_datetime(df_scope_with_scenarios.loc[
-                                                          df_scope_with_scenarios['Scenario'] == index,
-                                                          'material_delivery_start_date'].values[0])
-        material_delivery_start_date = material_delivery_start_date.strftime('%m/%Y')
-        material_delivery_end_date = pd.to_datetime(df_scope_with_scenarios.loc[
-                                                        df_scope_with_scenarios['Scenario'] == index,
-                                                        'material_delivery_end_date'].values[0])
-        material_delivery_end_date = material_delivery_end_date.strftime('%m/%Y')
+        axs = ax.plot(dates, scenario_df_list[1]['Accum. Delivered Qty (Hyp)'], label=f'Scen. {index}',
+                      color=colors_array[index])
+        buildup_chart['lines'][scenario_name] = axs[0]
+        buildup_chart['hover_lines'][scenario_name] = (axs[0], hover_texts)
 
-        ax.axvspan(material_delivery_start_date, material_delivery_end_date, alpha=0.5, color=colors_array[index])
+        # Getting the current Scenario dates
+        scenario_dates = df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index].iloc[0]
+        # Adding a vertical line at t0
+        ax.axvline(x=scenario_dates['t0'], linestyle='--', color=colors_array[index], label=f't0: Scen. {index}')
+        # Adding a vertical line in acft_delivery_start
+        ax.axvline(x=scenario_dates['acft_delivery_start'], linestyle='dotted', color=colors_array[index],
+                   label=f'Acft Delivery Start: Scen. {index}')
+        # Adding a material delivery range between the Start and End dates
+        ax.axvspan(scenario_dates['material_delivery_start_date'], scenario_dates['material_delivery_end_date'], alpha=0.5, color=colors_array[index])
 
         # Adding a note at the point where the Build-Up is completed (all items delivered)
         index_max_acc_qty = scenario_df_list[1]['Accum. Delivered Qty (Hyp)'].idxmax()
         x_max = scenario_df_list[1].loc[index_max_acc_qty, 'Date']
         y_max = scenario_df_list[1].loc[index_max_acc_qty, 'Accum. Delivered Qty (Hyp)']
-        plt.scatter(x_max, y_max, color=colors_array[index], marker='o', label=f'BUP Conclusion: {x_max}')
-
-    # Chart Settings
-    ax.set_ylabel('Materials Delivered Qty (Accumulated)')
-    ax.tick_params(axis='both', labelsize=9)  # Adjusting labels size
-    ax.set_title('Hypothetical Curve: Build-Up Forecast', color='#ad7102', fontweight='bold')
-    ax.grid(True)
-
-    # Adjusting axis spacing to avoid cutting off labels
-    plt.subplots_adjust(left=0.15, right=0.9, bottom=0.2, top=0.9)
-
-    # Legend
-    ax.legend(loc='upper left', fontsize=7, framealpha=0.8)
-
-    # Annotation function to connect with mplcursors
-    def set_annotations(sel):
-        sel.annotation.set_text(
-            'Delivered Qty: ' + str(round(sel.target[1])) + "\n" +
-            'Date ' + str(scenario_df_list[0]['Date'][round(sel.target.index)])
-        )
-
-    # Inserting Hover with mplcursors
-    mpc.cursor(axs, hover=True).connect('add', lambda sel: set_annotations(sel))
-
-    # Inserting chart into Canvas
-    canvas_hyp = FigureCanvasTkAgg(fig, master=root)
-    canvas_hyp.draw()
-    # Configuring Canvas background
-    canvas_hyp.get_tk_widget().configure(background='#cfcfcf')
-    canvas_hyp.get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
+        ax.scatter(dates[index_max_acc_qty], y_max, color=colors_array[index], marker='o', label=f'BUP Conclusion: {x_max}')
 
-    # --------------- Turning it into an Image to be displayed ---------------
+    # Limits, legend and a single redraw
+    refresh_buildup_chart(buildup_chart, dates)
+    # The figure is returned (not an Image), so that it is only rasterized when the user saves it (see save_chart_image())
+    hyp_chart_figure = buildup_chart['fig']
 
-    # It is necessary to save a chart Image with white background. Transparent is to plot. White to save as a file.
-    tmp_img_hyp_chart_whitebg = BytesIO()
-    fig.savefig(tmp_img_hyp_chart_whitebg, format='png', transparent=False)
-    tmp_img_hyp_chart_whitebg.seek(0)
+    return hyp_chart_figure, canvas_hyp
 
-    # Loading the chart image into Image objects that will be returned by the function
-    bup_hyp_chart_whitebg = Image.open(tmp_img_hyp_chart_whitebg)
 
-    return bup_hyp_chart_whitebg, canvas_hyp
+def acqcost_chart_spec(df_acqcost: pd.DataFrame, date_column: str, df_scope_with_scenarios: pd.DataFrame, index: int, color: str,
+                       title: str, ylabel: str) -> dict:
+    '''
+    Extracts from a Scenario Acq Cost DataFrame only what is needed to draw its chart (see chart_rendering.draw_acqcost_chart()).
+    :param df_acqcost: Scenario Acq Cost DataFrame (scenario_df_list[2] for Efficient or scenario_df_list[3] for Hypothetical)
+    :param date_column: Month column (MM/YYYY) of the DataFrame, ex: 'Order Date (Eff)'
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information (Scenario contractual dates)
+    :param index: Scenario number
+    :param color: Scenario color
+    :param title: Chart title
+    :param ylabel: y-axis label
+    :return: Chart spec, with plain lists/NumPy arrays (picklable, to be sent to rendering workers)
+    '''
+    # Contractual dates of the Scenario, in MM/YYYY format (same categories of the x-axis)
+    scenario_info = df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index].iloc[0]
+
+    def month_label(column: str) -> str:
+        return pd.to_datetime(scenario_info[column]).strftime('%m/%Y')
+
+    # Point where the Build-Up is completed (all items delivered)
+    index_max_acc_cost = df_acqcost['Accum. Acq Cost'].idxmax()
+
+    return {
+        'dates': df_acqcost[date_column].tolist(),
+        'monthly': df_acqcost['Total Acq Cost'].to_numpy(dtype=float),
+        'accumulated': df_acqcost['Accum. Acq Cost'].to_numpy(dtype=float),
+        'label': f'Scen. {index}',
+        'color': color,
+        'title': title,
+        'ylabel': ylabel,
+        't0': month_label('t0'),
+        'acft_delivery_start': month_label('acft_delivery_start'),
+        'material_delivery_start': month_label('material_delivery_start_date'),
+        'material_delivery_end': month_label('material_delivery_end_date'),
+        'conclusion': (df_acqcost.loc[index_max_acc_cost, date_column], float(df_acqcost.loc[index_max_acc_cost, 'Accum. Acq Cost']))
+    }
+
+
+def cost_avoidance_chart_spec(df_cost_avoidance: pd.DataFrame, fill_between_mask: np.ndarray, bup_cost: float, color: str,
+                              hyp_t0_start: int) -> dict:
+    '''
+    Extracts from a Scenario Cost Avoidance DataFrame only what is needed to draw its chart (see chart_rendering.draw_cost_avoidance_chart()).
+    :param df_cost_avoidance: Scenario Cost Avoidance DataFrame (scenario_df_list[4])
+    :param fill_between_mask: Months of the Cash Saved area (see calculate_cost_avoidance())
+    :param bup_cost: Build-Up List Total Cost (US$)
+    :param color: Scenario color
+    :param hyp_t0_start: Hypothetical purchase month, after t0
+    :return: Chart spec, with plain lists/NumPy arrays (picklable, to be sent to rendering workers)
+    '''
+    return {
+        'dates': df_cost_avoidance['Date'].tolist(),
+        'eff_accumulated': df_cost_avoidance['Accum. Acq Cost (Eff)'].to_numpy(dtype=float),
+        'hyp_amount': df_cost_avoidance['Acq Amount Hyp'].to_numpy(dtype=float),
+        'fill_between_ctrl': df_cost_avoidance['Fill Between Ctrl Variable'].to_numpy(dtype=float),
+        'fill_between_mask': np.asarray(fill_between_mask, dtype=bool),
+        'bup_cost': bup_cost,
+        'color': color,
+        'hyp_label': f'Hypothetical t0+{str(hyp_t0_start)} Purchase'
+    }
 
 
 @function_timer
-def generate_acqcost_curve(df_scope_with_scenarios: pd.DataFrame, df_dates_eff: pd.DataFrame, df_dates_hyp: pd.DataFrame, scenario_dataframes: dict,
-                           efficient_curve_window: ctk.CTkFrame, hypothetical_curve_window: ctk.CTkFrame):
+def calculate_acqcost_curves(df_scope_with_scenarios: pd.DataFrame, df_dates_eff: pd.DataFrame, df_dates_hyp: pd.DataFrame, scenario_dataframes: dict) -> None:
     '''
-    This function generates Acq Cost charts for both Efficient and Hypothetical curve.
+    Calculates the Monthly and Accumulated Acq Cost curves of each Scenario, for both Efficient and Hypothetical timelines.
     :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information
     :param df_dates_eff: DataFrame with a 'date' Series, with Min and Max range date for Efficient Chart
     :param df_dates_hyp: DataFrame with a 'date' Series, with Min and Max range date for Hypothetical Chart
-    :return: Object FigureCanvasTkAgg, in order to be plotted as soon as the Switches to Acq Cost are toggled. It will be managed by another function.
+    :param scenario_dataframes: Dict with the list of DataFrames of each Scenario, in which Acq Cost DFs are appended (Eff: [2], Hyp: [3])
     '''
-
-    # Global variables to store Acq Cost charts (each Scenario produces a particular Chart)
-    global canvas_list_acqcost_eff, canvas_list_acqcost_hyp
-
     # Hard copy so not to change main df_scope_with_scenarios
     df_acqcost_chart_info = df_scope_with_scenarios.copy()
 
@@ -1334,6 +2424,19 @@ def generate_acqcost_curve(df_scope_with_scenarios: pd.DataFrame, df_dates_eff:
             scenario_dataframes[f'Scenario_{int(scenario)}'].append(scenario_df)
 
 
+@function_timer
+def generate_acqcost_curve(df_scope_with_scenarios: pd.DataFrame, scenario_dataframes: dict,
+                           efficient_curve_window: ctk.CTkFrame, hypothetical_curve_window: ctk.CTkFrame):
+    '''
+    This function generates Acq Cost charts for both Efficient and Hypothetical curve.
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information
+    :param scenario_dataframes: Dict with the list of DataFrames of each Scenario, with Acq Cost curves (see calculate_acqcost_curves())
+    Charts are registered (see register_canvas()) to be built as soon as the Switches to Acq Cost are toggled. It will be managed by another function.
+    '''
+
+    # Global variables to store Acq Cost charts (each Scenario produces a particular Chart)
+    global canvas_list_acqcost_eff, canvas_list_acqcost_hyp
+
     # ------------------------- Chart Generation ------------------------- #
 
     # List of colors, so that each Scenario has a specific color and facilitates differentiation
@@ -1344,112 +2447,14 @@ def generate_acqcost_curve(df_scope_with_scenarios: pd.DataFrame, df_dates_eff:
 
     # Creating the chart for each Scenario, separately
     '''
-    The Canvas objects should be passed as a list, as each Scenario demands a particular Chart (Canvas Object).
-    Everytime that a new Scenario is created, this list is cleared and the object created for each scenario will be appended to list
+    The Canvas keys should be passed as a list, as each Scenario demands a particular Chart (Canvas Object).
+    Everytime that a new Scenario is created, this list is cleared and the key registered for each scenario will be appended to list
     '''
     canvas_list_acqcost_eff.clear()
     canvas_list_acqcost_hyp.clear()
 
-    # Efficient - Acq Cost
-    for index, (scenario_name, scenario_df_list) in enumerate(scenario_dataframes.items()):
-        # Creating a figure and axes to insert the chart
-        fig, ax = plt.subplots(figsize=(width / 100, height / 100), layout='constrained')
-        # Keeping background transparent
-        fig.patch.set_facecolor("None")
-        fig.patch.set_alpha(0)
-        ax.set_facecolor('None')
-
-        # Bars - Monthly Acq Cost
-        bars = ax.bar(scenario_df_list[2]['Order Date (Eff)'], scenario_df_list[2]['Total Acq Cost'],
-                      label=f'Scen. {index}',
-                      color=colors_array[index])
-
-        # Accumulated Line
-        axs = ax.plot(scenario_df_list[2]['Order Date (Eff)'], scenario_df_list[2]['Accum. Acq Cost'],
-                      label=f'Scen. {index}',
-                      color=colors_array[index])
-        # Configuring the axis
-        plt.xticks(scenario_df_list[2].index[::3], scenario_df_list[2]['Order Date (Eff)'][::3], rotation=45, ha='right')
-
-        # Getting the t0 date for the current Scenario and converting it to MM/YYYY format
-        t0_date = pd.to_datetime(
-            df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index, 't0'].values[0])
-        t0_date = t0_date.strftime('%m/%Y')
-        # Adding a vertical line at t0
-        ax.axvline(x=t0_date, linestyle='--', color=colors_array[index], label=f't0: Scen. {index}')
-
-        # Getting the acft_delivery_start date for the current Scenario and converting it to MM/YYYY format
-        acft_delivery_start_date = pd.to_datetime(
-            df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index, 'acft_delivery_start'].values[0])
-        acft_delivery_start_date = acft_delivery_start_date.strftime('%m/%Y')
-        # Adding a vertical line in acft_delivery_start
-        ax.axvline(x=acft_delivery_start_date, linestyle='dotted', color=colors_array[index],
-                   label=f'Acft Delivery Start: Scen. {index}')
-
-        # Adding a material delivery range between the Start and End dates
-        material_delivery_start_date = pd.to_datetime(df_scope_with_scenarios.loc[
-                                                          df_scope_with_scenarios['Scenario'] == index,
-                                                          'material_delivery_start_date'].values[0])
-        material_delivery_start_date = material_delivery_start_date.strftime('%m/%Y')
-        material_delivery_end_date = pd.to_datetime(df_scope_with_scenarios.loc[
-                                                        df_scope_with_scenarios['Scenario'] == index,
-                                                        'material_delivery_end_date'].values[0])
-        material_delivery_end_date = material_delivery_end_date.strftime('%m/%Y')
-
-        ax.axvspan(material_delivery_start_date, material_delivery_end_date, alpha=0.5, color=colors_array[index])
-
-        # Adding a note at the point where the Build-Up is completed (all items delivered)
-        index_max_acc_cost = scenario_df_list[2]['Accum. Acq Cost'].idxmax()
-        x_max = scenario_df_list[2].loc[index_max_acc_cost, 'Order Date (Eff)']
-        y_max = scenario_df_list[2].loc[index_max_acc_cost, 'Accum. Acq Cost']
-        plt.scatter(x_max, y_max, color=colors_array[index], marker='o', label=f'BUP Conclusion: {x_max}')
-
-        # Chart Settings
-        ax.set_ylabel('Acq Cost (US$) Order Qty')
-        ax.tick_params(axis='both', labelsize=9)  # Adjusting labels size
-        ax.set_title(f'Efficient Curve (US$): {scenario_name}', color='green', fontweight='bold')
-        ax.grid(True)
-
-        # Function to format y-axis (float) to money format in million (US$ X M)
-        def y_axis_acqcost_fmt(x, _):
-            return f'U$ {x/1e6:.2f}M'
-        
-        # Setting formatter function for y axis
-        ax.yaxis.set_major_formatter(FuncFormatter(y_axis_acqcost_fmt))
-
-        # Inserting chart into Canvas
-        canvas_acqcost_eff = FigureCanvasTkAgg(fig, master=efficient_curve_window)
-        canvas_acqcost_eff.draw()
-        # Configuring Canvas background
-        canvas_acqcost_eff.get_tk_widget().configure(background='#cfcfcf')
-
-        # Annotation function to connect with mplcursors - Bars
-        def set_annotations_bars_eff(sel):
-            sel.annotation.set_text(
-                'Date: ' + str(scenario_df_list[2]['Order Date (Eff)'][sel.target.index]) + '\n' +
-                'Order Qty: U$' + f"{scenario_df_list[2]['Total Acq Cost'][sel.target.index] / 1e3:.0f}k"        
-            )
-
-        # Annotation function to connect with mplcursors - Lines
-        def set_annotations_lines_eff(sel):
-            order_date = scenario_df_list[2]['Order Date (Eff)'][round(sel.target.index)]
-            accum_acq_cost = scenario_df_list[2]['Accum. Acq Cost'][round(sel.target.index)]
-            sel.annotation.set_text(
-                f'Date: {order_date}\nOrder Qty: U$ {accum_acq_cost / 1e6:.2f}M'
-            )
-
-        # Inserting Hover with mplcursors
-        # Bars
-        mpc.cursor(bars, hover=True).connect('add', lambda sel: set_annotations_bars_eff(sel))
-        # Line
-        mpc.cursor(axs, hover=True).connect('add', lambda sel: set_annotations_lines_eff(sel))
-
-        # Appending to List
-        canvas_list_acqcost_eff.append(canvas_acqcost_eff)
-
-
-    # Hypothetical - Acq Cost
-    for index, (scenario_name, scenario_df_list) in enumerate(scenario_dataframes.items()):
+    # Function that builds the interactive (hover) Acq Cost chart of a Scenario, from the same spec rendered by the workers
+    def build_acqcost_canvas(master: ctk.CTkFrame, spec: dict, qty_description: str):
         # Creating a figure and axes to insert the chart
         fig, ax = plt.subplots(figsize=(width / 100, height / 100), layout='constrained')
         # Keeping background transparent
@@ -1457,112 +2462,72 @@ def generate_acqcost_curve(df_scope_with_scenarios: pd.DataFrame, df_dates_eff:
         fig.patch.set_alpha(0)
         ax.set_facecolor('None')
 
-        # Bars - Monthly Acq Cost
-        bars = ax.bar(scenario_df_list[3]['Delivery Date (Hyp)'], scenario_df_list[3]['Total Acq Cost'],
-                      label=f'Scen. {index}',
-                      color=colors_array[index])
-
-        # Accumulated Line
-        axs = ax.plot(scenario_df_list[3]['Delivery Date (Hyp)'], scenario_df_list[3]['Accum. Acq Cost'],
-                      label=f'Scen. {index}',
-                      color=colors_array[index])
-        # Configuring the axis
-        plt.xticks(scenario_df_list[3].index[::3], scenario_df_list[3]['Delivery Date (Hyp)'][::3], rotation=45, ha='right')
-
-        # Getting the t0 date for the current Scenario and converting it to MM/YYYY format
-        t0_date = pd.to_datetime(
-            df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index, 't0'].values[0])
-        t0_date = t0_date.strftime('%m/%Y')
-        # Adding a vertical line at t0
-        ax.axvline(x=t0_date, linestyle='--', color=colors_array[index], label=f't0: Scen. {index}')
-
-        # Getting the acft_delivery_start date for the current Scenario and converting it to MM/YYYY format
-        acft_delivery_start_date = pd.to_datetime(
-            df_scope_with_scenarios.loc[df_scope_with_scenarios['Scenario'] == index, 'acft_delivery_start'].values[0])
-        acft_delivery_start_date = acft_delivery_start_date.strftime('%m/%Y')
-        # Adding a vertical line in acft_delivery_start
-        ax.axvline(x=acft_delivery_start_date, linestyle='dotted', color=colors_array[index],
-                   label=f'Acft Delivery Start: Scen. {index}')
-
-        # Adding a material delivery range between the Start and End dates
-        material_delivery_start_date = pd.to_datetime(df_scope_with_scenarios.loc[
-                                                          df_scope_with_scenarios['Scenario'] == index,
-                                                          'material_delivery_start_date'].values[0])
-        material_delivery_start_date = material_delivery_start_date.strftime('%m/%Y')
-        material_delivery_end_date = pd.to_datetime(df_scope_with_scenarios.loc[
-                                                        df_scope_with_scenarios['Scenario'] == index,
-                                                        'material_delivery_end_date'].values[0])
-        material_delivery_end_date = material_delivery_end_date.strftime('%m/%Y')
-
-        ax.axvspan(material_delivery_start_date, material_delivery_end_date, alpha=0.5, color=colors_array[index])
-
-        # Adding a note at the point where the Build-Up is completed (all items delivered)
-        index_max_acc_cost = scenario_df_list[3]['Accum. Acq Cost'].idxmax()
-        x_max = scenario_df_list[3].loc[index_max_acc_cost, 'Delivery Date (Hyp)']
-        y_max = scenario_df_list[3].loc[index_max_acc_cost, 'Accum. Acq Cost']
-        plt.scatter(x_max, y_max, color=colors_array[index], marker='o', label=f'BUP Conclusion: {x_max}')
-
-        # Chart Settings
-        ax.set_ylabel('Acq Cost (US$) Delivered Qty')
-        ax.tick_params(axis='both', labelsize=9)  # Adjusting labels size
-        ax.set_title(f'Hypothetical Curve (US$): {scenario_name}', color='green', fontweight='bold')
-        ax.grid(True)
-
-        # Function to format y-axis (float) to money format in million (US$ X M)
-        def y_axis_acqcost_fmt(x, _):
-            return f'U$ {x/1e6:.2f}M'
-        
-        # Setting formatter function for y axis
-        ax.yaxis.set_major_formatter(FuncFormatter(y_axis_acqcost_fmt))
+        bars, axs = chart_rendering.draw_acqcost_chart(ax, spec)
 
         # Inserting chart into Canvas
-        canvas_acqcost_hyp = FigureCanvasTkAgg(fig, master=hypothetical_curve_window)
-        canvas_acqcost_hyp.draw()
+        canvas_acqcost = FigureCanvasTkAgg(fig, master=master)
+        canvas_acqcost.draw()
         # Configuring Canvas background
-        canvas_acqcost_hyp.get_tk_widget().configure(background='#cfcfcf')
+        canvas_acqcost.get_tk_widget().configure(background='#cfcfcf')
 
-        # Annotation function to connect with mplcursors - Bars
-        def set_annotations_bars_hyp(sel):
-            sel.annotation.set_text(
-                'Date: ' + str(scenario_df_list[3]['Delivery Date (Hyp)'][sel.target.index]) + '\n' +
-                'Delivered Qty: U$' + f"{scenario_df_list[3]['Total Acq Cost'][sel.target.index] / 1e3:.0f}k"        
-            )
+        # Hover texts of each month: Bars (monthly) and Line (accumulated)
+        bars_texts = [f'Date: {date}\n{qty_description}: U${monthly_acq_cost / 1e3:.0f}k'
+                      for date, monthly_acq_cost in zip(spec['dates'], spec['monthly'])]
+        line_texts = [f'Date: {date}\n{qty_description}: U$ {accum_acq_cost / 1e6:.2f}M'
+                      for date, accum_acq_cost in zip(spec['dates'], spec['accumulated'])]
 
-        # Annotation function to connect with mplcursors - Lines
-        def set_annotations_lines_hyp(sel):
-            order_date = scenario_df_list[3]['Delivery Date (Hyp)'][round(sel.target.index)]
-            accum_acq_cost = scenario_df_list[3]['Accum. Acq Cost'][round(sel.target.index)]
-            sel.annotation.set_text(
-                f'Date: {order_date}\nDelivered Qty: U$ {accum_acq_cost / 1e6:.2f}M'
-            )
-
-        # Inserting Hover with mplcursors
-        # Bars
-        mpc.cursor(bars, hover=True).connect('add', lambda sel: set_annotations_bars_hyp(sel))
-        # Line
-        mpc.cursor(axs, hover=True).connect('add', lambda sel: set_annotations_lines_hyp(sel))
-
-        # Appending to List
-        canvas_list_acqcost_hyp.append(canvas_acqcost_hyp)
+        # Inserting Hover
+        connect_hover_annotation(canvas_acqcost, ax, series_hover_target(ax, [(axs[0], line_texts)], [(bars, bars_texts)]))
 
+        return canvas_acqcost
 
+    # Registering Acq Cost charts of each Scenario. All of them are rendered at once by the worker processes (see chart_rendering),
+    # and shown as images when selected in the Efficient/Hypothetical screens
+    for index, (scenario_name, scenario_df_list) in enumerate(scenario_dataframes.items()):
+        spec_eff = acqcost_chart_spec(scenario_df_list[2], 'Order Date (Eff)', df_scope_with_scenarios, index, colors_array[index],
+                                      f'Efficient Curve (US$): {scenario_name}', 'Acq Cost (US$) Order Qty')
+        spec_hyp = acqcost_chart_spec(scenario_df_list[3], 'Delivery Date (Hyp)', df_scope_with_scenarios, index, colors_array[index],
+                                      f'Hypothetical Curve (US$): {scenario_name}', 'Acq Cost (US$) Delivered Qty')
+        future_eff = chart_rendering.submit_chart('acqcost', spec_eff, width, height)
+        future_hyp = chart_rendering.submit_chart('acqcost', spec_hyp, width, height)
+
+        register_canvas(f'acqcost_eff:{scenario_name}',
+                        lambda canvas_key=f'acqcost_eff:{scenario_name}', spec=spec_eff, future=future_eff:
+                        build_raster_canvas(canvas_key, efficient_curve_window, future,
+                                            lambda: build_acqcost_canvas(efficient_curve_window, spec, 'Order Qty')))
+        register_canvas(f'acqcost_hyp:{scenario_name}',
+                        lambda canvas_key=f'acqcost_hyp:{scenario_name}', spec=spec_hyp, future=future_hyp:
+                        build_raster_canvas(canvas_key, hypothetical_curve_window, future,
+                                            lambda: build_acqcost_canvas(hypothetical_curve_window, spec, 'Delivered Qty')))
+        # Appending Canvas keys to Lists
+        canvas_list_acqcost_eff.append(f'acqcost_eff:{scenario_name}')
+        canvas_list_acqcost_hyp.append(f'acqcost_hyp:{scenario_name}')
 
 
 @function_timer
 def generate_cost_avoidance_screen(cost_avoidance_screen: ctk.CTkFrame, scenario_dataframes: dict, scenarios_list: list, df_scope_with_scenarios: pd.DataFrame,
-                                   df_dates_eff, df_dates_hyp, bup_cost: float):
+                                   cost_avoidance: dict, bup_cost: float):
+    '''
+    Creates the Cost Avoidance screen (charts, Savings and Procurement Efficiency sensitivity) of all Scenarios.
+    :param cost_avoidance_screen: CTkFrame of Cost Avoidance tab
+    :param scenario_dataframes: Dict with the list of DataFrames of each Scenario, with Cost Avoidance DataFrames [4]
+    :param scenarios_list: List with all created Scenarios
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information
+    :param cost_avoidance: Arrays of all Scenarios (see calculate_cost_avoidance_curves())
+    :param bup_cost: Scope List Value (US$)
+    '''
 
     # Global variable to store charts Canvas (each Scenario produces a particular Chart)
-    global canvas_list_cost_avoidance
+    global canvas_list_cost_avoidance, efficiency_savings_curves, savings_surface, select_cost_avoidance_scenario
+
+    # WACC x Efficiency Savings surface is recalculated (on demand) for the new Scenarios set
+    savings_surface = None
+    # Savings label of each Scenario
+    savings_labels = {}
 
     # WACC
-    wacc_value = 5.42 # Mock 07/10/24 as analyzed in cost of debt proportion. Cost of equity are 13,41% as beta for ERJ is 1.54, 10-Year Tresury rates are 4.1% and 6% ERP.
-    # Equity to Debt ratio is 63/37% so full WACC, considering equity, would be higher as Cost of Equity considers Equity Risk Premium
+    wacc_value = default_wacc_value
     doublevar_wacc = ctk.DoubleVar(cost_avoidance_screen, value=wacc_value)
-    # Calculating monthly Cost of Capital based on WACC variable (compounded mode)
-    monthly_wacc = ((1+(wacc_value/100))**(1/12)-1)*100
-    # Daily Cost of Capital
-    daily_wacc = ((1+(monthly_wacc/100))**(1/30)-1)*100
 
 
     # Colors list, so that each Scenario has a specific color and facilitates differentiation
@@ -1582,10 +2547,13 @@ def generate_cost_avoidance_screen(cost_avoidance_screen: ctk.CTkFrame, scenario
     entry_wacc.place(relx=0.94, rely=0.023, anchor=ctk.CENTER)
 
     # Slider values settings
-    from_value: float = -50
-    to_value: float = +50
-    steps = 100
+    from_value: float = sensitivity_efficiency_values[0]
+    to_value: float = sensitivity_efficiency_values[-1]
+    steps = len(sensitivity_efficiency_values) - 1
     doublevar_operat_eff_variation = ctk.DoubleVar(value=0)
+    # Efficiency change (%) of each slider step (same grid of the WACC x Efficiency surface), and the step of 0% (current Procurement Length)
+    efficiency_values = sensitivity_efficiency_values
+    base_step_index = int(np.argmin(np.abs(efficiency_values)))
 
     # Function to format Cost Avoidance Frame values depending on digits qty
     def format_k_m_pattern(x):
@@ -1597,35 +2565,35 @@ def generate_cost_avoidance_screen(cost_avoidance_screen: ctk.CTkFrame, scenario
             formatted_string = round(abs(x), 2)
         return formatted_string
 
-    # Slider callback function to update Label text
+    # Slider callback function to update Label text. Savings for every slider step are precomputed (see below),
+    # so each drag event is only a lookup on the selected Scenario curve
     def update_label(value):
+        step_index = int(round((value - from_value) / (to_value - from_value) * steps))
+        efficiency_change = efficiency_values[step_index]
+        scenario_sensitivity = efficiency_savings_curves[selected_scenario_name]
+
+        # Simulated Procurement Length (Scenario average) and its variation
+        procur_len_simulated = int(scenario_sensitivity['procurement_length'] * (1 - (efficiency_change/100)))
+        procur_len_variation = int(scenario_sensitivity['procurement_length'] * (efficiency_change/100))
+
+        # Additional Savings/Costs compared to current Procurement Length (0% change)
+        additional_savings = scenario_sensitivity['savings'][step_index] - scenario_sensitivity['savings'][base_step_index]
+
         # If value is positive
-        if doublevar_operat_eff_variation.get() >= 0:
-            lbl_efficiency_variation_num.configure(text=f'Efficiency Gain: +{doublevar_operat_eff_variation.get()}%',
+        if efficiency_change >= 0:
+            lbl_efficiency_variation_num.configure(text=f'Efficiency Gain: +{efficiency_change}%',
                                                    text_color='green')
-            # Calculating Efficiency Gain and new Procurement Length
-            procur_len_simulated = int(355 * (1 - (doublevar_operat_eff_variation.get()/100))) # mock
-            procur_len_gain = int(355 * (0 + (doublevar_operat_eff_variation.get()/100))) # mock
-            lbl_procur_len_simul_num.configure(text=f'{procur_len_simulated} (-{procur_len_gain})', text_color='green')
-
-            # Calculating Additional Savings based on daily Cost of Capital
-            additional_savings = (procur_len_gain * (daily_wacc/100)) * bup_cost
+            lbl_procur_len_simul_num.configure(text=f'{procur_len_simulated} (-{procur_len_variation})', text_color='green')
             # Updating Additional Savings/Cost label
             lbl_additional_savings_simul.configure(text=f'{format_k_m_pattern(additional_savings)}', text_color='green')
 
         # If negative
         else:
-            lbl_efficiency_variation_num.configure(text=f'Efficiency Loss: {doublevar_operat_eff_variation.get()}%',
+            lbl_efficiency_variation_num.configure(text=f'Efficiency Loss: {efficiency_change}%',
                                                    text_color='red')
-            # Calculating Efficiency Loss and new Procurement Length
-            procur_len_simulated = int(355 * (1 - (doublevar_operat_eff_variation.get()/100))) # mock
-            procur_len_loss = int(355 * (0 + (doublevar_operat_eff_variation.get()/100))) # mock
-            lbl_procur_len_simul_num.configure(text=f'{procur_len_simulated} ({procur_len_loss})', text_color='red')
-
-            # Calculating Additional Costs based on daily Cost of Capital
-            additional_costs = (procur_len_loss * (daily_wacc/100)) * bup_cost
+            lbl_procur_len_simul_num.configure(text=f'{procur_len_simulated} ({procur_len_variation})', text_color='red')
             # Updating Additional Savings/Cost label
-            lbl_additional_savings_simul.configure(text=f'-{format_k_m_pattern(additional_costs)}', text_color='red')
+            lbl_additional_savings_simul.configure(text=f'-{format_k_m_pattern(additional_savings)}', text_color='red')
 
     
     # Operational Efficiency Parameters - Full Supply Chain steps
@@ -1668,7 +2636,7 @@ def generate_cost_avoidance_screen(cost_avoidance_screen: ctk.CTkFrame, scenario
                                           font=ctk.CTkFont('open sans', size=11, weight='bold'))
     lbl_scen_procur_length.place(relx=0.5, rely=0.12, anchor=ctk.CENTER)
     # Procurement Length Fixed Number label
-    lbl_scen_procur_length_num = ctk.CTkLabel(procur_length_frame, text="355", #mock
+    lbl_scen_procur_length_num = ctk.CTkLabel(procur_length_frame, text="",
                                           font=ctk.CTkFont('open sans', size=22, weight='bold'))
     lbl_scen_procur_length_num.place(relx=0.5, rely=0.32, anchor=ctk.CENTER)
 
@@ -1677,7 +2645,7 @@ def generate_cost_avoidance_screen(cost_avoidance_screen: ctk.CTkFrame, scenario
                                              font=ctk.CTkFont('open sans', size=11, weight='bold'))
     lbl_procur_len_simulation.place(relx=0.5, rely=0.52, anchor=ctk.CENTER)
     # Procurement Length Simulation number
-    lbl_procur_len_simul_num = ctk.CTkLabel(procur_length_frame, text='355', #mock
+    lbl_procur_len_simul_num = ctk.CTkLabel(procur_length_frame, text='',
                                              font=ctk.CTkFont('open sans', size=22, weight='bold'))
     lbl_procur_len_simul_num.place(relx=0.5, rely=0.72, anchor=ctk.CENTER)
 
@@ -1698,43 +2666,18 @@ def generate_cost_avoidance_screen(cost_avoidance_screen: ctk.CTkFrame, scenario
     lbl_add_savings_and_costs.place(relx=0.5, rely=0.52, anchor=ctk.CENTER)
     
     # --------------------- Cost Avoidance Chart Generation ---------------------
-    consolidated_dates = pd.concat([df_dates_eff, df_dates_hyp], axis=0).drop_duplicates()
-
-    # Creating Cost Avoidance DataFrame for each Scenario
-    for scenario, (scenario_name, scenario_df_list) in enumerate(scenario_dataframes.items()):
-
-        # Adding Efficient Accumulated info - Acq Cost
-        scenario_df_costavoid = consolidated_dates.merge(right=scenario_df_list[2][['Order Date (Eff)', 'Accum. Acq Cost']], how='left',
-                                                         left_on='Date', right_on='Order Date (Eff)')
-        # Renaming Accum. Acq Cost column and droping Order Date (Eff) column
-        scenario_df_costavoid.rename(columns={'Accum. Acq Cost': 'Accum. Acq Cost (Eff)'}, inplace=True)
-        scenario_df_costavoid = scenario_df_costavoid.drop(['Order Date (Eff)'], axis=1)
-
-        # Adding Hypothetical Accumulated info - Acq Cost
-        scenario_df_costavoid = scenario_df_costavoid.merge(right=scenario_df_list[3][['Delivery Date (Hyp)', 'Accum. Acq Cost']], how='left',
-                                                         left_on='Date', right_on='Delivery Date (Hyp)')
-        # Renaming Accum. Acq Cost column and droping Order Date (Eff) column
-        scenario_df_costavoid.rename(columns={'Accum. Acq Cost': 'Accum. Acq Cost (Hyp)'}, inplace=True)
-        scenario_df_costavoid = scenario_df_costavoid.drop(['Delivery Date (Hyp)'], axis=1)
-       
-
-        # test - creating Date column copy as a datetime object in order to compare
-        scenario_df_costavoid['Date_dt'] = pd.to_datetime(scenario_df_costavoid['Date'], format='%m/%Y')
-
-        # Storing the DataFrame in the dictionary with the scenario name
-        scenario_dataframes[f'Scenario_{int(scenario)}'].append(scenario_df_costavoid)
-
     # Creating Chart Canvas for each Scenario, separately
     '''
-    The Canvas objects should be passed as a list, as each Scenario demands a particular Chart (Canvas Object).
-    Everytime that a new Scenario is created, this list is cleared and the object created for each scenario will be appended to list
+    The Canvas keys should be passed as a list, as each Scenario demands a particular Chart (Canvas Object).
+    Everytime that a new Scenario is created, this list is cleared and the key registered for each scenario will be appended to list
     '''
     canvas_list_cost_avoidance.clear()
 
     # Image Size
     width, height = 680, 280
 
-    for index, (scenario_name, scenario_df_list) in enumerate(scenario_dataframes.items()):
+    # Function that builds the Cost Avoidance chart on screen (only if the workers could not render it: the chart has no hover)
+    def build_cost_avoidance_canvas(spec: dict):
 
         # Creating a figure and axes to insert the chart
         fig, ax = plt.subplots(figsize=(width / 100, height / 100), layout='constrained')
@@ -1743,385 +2686,680 @@ def generate_cost_avoidance_screen(cost_avoidance_screen: ctk.CTkFrame, scenario
         fig.patch.set_alpha(0)
         ax.set_facecolor('None')
 
-        # Configuring the axis
-        plt.xticks(scenario_df_list[4].index[::3], scenario_df_list[4]['Date'][::3], rotation=45, ha='right')
-
-        # Efficient Accumulated Line - Acq Cost
-        eff_axs = ax.plot(scenario_df_list[4]['Date'], scenario_df_list[4]['Accum. Acq Cost (Eff)'], label='Efficient Curve', color=colors_array[index],
-                          ls='dashed')
-                
-        # Getting 't0+X' date for current Scenario iterated
-        scenario_pln_start_date = (scenarios_list[index]['t0'] + pd.DateOffset(months=scenarios_list[index]['hyp_t0_start'])).strftime('%m/%Y')
-        scenario_pln_months_from_t0 = scenarios_list[index]['hyp_t0_start']
-        # Getting Build-Up List Total Cost
-        #bup_cost = scenario_df_list[4]['Accum. Acq Cost (Hyp)'].max()
-        # Adding Info to pandas dataframe
-        scenario_df_list[4]['Acq Amount Hyp'] = 0 # It should not be NaN in order to compare in fill_between() method
-        scenario_df_list[4].loc[scenario_df_list[4]['Date'] == scenario_pln_start_date, 'Acq Amount Hyp'] = bup_cost
-
-        # Making every 'Accum. Acq Cost (Eff)' NaN values be 0
-        scenario_df_list[4]['Accum. Acq Cost (Eff)'] = scenario_df_list[4]['Accum. Acq Cost (Eff)'].fillna(0)
-
-
-        # Hypothetical Order Qty (Acq Cost) happens all in 'T0+X' Date. This is the concept of Hypothetical curve. Buying everything all at once, with no cadence, when Planning starts.
-        hyp_axs = ax.bar(scenario_df_list[4]['Date'], scenario_df_list[4]['Acq Amount Hyp'], 
-                         label=f"Hypothetical t0+{str(scenario_pln_months_from_t0)} Purchase", 
-                         color=colors_array[index])      
-        
-        # Creating Control Variable to manage the area to be filled
-        scenario_df_list[4]['Fill Between Ctrl Variable'] = 0
-        # First Acq Cost Amount (Efficient Curve)
-        eff_first_acq_amount = scenario_df_list[4].loc[scenario_df_list[4]['Accum. Acq Cost (Eff)'] != 0, 'Accum. Acq Cost (Eff)'].iloc[0]
-
-
-        # Filling Control Variable
-        scenario_df_list[4].loc[scenario_df_list[4]['Fill Between Ctrl Variable'] == 0, 
-                                'Fill Between Ctrl Variable'] = scenario_df_list[4]['Accum. Acq Cost (Eff)']  # For all 0 values, get the Accumulated Value (Efficient Line)
-        
-        # If the Hypothetical Purchase happens before Efficient Curve Start, I assign the first Efficient Curve purchase to the same date and fill following 0's
-        # with the same value until reaching the Efficient Curve construction
-        # scenario_df_list[4].loc[scenario_df_list[4]['Acq Amount Hyp'] != 0, 'Fill Between Ctrl Variable'] = eff_first_acq_amount  # In Hyp Purchase date
-        
-        # Hypothetical Purchase Date
-        hyp_purchase_date = pd.to_datetime(scenario_pln_start_date, format='%m/%Y')
-        # Efficient Curve Start Date
-        eff_purchase_start_date = scenario_df_list[4].loc[scenario_df_list[4]['Accum. Acq Cost (Eff)'] != 0, 'Date_dt'].iloc[0]
-        
-        # Above mentioned Conditional. If not True, nothing is done
-        if hyp_purchase_date < eff_purchase_start_date:
-            # Assigning first Efficient Curve Purchase to the Hypothetical Purchase date
-            scenario_df_list[4].loc[scenario_df_list[4]['Date_dt'] == hyp_purchase_date, 'Fill Between Ctrl Variable'] = eff_first_acq_amount
-            # Filling forward 0's with this value until reaching Efficient Curve construction
-            first_nonzero_idx_ctrl_var = scenario_df_list[4][scenario_df_list[4]['Fill Between Ctrl Variable'] != 0].index[0]
-            # Updating Fill Between Ctrl Variable with 0's but only when its after the first value allocated
-            scenario_df_list[4].loc[(scenario_df_list[4].index > first_nonzero_idx_ctrl_var) & (scenario_df_list[4]['Fill Between Ctrl Variable'] == 0),
-                                    'Fill Between Ctrl Variable'] = eff_first_acq_amount
-        else:
-            pass
-
-        # Creating Start Date and End Date for Efficient Curve in order to condition 'where' arg on fill_between() method
-        start_date = pd.to_datetime(scenario_pln_start_date, format='%m/%Y')
-
-        end_date = pd.to_datetime(
-            scenario_df_list[4].loc[scenario_df_list[4]['Accum. Acq Cost (Eff)'] != 0, 'Date'].iloc[-1]
-            , format='%m/%Y') # Efficient curve End Date (last month different than 0)
-  
-        # Filling Cost Avoidance area
-        ax.fill_between(x=scenario_df_list[4]['Date'], y1=scenario_df_list[4]['Acq Amount Hyp'].max(), y2=scenario_df_list[4]['Fill Between Ctrl Variable'],
-                        where=((scenario_df_list[4]['Date_dt'] >= start_date) & (scenario_df_list[4]['Date_dt']<= end_date)), interpolate=True, 
-                        color=colors_array[index], alpha=0.2, hatch='\\', label='Cash Saved')
-        
-    
-        # Chart Settings
-        ax.set_ylabel('Acq Cost (US$) Delivered Qty')
-        ax.tick_params(axis='both', labelsize=9)  # Adjusting labels size
-        ax.set_title(f'Cost Avoidance (Efficient Asset Allocation)', color=colors_array[index], fontweight='bold')
-        ax.grid(True)
-        ax.legend(loc='lower right', fontsize=7, framealpha=0.8)
-
-        # Function to format y-axis (float) to money format in million (US$ X M)
-        def y_axis_acqcost_fmt(x, _):
-            return f'U$ {x/1e6:.2f}M'
-        
-        # Setting formatter function for y axis
-        ax.yaxis.set_major_formatter(FuncFormatter(y_axis_acqcost_fmt))
+        chart_rendering.draw_cost_avoidance_chart(ax, spec)
 
         # Inserting chart into Canvas
         canvas_cost_avoidance = FigureCanvasTkAgg(fig, master=cost_avoidance_screen)
         canvas_cost_avoidance.draw()
         # Configuring Canvas background
         canvas_cost_avoidance.get_tk_widget().configure(background='#cfcfcf')
-        canvas_cost_avoidance.get_tk_widget().place(relx=0.5, rely=0.33, anchor=ctk.CENTER)
 
-        # Appending Canvas to List
-        canvas_list_cost_avoidance.append(canvas_cost_avoidance)
+        return canvas_cost_avoidance
 
-        # --------------------------------------------------- SAVINGS CALCULATION ---------------------------------------------------
+    # Label Dynamic Additional Savings/Cost based on Efficiency Gain/Loss
+    lbl_additional_savings_simul = ctk.CTkLabel(cost_avoidance_frame, text='0',
+                        font=ctk.CTkFont('open sans', size=22, weight='bold'),
+                        text_color='green'
+                        )
+    lbl_additional_savings_simul.place(relx=0.5, rely=0.72, anchor=ctk.CENTER)
 
-        # Calculating Scenario Savings between Efficient Curve x Hypothetical t0+X purchase
+    for index, (scenario_name, scenario_df_list) in enumerate(scenario_dataframes.items()):
 
-        # Creating Raw Postponed Column (US$) with Efficient Curve
-        scenario_df_list[4]['Raw Postponed Amount'] = 0
-        # Creating the condition in which the values will be applied (Beginning in the date when Hypothetical Purchase was done)
-        condition = scenario_df_list[4]['Date_dt'] >= hyp_purchase_date
-        # Subtracting the Hypothetical Purchase Amount (Acq Cost) from Efficient Curve to get the difference on each month
-        scenario_df_list[4].loc[condition, 'Raw Postponed Amount'] = bup_cost - scenario_df_list[4].loc[condition, 'Accum. Acq Cost (Eff)']
+        # Rendering Cost Avoidance chart in the worker processes (all Scenarios at once). Registering it and appending its Canvas key to List
+        spec_cost_avoidance = cost_avoidance_chart_spec(scenario_df_list[4], cost_avoidance['fill_between_mask'][index], bup_cost,
+                                                        colors_array[index], scenarios_list[index]['hyp_t0_start'])
+        future_cost_avoidance = chart_rendering.submit_chart('cost_avoidance', spec_cost_avoidance, width, height)
+        register_canvas(f'cost_avoidance:{scenario_name}',
+                        lambda canvas_key=f'cost_avoidance:{scenario_name}', spec=spec_cost_avoidance, future=future_cost_avoidance:
+                        build_raster_canvas(canvas_key, cost_avoidance_screen, future, lambda: build_cost_avoidance_canvas(spec),
+                                            hover=False))
+        canvas_list_cost_avoidance.append(f'cost_avoidance:{scenario_name}')
 
-        # Calculating Monthly Savings
-        scenario_df_list[4]['Postponed Savings (US$)'] = scenario_df_list[4]['Raw Postponed Amount'] * (monthly_wacc/100)
-        
-        # Total Savings Efficient x Hypothetical purchase
-        total_savings_eff = round(scenario_df_list[4]['Postponed Savings (US$)'].sum(), 2)
+        # --------------------------------------------------- SAVINGS CALCULATION ---------------------------------------------------
 
+        # Total Savings Efficient x Hypothetical purchase (calculated for all Scenarios in calculate_cost_avoidance())
+        total_savings_eff = round(cost_avoidance['total_savings'][index], 2)
 
         # Label Efficient Purchase Savings
         lbl_savings_eff = ctk.CTkLabel(cost_avoidance_frame, text=f'{format_k_m_pattern(total_savings_eff)}',
                             font=ctk.CTkFont('open sans', size=22, weight='bold'),
                             text_color='green',
                             )
-        # Label Positioning
-        lbl_savings_eff.place(relx=0.5, rely=0.32, anchor=ctk.CENTER)
 
-        # Label Dynamic Additional Savings/Cost based on Efficiency Gain/Loss
-        lbl_additional_savings_simul = ctk.CTkLabel(cost_avoidance_frame, text='0',
-                            font=ctk.CTkFont('open sans', size=22, weight='bold'),
-                            text_color='green'
-                            )
-        lbl_additional_savings_simul.place(relx=0.5, rely=0.72, anchor=ctk.CENTER)
+        # Keeping each Scenario Savings label, so as to be updated when WACC changes
+        savings_labels[scenario_name] = lbl_savings_eff
+
+    # ------------------------------------------ PROCUREMENT EFFICIENCY SENSITIVITY ------------------------------------------
+
+    # Average PN Procurement Length of each Scenario
+    scenarios_procurement_length = df_scope_with_scenarios.groupby('Scenario')['PN Procurement Length'].mean().to_numpy()
+
+    def update_savings_sensitivity(wacc_value: float) -> None:
+        # Precomputing Postponed Savings for every slider step of all Scenarios, with the real PN Procurement Length of each part
+        scenarios_savings = calculate_savings_surface(df_scope_with_scenarios, [wacc_value], efficiency_values)[:, :, 0]
+        for scenario_index, scenario_name in enumerate(scenario_dataframes.keys()):
+            efficiency_savings_curves[scenario_name] = {
+                'savings': scenarios_savings[scenario_index],
+                'procurement_length': scenarios_procurement_length[scenario_index]
+            }
+
+    update_savings_sensitivity(wacc_value)
+
+    # Function that shows the Cost Avoidance chart and Savings of a Scenario (Cost Avoidance ComboBox). Slider and
+    # Procurement Length labels also start referring to this Scenario
+    def select_scenario(scenario_name: str) -> None:
+        nonlocal selected_scenario_name
+
+        # Hiding the chart and Savings label of the Scenario previously shown
+        if selected_scenario_name is not None:
+            hide_canvas(f'cost_avoidance:{selected_scenario_name}')
+            savings_labels[selected_scenario_name].place_forget()
 
+        selected_scenario_name = scenario_name
+        # The chart is built only in the first time the Scenario is shown
+        get_canvas(f'cost_avoidance:{scenario_name}').get_tk_widget().place(relx=0.5, rely=0.33, anchor=ctk.CENTER)
+        savings_labels[scenario_name].place(relx=0.5, rely=0.32, anchor=ctk.CENTER)
+
+        lbl_scen_procur_length_num.configure(text=f"{round(efficiency_savings_curves[scenario_name]['procurement_length'])}")
+        lbl_procur_len_simul_num.configure(text=f"{round(efficiency_savings_curves[scenario_name]['procurement_length'])}")
+        # Keeping current slider simulation for the selected Scenario
+        if doublevar_operat_eff_variation.get() != 0:
+            update_label(doublevar_operat_eff_variation.get())
+
+    select_cost_avoidance_scenario = select_scenario
+
+    # Showing the last created Scenario
+    selected_scenario_name = None
+    select_scenario(list(scenario_dataframes.keys())[-1])
+
+    # Recalculating Savings when a new WACC is entered (Enter key)
+    def update_wacc(_) -> None:
+        try:
+            new_wacc_value = doublevar_wacc.get()
+        except tk.TclError:
+            messagebox.showerror("Error", "Invalid character. Please enter a valid number for WACC.")
+            return
+
+        update_savings_sensitivity(new_wacc_value)
+        # PN Present Values (exported with Scope with Scenarios) follow the entered WACC
+        calculate_parts_npv(df_scope_with_scenarios, new_wacc_value)
+        for scenario_name, lbl_savings in savings_labels.items():
+            lbl_savings.configure(text=f"{format_k_m_pattern(efficiency_savings_curves[scenario_name]['savings'][base_step_index])}")
+        update_label(doublevar_operat_eff_variation.get())
+
+    entry_wacc.bind('<Return>', update_wacc)
 
 
 @function_timer
-def generate_batches_curve(batches_curve_window: ctk.CTkFrame, scenarios_list: list, df_scope_with_scenarios: pd.DataFrame) :
+def calculate_cost_avoidance_curves(scenario_dataframes: dict, scenarios_list: list, df_scope_with_scenarios: pd.DataFrame, df_dates_eff: pd.DataFrame,
+                                    df_dates_hyp: pd.DataFrame, bup_cost: float, monthly_wacc: float) -> dict:
     '''
-    Function that receives the input so as to generate the Build-Up Curve based on batches.
+    Creates the Cost Avoidance DataFrame of each Scenario, on the common timeline of Efficient and Hypothetical charts.
+    :param scenario_dataframes: Dict with the list of DataFrames of each Scenario, in which Cost Avoidance DF is appended ([4])
+    :param scenarios_list: List with all created Scenarios
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information
+    :param df_dates_eff: DataFrame with Min and Max range date for Efficient Chart
+    :param df_dates_hyp: DataFrame with Min and Max range date for Hypothetical Chart
+    :param bup_cost: Build-Up List Total Cost (US$)
+    :param monthly_wacc: Monthly Cost of Capital (%)
+    :return: Dict with the arrays of all Scenarios (see calculate_cost_avoidance())
     '''
-    # Adding 2 tabs to Batch Charts: Parts Qty & Acq Cost (its inside this function because this screen is generated only if Batches feature was selected)
-    # Global Scope tbv_batch_charts so as to be invoked in BUP_GUI.py
-    global tbv_batch_charts, df_batches_full_info
-    # TabView - Batch Charts
-    tbv_batch_charts = ctk.CTkTabview(batches_curve_window, width=600, height=500, corner_radius=15,
-                                      segmented_button_fg_color="#009898",
-                                      segmented_button_unselected_color="#009898",
-                                      segmented_button_selected_color="#006464",
-                                      bg_color='#cfcfcf', fg_color='#cfcfcf')
-    tbv_batch_charts.pack()
-    tbv_batch_charts.add('Parts Qty')
-    tbv_batch_charts.add('Acq Cost')
+    # Common monthly timeline of Efficient and Hypothetical charts (both ranges contain t0, so their union is continuous)
+    consolidated_months = pd.PeriodIndex(pd.concat([df_dates_eff, df_dates_hyp], axis=0)['Date'], freq='M')
+    consolidated_months = pd.period_range(consolidated_months.min(), consolidated_months.max(), freq='M')
+
+    # Accumulated curves, fill-between envelope and Postponed Savings of all Scenarios at once (scenario x month arrays)
+    cost_avoidance = calculate_cost_avoidance(df_scope_with_scenarios, scenarios_list, consolidated_months, bup_cost, monthly_wacc)
+
+    # Creating Cost Avoidance DataFrame for each Scenario, from the calculated arrays
+    for scenario, scenario_name in enumerate(scenario_dataframes.keys()):
+        scenario_df_costavoid = pd.DataFrame({
+            'Date': cost_avoidance['dates'],
+            'Accum. Acq Cost (Eff)': cost_avoidance['eff_accum_acq_cost'][scenario],
+            'Accum. Acq Cost (Hyp)': cost_avoidance['hyp_accum_acq_cost'][scenario],
+            'Date_dt': consolidated_months.to_timestamp(),
+            'Acq Amount Hyp': cost_avoidance['hyp_acq_amount'][scenario],
+            'Fill Between Ctrl Variable': cost_avoidance['fill_between_ctrl'][scenario],
+            'Raw Postponed Amount': cost_avoidance['raw_postponed_amount'][scenario],
+            'Postponed Savings (US$)': cost_avoidance['postponed_savings'][scenario]
+        })
 
-    # Export to Excel button - Batches Info
+        # Storing the DataFrame in the dictionary with the scenario name
+        scenario_dataframes[scenario_name].append(scenario_df_costavoid)
 
-    # Naming Frames
-    batch_qty_frame = tbv_batch_charts.tab('Parts Qty')
-    batch_cost_frame = tbv_batch_charts.tab('Acq Cost')
+    return cost_avoidance
 
-    # If there's Batch Information, creates the chart, Else: it shows an alert label
-    if scenarios_list[0]['batches_dates'] !=  None:
-
-        # Batches List
-        batches_dates_list = scenarios_list[0]['batches_dates'].split(',')
-        # Convert batches_dates_list to datetime format and sort it ascending
-        batches_dates_list = [datetime.strptime(date.strip(), "%d/%m/%Y") for date in batches_dates_list]
-        batches_dates_list.sort()
-
-        # Creating DataFrame with specific columns for Batch assignment
-        pns_full_procurement_length = df_scope_with_scenarios[['PN', 'Ecode', 'Qty', 'Acq Cost','t0', 'hyp_t0_start', 'PN Procurement Length', 'Delivery Date Hypothetical']]
-        pns_full_procurement_length['planning_start_date'] = pns_full_procurement_length.apply(lambda row: row['t0'] + relativedelta(months=row['hyp_t0_start']), axis=1) 
-
-        # Assigning Part Numbers to specific Batches, being tested on ascending order
-        def assign_batch(row):
-            for i, batch_date in enumerate(batches_dates_list):
-                if row['PN Procurement Length'] <= (batch_date - row['planning_start_date']).days:
-                    return int(i + 1)
+
+@function_timer
+def calculate_cost_avoidance(df_scope_with_scenarios: pd.DataFrame, scenarios_list: list, months: pd.PeriodIndex, bup_cost: float,
+                             monthly_wacc: float) -> dict:
+    '''
+    Calculates the Cost Avoidance series of all Scenarios as 2-D NumPy arrays (scenario x month), with no DataFrame merge by Scenario.
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information
+    :param scenarios_list: List with all created Scenarios
+    :param months: Monthly timeline (Period 'M') of Cost Avoidance charts
+    :param bup_cost: Build-Up List Total Cost (US$)
+    :param monthly_wacc: Monthly Cost of Capital (%)
+    :return: Dict with the arrays used by Cost Avoidance charts and Savings labels
+    '''
+    scenarios_qty = len(scenarios_list)
+    months_qty = len(months)
+    month_index = np.arange(months_qty)[None, :]
+
+    # Parts Total Acq Cost (Qty * Acq Cost) and Scenario of each row
+    parts_cost = (df_scope_with_scenarios['Qty'] * df_scope_with_scenarios['Acq Cost']).fillna(0).to_numpy(dtype=float)
+    parts_scenario = df_scope_with_scenarios['Scenario'].to_numpy(dtype=int)
+
+    # Function to sum up parts cost by Scenario and month position on the timeline (scenario x month)
+    def monthly_acq_cost(date_column: str) -> np.ndarray:
+        month_position = np.clip(df_scope_with_scenarios[date_column].dt.to_period('M').array.asi8 - months.asi8[0],
+                                 0, months_qty - 1)
+        return np.bincount(parts_scenario * months_qty + month_position, weights=parts_cost,
+                           minlength=scenarios_qty * months_qty).reshape(scenarios_qty, months_qty)
+
+    # Efficient purchases happen on PN Order Date, Hypothetical deliveries on Delivery Date Hypothetical
+    eff_monthly_acq_cost = monthly_acq_cost('PN Order Date')
+    eff_accum_acq_cost = np.cumsum(eff_monthly_acq_cost, axis=1)
+    hyp_accum_acq_cost = np.cumsum(monthly_acq_cost('Delivery Date Hypothetical'), axis=1)
+
+    # Hypothetical Purchase (t0+X) month position of each Scenario. Everything is bought at once in this month
+    hyp_purchase_months = pd.PeriodIndex([scenario['t0'] + pd.DateOffset(months=scenario['hyp_t0_start']) for scenario in scenarios_list], freq='M')
+    hyp_purchase_position = (hyp_purchase_months.asi8 - months.asi8[0])[:, None]
+    hyp_acq_amount = np.where(month_index == hyp_purchase_position, bup_cost, 0.0)
+
+    # Efficient Curve Start (first purchase) and End (last purchase) month positions
+    eff_start_position = (eff_monthly_acq_cost != 0).argmax(axis=1)[:, None]
+    eff_end_position = months_qty - 1 - (eff_monthly_acq_cost[:, ::-1] != 0).argmax(axis=1)[:, None]
+    eff_first_acq_amount = np.take_along_axis(eff_accum_acq_cost, eff_start_position, axis=1)
+
+    # If the Hypothetical Purchase happens before Efficient Curve Start, the area to be filled starts with the first
+    # Efficient Curve purchase amount, from Hypothetical Purchase date until reaching the Efficient Curve construction
+    fill_between_ctrl = np.where((month_index >= hyp_purchase_position) & (month_index < eff_start_position),
+                                 eff_first_acq_amount, eff_accum_acq_cost)
+    fill_between_mask = (month_index >= hyp_purchase_position) & (month_index <= eff_end_position)
+
+    # Raw Postponed Amount: difference between Hypothetical Purchase and Efficient Curve on each month since Hypothetical Purchase
+    raw_postponed_amount = np.where(month_index >= hyp_purchase_position, bup_cost - eff_accum_acq_cost, 0.0)
+    postponed_savings = raw_postponed_amount * (monthly_wacc / 100)
+
+    return {
+        'dates': months.strftime('%m/%Y'),
+        'eff_accum_acq_cost': eff_accum_acq_cost,
+        'hyp_accum_acq_cost': hyp_accum_acq_cost,
+        'hyp_acq_amount': hyp_acq_amount,
+        'fill_between_ctrl': fill_between_ctrl,
+        'fill_between_mask': fill_between_mask,
+        'raw_postponed_amount': raw_postponed_amount,
+        'postponed_savings': postponed_savings,
+        'total_savings': postponed_savings.sum(axis=1)
+    }
+
+
+@function_timer
+def calculate_parts_npv(df_scope_with_scenarios: pd.DataFrame, wacc_value: float) -> pd.DataFrame:
+    '''
+    Calculates, for each PN of each Scenario, the Present Value (at Scenario t0) of its purchase (Qty * Acq Cost) in Efficient
+    timing (PN Order Date) and in Hypothetical timing (t0+X), discounted by WACC. Discount factors are calculated as
+    (parts x scenarios) arrays, with no row-wise apply.
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information
+    :param wacc_value: WACC (% in US$), annual
+    :return: df_scope_with_scenarios with 'Total Acq Cost', 'PV Efficient (US$)', 'PV Hypothetical (US$)' and 'NPV Savings (US$)' columns
+    '''
+    # Rows grouped by Scenario (every Scenario has the same parts), so the columns can be reshaped to (parts x scenarios)
+    scenarios_order = np.argsort(df_scope_with_scenarios['Scenario'].to_numpy(), kind='stable')
+    scenarios_qty = df_scope_with_scenarios['Scenario'].nunique()
+
+    def parts_by_scenarios(values: np.ndarray) -> np.ndarray:
+        return values[scenarios_order].reshape(scenarios_qty, -1).T
+
+    parts_cost = parts_by_scenarios((df_scope_with_scenarios['Qty'] * df_scope_with_scenarios['Acq Cost']).fillna(0).to_numpy(dtype=float))
+    t0 = parts_by_scenarios(df_scope_with_scenarios['t0'].to_numpy(dtype='datetime64[ns]'))
+    eff_order_date = parts_by_scenarios(df_scope_with_scenarios['PN Order Date'].to_numpy(dtype='datetime64[ns]'))
+    hyp_order_date = parts_by_scenarios(df_scope_with_scenarios['PN Order Date Hypothetical'].to_numpy(dtype='datetime64[ns]'))
+
+    # Discount factors from each order date back to Scenario t0 (annual WACC, compounded daily)
+    eff_discount_factor = (1 + (wacc_value/100)) ** (-((eff_order_date - t0) / np.timedelta64(1, 'D')) / 365)
+    hyp_discount_factor = (1 + (wacc_value/100)) ** (-((hyp_order_date - t0) / np.timedelta64(1, 'D')) / 365)
+
+    pv_eff = parts_cost * eff_discount_factor
+    pv_hyp = parts_cost * hyp_discount_factor
+
+    # Going back from (parts x scenarios) to the DataFrame rows order
+    def to_rows(values: np.ndarray) -> np.ndarray:
+        rows_values = np.empty(len(scenarios_order))
+        rows_values[scenarios_order] = values.T.ravel()
+        return rows_values
+
+    df_scope_with_scenarios['Total Acq Cost'] = to_rows(parts_cost)
+    df_scope_with_scenarios['PV Efficient (US$)'] = to_rows(pv_eff).round(2)
+    df_scope_with_scenarios['PV Hypothetical (US$)'] = to_rows(pv_hyp).round(2)
+    # Savings of postponing each purchase to its Efficient order date
+    df_scope_with_scenarios['NPV Savings (US$)'] = to_rows(pv_hyp - pv_eff).round(2)
+
+    return df_scope_with_scenarios
+
+
+def aggregate_parts_npv(df_scope_with_scenarios: pd.DataFrame, group_column: str) -> pd.DataFrame:
+    '''
+    Sums up PN Present Values by Scenario and any Scope column (ex: 'SPC', 'EIS Critical').
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information, with NPV columns
+    :param group_column: Column to aggregate by
+    :return: DataFrame with Total Acq Cost, PV Efficient, PV Hypothetical and NPV Savings for each Scenario/group
+    '''
+    npv_columns = ['Total Acq Cost', 'PV Efficient (US$)', 'PV Hypothetical (US$)', 'NPV Savings (US$)']
+
+    return df_scope_with_scenarios.groupby(['Scenario', group_column])[npv_columns].sum().reset_index()
+
+
+def calculate_savings_surface(df_scope_with_scenarios: pd.DataFrame, wacc_values: np.ndarray, efficiency_values: np.ndarray) -> np.ndarray:
+    '''
+    Computes Postponed Savings (US$) for every Scenario x Procurement Efficiency change x WACC in one NumPy broadcast.
+    The change is applied to the PN Procurement Length of each part (Efficient Order Date = Materials Deadline -
+    Procurement Length * (1 - change)). As every part shares the same Materials Deadline in a Scenario, a part is still
+    not ordered in a month while its Procurement Length is below a threshold, so the Raw Postponed Amount monthly series
+    is a cumulative sum over parts sorted by Procurement Length (one binary search for the whole grid).
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information
+    :param wacc_values: WACC values (% in US$)
+    :param efficiency_values: Efficiency changes (%), ex: +10 for 10% shorter Procurement Length
+    :return: Array (scenario x efficiency x wacc) with Postponed Savings (US$)
+    '''
+    df_parts = df_scope_with_scenarios.sort_values('Scenario', kind='stable')
+    scenarios_qty = df_parts['Scenario'].nunique()
+
+    # Parts (scenario x part) sorted by Procurement Length, with cumulative Total Acq Cost for each Scenario
+    procurement_length = df_parts['PN Procurement Length'].to_numpy(dtype=float).reshape(scenarios_qty, -1)
+    parts_cost = (df_parts['Qty'] * df_parts['Acq Cost']).fillna(0).to_numpy().reshape(scenarios_qty, -1)
+    sort_index = np.argsort(procurement_length, axis=1, kind='stable')
+    sorted_procurement_length = np.take_along_axis(procurement_length, sort_index, axis=1)
+    cumulative_cost = np.concatenate((np.zeros((scenarios_qty, 1)), np.cumsum(np.take_along_axis(parts_cost, sort_index, axis=1), axis=1)), axis=1)
+
+    # Common monthly grid among Scenarios, from the first Hypothetical Purchase month (t0+X) until the last Materials Deadline
+    scenarios_dates = df_parts.groupby('Scenario', sort=True)[['PN Order Date Hypothetical', 'avg_date_between_materials_deadline']].first()
+    hyp_purchase_months = scenarios_dates['PN Order Date Hypothetical'].dt.to_period('M')
+    materials_deadline = scenarios_dates['avg_date_between_materials_deadline'].to_numpy()
+    months = pd.period_range(hyp_purchase_months.min(), scenarios_dates['avg_date_between_materials_deadline'].max().to_period('M'), freq='M')
+    # Days between the start of the following month and Materials Deadline (scenario x month)
+    days_to_deadline = (materials_deadline[:, None] - (months + 1).to_timestamp().to_numpy()[None, :]) / np.timedelta64(1, 'D')
+
+    # Thresholds (scenario x efficiency x month), clipped and shifted by Scenario so a single searchsorted handles all rows
+    thresholds = days_to_deadline[:, None, :] / (1 - (np.asarray(efficiency_values, dtype=float)[None, :, None] / 100))
+    max_length = sorted_procurement_length.max() + 1
+    row_offset = (np.arange(scenarios_qty) * (max_length + 2))[:, None]
+    flat_positions = np.searchsorted((sorted_procurement_length + row_offset).ravel(),
+                                     (np.clip(thresholds, -1, max_length) + row_offset[:, :, None]).ravel(), side='right')
+    parts_qty = procurement_length.shape[1]
+    # Number of parts not ordered yet in each Scenario row
+    not_ordered_qty = flat_positions.reshape(thresholds.shape) - (np.arange(scenarios_qty) * parts_qty)[:, None, None]
+    raw_postponed_amount = np.take_along_axis(cumulative_cost, not_ordered_qty.reshape(scenarios_qty, -1), axis=1).reshape(thresholds.shape)
+
+    # Only months since the Hypothetical Purchase of each Scenario are postponed
+    hyp_purchase_mask = months.asi8[None, :] >= pd.PeriodIndex(hyp_purchase_months).asi8[:, None]
+    raw_postponed_amount = raw_postponed_amount * hyp_purchase_mask[:, None, :]
+
+    # Postponed Savings (scenario x efficiency x wacc)
+    monthly_wacc_values = calculate_monthly_wacc(np.asarray(wacc_values, dtype=float))
+    return raw_postponed_amount.sum(axis=2)[:, :, None] * (monthly_wacc_values[None, None, :] / 100)
+
+
+def get_savings_surface() -> dict:
+    '''
+    Returns Postponed Savings for the WACC x Procurement Efficiency grid of all Scenarios, calculating it only once for
+    each Scenarios set (it is reset when Cost Avoidance screen is generated).
+    '''
+    global savings_surface
+
+    if savings_surface is None:
+        savings_surface = {
+            'scenarios': list(scenario_dataframes.keys()),
+            'wacc_values': sensitivity_wacc_values,
+            'efficiency_values': sensitivity_efficiency_values,
+            'savings': calculate_savings_surface(df_scope_with_scenarios, sensitivity_wacc_values, sensitivity_efficiency_values)
+        }
+
+    return savings_surface
+
+
+def get_savings_surface_dataframe() -> pd.DataFrame:
+    # Savings surface in a tabular format (one row for each Scenario/WACC/Efficiency combination), in order to be exported
+    surface = get_savings_surface()
+    scenarios, efficiency, wacc = np.meshgrid(surface['scenarios'], surface['efficiency_values'], surface['wacc_values'], indexing='ij')
+
+    return pd.DataFrame({
+        'Scenario': scenarios.ravel(),
+        'WACC (%)': wacc.ravel(),
+        'Efficiency Change (%)': efficiency.ravel(),
+        'Postponed Savings (US$)': surface['savings'].ravel().round(2)
+    })
+
+
+@function_timer
+def generate_savings_heatmap(root: ctk.CTkToplevel, scenario_name: str):
+    '''
+    Creates the WACC x Procurement Efficiency heatmap of Postponed Savings for a Scenario.
+    :param root: Window in which the chart will be inserted
+    :param scenario_name: Scenario to be shown, ex: 'Scenario_0'
+    :return: Chart Canvas
+    '''
+    surface = get_savings_surface()
+    scenario_index = surface['scenarios'].index(scenario_name)
+
+    # Image size
+    width, height = 680, 435
+    fig, ax = plt.subplots(figsize=(width / 100, height / 100), layout='constrained')
+
+    # Heatmap (y-axis: Efficiency Change, x-axis: WACC). Each cell is centered on its WACC/Efficiency value (half a step around it)
+    wacc_half_step = (surface['wacc_values'][1] - surface['wacc_values'][0]) / 2
+    efficiency_half_step = (surface['efficiency_values'][1] - surface['efficiency_values'][0]) / 2
+    heatmap = ax.imshow(surface['savings'][scenario_index], origin='lower', aspect='auto', cmap='RdYlGn',
+                        extent=[surface['wacc_values'][0] - wacc_half_step, surface['wacc_values'][-1] + wacc_half_step,
+                                surface['efficiency_values'][0] - efficiency_half_step,
+                                surface['efficiency_values'][-1] + efficiency_half_step])
+
+    # Reference lines: default WACC and current Procurement Length (0% change)
+    ax.axvline(x=default_wacc_value, linestyle='--', color='black', label=f'WACC: {default_wacc_value}%')
+    ax.axhline(y=0, linestyle='dotted', color='black', label='Current Procurement Length')
+
+    # Function to format colorbar (float) to money format in million (US$ X M)
+    def savings_fmt(x, _):
+        return f'U$ {x/1e6:.2f}M'
+
+    fig.colorbar(heatmap, ax=ax, format=FuncFormatter(savings_fmt))
+
+    # Chart Settings
+    ax.set_xlabel('WACC (% in US$)')
+    ax.set_ylabel('Procurement Efficiency Change (%)')
+    ax.tick_params(axis='both', labelsize=9)  # Adjusting labels size
+    ax.set_title(f'Postponed Savings (US$): {scenario_name}', color='green', fontweight='bold')
+    ax.legend(loc='lower right', fontsize=7, framealpha=0.8)
+
+    # Inserting chart into Canvas
+    canvas_heatmap = FigureCanvasTkAgg(fig, master=root)
+    canvas_heatmap.draw()
+    canvas_heatmap.get_tk_widget().pack(padx=10, pady=10)
+
+    return canvas_heatmap
+
+
+def solve_batches_months(ready_months: np.ndarray, parts_cost: np.ndarray, batches_qty: int, monthly_wacc: float) -> np.ndarray:
+    '''
+    Dynamic Programming that chooses the Batch months minimizing the carrying cost of parts that are ready (procurement
+    length met) before their Batch month. Each part goes to the first Batch on/after its ready month, as in assign_batch().
+    An optimal Batch always lies on a ready month, so only the sorted distinct ready months are candidates, and the
+    cost of serving a range of months with one Batch is O(1) with prefix sums.
+    :param ready_months: Month number (year * 12 + month) in which each part is ready
+    :param parts_cost: Total Acq Cost (Qty * Acq Cost) of each part
+    :param batches_qty: Number of Batches to be chosen
+    :param monthly_wacc: Monthly Cost of Capital (%)
+    :return: Chosen Batch months (same unit of ready_months), ascending
+    '''
+    if batches_qty < 1:
+        raise ValueError(f'Batches Quantity must be at least 1 (got {batches_qty}).')
+
+    # Grouping parts Total Acq Cost by distinct ready month (sorted)
+    months, inverse = np.unique(ready_months, return_inverse=True)
+    months_cost = np.bincount(inverse, weights=parts_cost)
+    months_qty = len(months)
+    batches_qty = min(batches_qty, months_qty)
+
+    # Carrying growth factor from each ready month. Months relative to the first one, so as to keep factors small
+    growth = 1 + (monthly_wacc / 100)
+    relative_months = months - months[0]
+    prefix_cost = np.concatenate(([0], np.cumsum(months_cost)))
+    prefix_discounted_cost = np.concatenate(([0], np.cumsum(months_cost * growth ** (-relative_months.astype(float)))))
+
+    # range_cost[s, e]: carrying cost of ready months s..e being delivered in a Batch on month e
+    start = np.arange(months_qty)[:, None]
+    end = np.arange(months_qty)[None, :]
+    range_cost = (growth ** relative_months[end].astype(float) * (prefix_discounted_cost[end + 1] - prefix_discounted_cost[start])
+                  - (prefix_cost[end + 1] - prefix_cost[start]))
+    range_cost = np.where(start <= end, range_cost, np.inf)
+
+    # best_cost[e]: minimum cost covering ready months 0..e with the current number of Batches, the last one on month e
+    best_cost = range_cost[0].copy()
+    previous_batch = []
+    for _ in range(1, batches_qty):
+        # Previous Batch on month s-1 and the new one covering s..e
+        candidates = np.full((months_qty, months_qty), np.inf)
+        candidates[1:] = best_cost[:-1, None] + range_cost[1:]
+        previous_batch.append(np.argmin(candidates, axis=0) - 1)
+        best_cost = np.min(candidates, axis=0)
+
+    # Backtracking the chosen months, starting from the last Batch (it must cover the last ready month)
+    chosen_indexes = [months_qty - 1]
+    for previous in reversed(previous_batch):
+        chosen_indexes.append(previous[chosen_indexes[-1]])
+
+    return months[np.array(chosen_indexes[::-1])]
+
+
+@function_timer
+def optimize_batches_dates(bup_scope: pd.DataFrame, scenario: dict, batches_qty: int, wacc_value: float = default_wacc_value) -> list:
+    '''
+    Picks the Batch Dates (month ends) for a Scenario minimizing the WACC-based carrying cost of early purchases, meeting
+    every part Procurement Length (Leadtime + Scenario full procurement length, counted from Planning Start t0+X).
+    :param bup_scope: DataFrame with scope and additional information
+    :param scenario: Scenario dict, with 't0', 'hyp_t0_start' and 'full_procurement_length'
+    :param batches_qty: Number of Batches
+    :param wacc_value: WACC (% in US$) used to get the monthly Cost of Capital
+    :return: List with Batch Dates (datetime), ascending
+    '''
+    planning_start_date = scenario['t0'] + relativedelta(months=scenario['hyp_t0_start'])
+
+    # Date in which each part is ready to be delivered (Procurement Length met)
+    procurement_length = bup_scope['Leadtime'].to_numpy() + scenario['full_procurement_length']
+    ready_dates = pd.DatetimeIndex(planning_start_date + pd.to_timedelta(procurement_length, unit='D'))
+    ready_months = ready_dates.year.to_numpy() * 12 + ready_dates.month.to_numpy() - 1
+
+    parts_cost = (bup_scope['Qty'] * bup_scope['Acq Cost']).fillna(0).to_numpy()
+
+    batches_months = solve_batches_months(ready_months, parts_cost, batches_qty, calculate_monthly_wacc(wacc_value))
+
+    # Batch Dates on month end, so that every part ready in that month fits on its Batch
+    return [datetime(int(month // 12), int(month % 12) + 1, 1) + relativedelta(day=31) for month in batches_months]
+
+
+@function_timer
+def calculate_batches(scenarios_list: list, df_scope_with_scenarios: pd.DataFrame) -> dict:
+    '''
+    Assigns each PN to the first Batch (of the first Scenario Batch Dates) that meets its Procurement Length, and groups Parts
+    Qty/Acq Cost by Hypothetical Delivery Month.
+    :param scenarios_list: List with all created Scenarios
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information
+    :return: Dict with 'parts' (Batch of each PN), 'qty' and 'acq_cost' (grouped by Delivery Month) and 'batches' (one row per Batch)
+    '''
+    # Batches List
+    batches_dates_list = scenarios_list[0]['batches_dates'].split(',')
+    # Convert batches_dates_list to datetime format and sort it ascending
+    batches_dates_list = [datetime.strptime(date.strip(), "%d/%m/%Y") for date in batches_dates_list]
+    batches_dates_list.sort()
+
+    # Creating DataFrame with specific columns for Batch assignment
+    pns_full_procurement_length = df_scope_with_scenarios[['PN', 'Ecode', 'Qty', 'Acq Cost','t0', 'hyp_t0_start', 'PN Procurement Length', 'Delivery Date Hypothetical']]
+    pns_full_procurement_length['planning_start_date'] = pns_full_procurement_length.apply(lambda row: row['t0'] + relativedelta(months=row['hyp_t0_start']), axis=1) 
+
+    # Assigning Part Numbers to specific Batches, being tested on ascending order
+    def assign_batch(row):
+        for i, batch_date in enumerate(batches_dates_list):
+            if row['PN Procurement Length'] <= (batch_date - row['planning_start_date']).days:
+                return int(i + 1)
+        return 'No Batch Assigned'
+
+    pns_full_procurement_length['Batch'] = pns_full_procurement_length.apply(assign_batch, axis=1)
+
+    # Create a new column 'Batch Date' based on the Batch number or 'No Batch Assigned'
+    def assign_batch_date(row):
+        if row['Batch'] == 'No Batch Assigned':
             return 'No Batch Assigned'
-        
-        pns_full_procurement_length['Batch'] = pns_full_procurement_length.apply(assign_batch, axis=1)
+        else:
+            # return batches_dates_list[row['Batch'] - 1]
+            return batches_dates_list[row['Batch'] - 1].strftime("%d/%m/%Y")
+
+    pns_full_procurement_length['Batch Date'] = pns_full_procurement_length.apply(assign_batch_date, axis=1)
+    # Creating Delivery Month Date, so as to be the X-axis of Batches charts
+    pns_full_procurement_length['Delivery Month Hyp'] = pns_full_procurement_length['Delivery Date Hypothetical'].dt.to_period('M')
+    # Creating Total Part Acq Cost column (Acq Cost * Qty)
+    pns_full_procurement_length['Total Part Acq Cost'] = round(pns_full_procurement_length['Acq Cost'] * pns_full_procurement_length['Qty'], 2)
+
+    # Creating Grouped Sum Qty DataFrame to Generate Batches bar chart
+    df_grouped_qty_delivery_date = (
+        pns_full_procurement_length
+        .groupby('Delivery Month Hyp')['PN']
+        .nunique()
+        .sort_index()
+        .reset_index()
+        .rename(columns={'PN': 'Distinct PNs Count'})
+    )
 
-        # Create a new column 'Batch Date' based on the Batch number or 'No Batch Assigned'
-        def assign_batch_date(row):
-            if row['Batch'] == 'No Batch Assigned':
-                return 'No Batch Assigned'
-            else:
-                # return batches_dates_list[row['Batch'] - 1]
-                return batches_dates_list[row['Batch'] - 1].strftime("%d/%m/%Y")
-
-        pns_full_procurement_length['Batch Date'] = pns_full_procurement_length.apply(assign_batch_date, axis=1)
-        # Creating Delivery Month Date, so as to be the X-axis of Batches charts
-        pns_full_procurement_length['Delivery Month Hyp'] = pns_full_procurement_length['Delivery Date Hypothetical'].dt.to_period('M')
-        # Creating Total Part Acq Cost column (Acq Cost * Qty)
-        pns_full_procurement_length['Total Part Acq Cost'] = round(pns_full_procurement_length['Acq Cost'] * pns_full_procurement_length['Qty'], 2)
-
-        # Creating Grouped Sum Qty DataFrame to Generate Batches bar chart
-        df_grouped_qty_delivery_date = (
-            pns_full_procurement_length
-            .groupby('Delivery Month Hyp')['PN']
-            .nunique()
-            .sort_index()
-            .reset_index()
-            .rename(columns={'PN': 'Distinct PNs Count'})
-        )
+    # Creating Cumulative Sum Qty to Generate Batches line chart
+    df_grouped_qty_delivery_date['Cumulative Sum Qty'] = df_grouped_qty_delivery_date['Distinct PNs Count'].cumsum()
+
+    # Creating Grouped Acq Cost DataFrame to Generate Batches bar chart
+    df_grouped_acqcost_delivery_date = (
+        pns_full_procurement_length
+        .assign(AcqCostQty= lambda x: round(x['Acq Cost'] * x['Qty'], 2))
+        .groupby('Delivery Month Hyp')['AcqCostQty']
+        .sum()
+        .sort_index()
+        .reset_index()
+        .rename(columns={'AcqCostQty': 'Total Acq Cost'})
+    )
 
-        # Creating Cumulative Sum Qty to Generate Batches line chart
-        df_grouped_qty_delivery_date['Cumulative Sum Qty'] = df_grouped_qty_delivery_date['Distinct PNs Count'].cumsum()
-
-        # Creating Grouped Acq Cost DataFrame to Generate Batches bar chart
-        df_grouped_acqcost_delivery_date = (
-            pns_full_procurement_length
-            .assign(AcqCostQty= lambda x: round(x['Acq Cost'] * x['Qty'], 2))
-            .groupby('Delivery Month Hyp')['AcqCostQty']
-            .sum()
-            .sort_index()
-            .reset_index()
-            .rename(columns={'AcqCostQty': 'Total Acq Cost'})
-        )
+    # Creating Cumulative Sum Qty to Generate Acq Cost Batches line chart
+    df_grouped_acqcost_delivery_date['Cumulative Acq Cost Qty'] = df_grouped_acqcost_delivery_date['Total Acq Cost'].cumsum()
 
-        # Creating Cumulative Sum Qty to Generate Acq Cost Batches line chart
-        df_grouped_acqcost_delivery_date['Cumulative Acq Cost Qty'] = df_grouped_acqcost_delivery_date['Total Acq Cost'].cumsum()
+    # For AXVSpan Batches chart insertion, further transformation is necessary
+    df_batches = (
+        pns_full_procurement_length
+        .groupby(['Batch', 'Batch Date'])['Ecode']
+        .nunique()
+        .reset_index()
+        .rename(columns={'Ecode': 'PNs Qty'})
+    )
 
-        # For AXVSpan Batches chart insertion, further transformation is necessary
-        df_batches = (
-            pns_full_procurement_length
-            .groupby(['Batch', 'Batch Date'])['Ecode']
-            .nunique()
-            .reset_index()
-            .rename(columns={'Ecode': 'PNs Qty'})
-        )
+    # As it is for visualizing purposes only, I remove 'No Batch Assigned' rows
+    df_batches = df_batches[df_batches['Batch'] != 'No Batch Assigned'].reset_index(drop=True)
+
+    # Initializing new Batch Start Date column as a variable at first
+    batch_start_date = []
+    # Now I create the column Batch Start Date (date of Last Batch end or Planning Start)
+    for i in range(len(df_batches)):
+        # First Batch will have the Planning Date as Start Date
+        if i == 0:
+            start_date = pns_full_procurement_length.loc[0, 'planning_start_date'].strftime('%d/%m/%Y')
+        # Other rows: use previous batch date
+        else:
+            start_date = df_batches.loc[i - 1, 'Batch Date']
 
-        # Copying content from pns_full_procurement_length to df_batches_full_info
-        df_batches_full_info = pns_full_procurement_length.copy()
-
-        # As it is for visualizing purposes only, I remove 'No Batch Assigned' rows
-        df_batches = df_batches[df_batches['Batch'] != 'No Batch Assigned'].reset_index(drop=True)
-
-        # Initializing new Batch Start Date column as a variable at first
-        batch_start_date = []
-        # Now I create the column Batch Start Date (date of Last Batch end or Planning Start)
-        for i in range(len(df_batches)):
-            # First Batch will have the Planning Date as Start Date
-            if i == 0:
-                start_date = pns_full_procurement_length.loc[0, 'planning_start_date'].strftime('%d/%m/%Y')
-            # Other rows: use previous batch date
-            else:
-                start_date = df_batches.loc[i - 1, 'Batch Date']
+        # Appending to list
+        batch_start_date.append(start_date)
 
-            # Appending to list
-            batch_start_date.append(start_date)
+    # Creating Batch Start Date column
+    df_batches['Batch Start Date'] = batch_start_date
+    # Converting to datetime so as to match the other charts format
+    df_batches[['Batch Start Date', 'Batch Date']] = df_batches[['Batch Start Date', 'Batch Date']].apply(
+        lambda col: pd.to_datetime(col, format='%d/%m/%Y')
+    )
 
-        # Creating Batch Start Date column
-        df_batches['Batch Start Date'] = batch_start_date
-        # Converting to datetime so as to match the other charts format
-        df_batches[['Batch Start Date', 'Batch Date']] = df_batches[['Batch Start Date', 'Batch Date']].apply(
-            lambda col: pd.to_datetime(col, format='%d/%m/%Y')
-        )
+    # Adding Acq Cost (US$) per Batch info
+    total_acq_cost_batch = pns_full_procurement_length.groupby('Batch Date')['Total Part Acq Cost'].sum().reset_index()
+    total_acq_cost_batch = total_acq_cost_batch[total_acq_cost_batch['Batch Date'] != 'No Batch Assigned']
+    # Forcing datetime type on Batch Date
+    total_acq_cost_batch['Batch Date'] = pd.to_datetime(total_acq_cost_batch['Batch Date'], format='%d/%m/%Y')
+    # Merging with df_batches
+    df_batches = df_batches.merge(total_acq_cost_batch, on='Batch Date', how='left')
 
-        # Adding Acq Cost (US$) per Batch info
-        total_acq_cost_batch = pns_full_procurement_length.groupby('Batch Date')['Total Part Acq Cost'].sum().reset_index()
-        total_acq_cost_batch = total_acq_cost_batch[total_acq_cost_batch['Batch Date'] != 'No Batch Assigned']
-        # Forcing datetime type on Batch Date
-        total_acq_cost_batch['Batch Date'] = pd.to_datetime(total_acq_cost_batch['Batch Date'], format='%d/%m/%Y')
-        # Merging with df_batches
-        df_batches = df_batches.merge(total_acq_cost_batch, on='Batch Date', how='left')
+    return {
+        'parts': pns_full_procurement_length,
+        'qty': df_grouped_qty_delivery_date,
+        'acq_cost': df_grouped_acqcost_delivery_date,
+        'batches': df_batches
+    }
 
-        # Based on Batches spreasheet, generates Chart Images for Parts Qty batch feature
-        def create_qty_batch_chart(df_grouped_qty_delivery_date: pd.DataFrame):
-            # Image size
-            width, height = 680, 365
-            # Creating figure and axes to insert the chart: Batch Line Items
-            fig, ax = plt.subplots(figsize=(width / 100, height / 100),
-                                   layout='constrained')  # Layout property that handles "cutting" axes labels
-            # Keeping background transparent
-            fig.patch.set_facecolor("None")
-            fig.patch.set_alpha(0)
-            ax.set_facecolor('None')
 
-            # Common index (X-Axis) for all charts in the figure
-            x_labels = df_grouped_qty_delivery_date['Delivery Month Hyp'].dt.to_timestamp()
-
-            # Colors list, so that each Batch has one distinct axvspan
-            colors_array = ['blue', 'orange', 'green', 'black', 'purple', 'gray']
-
-            # For each Batch, create a AXVSpan Chart (Vertical Dintinction of Batches)
-            for i, row in df_batches.iterrows():
-                ax.axvspan(
-                    xmin=row['Batch Start Date'],
-                    xmax=row['Batch Date'],
-                    ymin=0, ymax=1,
-                    color=colors_array[i],
-                    alpha=0.3,
-                    label=f"B{row['Batch']} ({row['Batch Date'].strftime('%m/%Y')}) - {row['PNs Qty']} PNs"
-                )
+def batches_chart_specs(batches: dict, df_scope_with_scenarios: pd.DataFrame) -> tuple:
+    '''
+    Extracts from the Batches DataFrames (see calculate_batches()) what is needed to draw Parts Qty and Acq Cost Batch charts
+    (see chart_rendering.draw_batches_chart()).
+    :param batches: Dict returned by calculate_batches()
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information
+    :return: Tuple with Parts Qty and Acq Cost chart specs
+    '''
+    # Colors list, so that each Batch has one distinct axvspan
+    colors_array = ['blue', 'orange', 'green', 'black', 'purple', 'gray']
+    df_batches = batches['batches']
+
+    def batch_spans(description) -> list:
+        # (Start, End, Label, Color) of each Batch vertical span
+        return [(row['Batch Start Date'], row['Batch Date'], f"B{row['Batch']} ({row['Batch Date'].strftime('%m/%Y')}) - {description(row)}",
+                 colors_array[i]) for i, row in df_batches.iterrows()]
+
+    spec_qty = {
+        'months': batches['qty']['Delivery Month Hyp'].dt.to_timestamp().tolist(),
+        'monthly': batches['qty']['Distinct PNs Count'].to_numpy(dtype=float),
+        'accumulated': batches['qty']['Cumulative Sum Qty'].to_numpy(dtype=float),
+        'batches': batch_spans(lambda row: f"{row['PNs Qty']} PNs"),
+        'title': f'PNs - All Line Items ({df_scope_with_scenarios["Ecode"].count()} PNs)',
+        'ylabel': 'PNs Count',
+        'money': False
+    }
+    spec_acqcost = {
+        'months': batches['acq_cost']['Delivery Month Hyp'].dt.to_timestamp().tolist(),
+        'monthly': batches['acq_cost']['Total Acq Cost'].to_numpy(dtype=float),
+        'accumulated': batches['acq_cost']['Cumulative Acq Cost Qty'].to_numpy(dtype=float),
+        'batches': batch_spans(lambda row: f"US$ {row['Total Part Acq Cost']/1_000_000:.2f} M"),
+        'title': f'PNs - Acq Cost (US$ {max(batches["acq_cost"]["Cumulative Acq Cost Qty"])/1_000_000:.2f} M)',
+        'ylabel': 'Acq Cost (US$)',
+        'money': True
+    }
+    return spec_qty, spec_acqcost
 
-            # Bar Chart
-            bar = ax.bar(x=x_labels,
-                   height=df_grouped_qty_delivery_date['Distinct PNs Count'],
-                   color='steelblue',
-                   width=22,
-                   edgecolor='black',
-                   linewidth=0.4
-                   )
-
-            # Line Chart (Cumulative)
-            line = ax.plot(x_labels,
-                    df_grouped_qty_delivery_date['Cumulative Sum Qty'],
-                    color='black',
-                    marker='o',
-                    markersize=4)
-
-
-            # Batch Chart Settings
-            ax.set_ylabel('PNs Count')
-            ax.set_title(f'PNs - All Line Items ({df_scope_with_scenarios["Ecode"].count()} PNs)', fontsize=10)
-            ax.grid(True)
-            plt.legend(loc='upper left', fontsize=8)
-            # Rotating X labels
-            ax.tick_params(axis='x', rotation=45)
-            # Adjusting axis spacing to avoid cutting off labels
-            plt.subplots_adjust(left=0.15, right=0.9, bottom=0.2, top=0.9)
-            # Formatting x-axis from YYYY-MM to MM/YYYY
-            ax.xaxis.set_major_formatter(DateFormatter('%m/%Y'))
 
-            # Inserting chart into Canvas
-            canvas_batch_chart_items = FigureCanvasTkAgg(fig, master=batch_qty_frame)
-            canvas_batch_chart_items.draw()
-            # Configuring Canvas background
-            canvas_batch_chart_items.get_tk_widget().configure(background='#cfcfcf')
-            canvas_batch_chart_items.get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
+@function_timer
+def generate_batches_curve(batches_curve_window: ctk.CTkFrame, df_scope_with_scenarios: pd.DataFrame, batches: dict) :
+    '''
+    Function that receives the input so as to generate the Build-Up Curve based on batches.
+    :param batches_curve_window: CTkFrame of Batches Curve tab
+    :param df_scope_with_scenarios: DataFrame with Scope and All Scenarios joined information
+    :param batches: Batches of the first Scenario (see calculate_batches()), or None if no Batches were defined
+    '''
+    # Adding 2 tabs to Batch Charts: Parts Qty & Acq Cost (its inside this function because this screen is generated only if Batches feature was selected)
+    # Global Scope tbv_batch_charts so as to be invoked in BUP_GUI.py
+    global tbv_batch_charts, df_batches_full_info
+    # TabView - Batch Charts. It is created once per Scope window and reused by next Scenarios (its charts are replaced)
+    if tbv_batch_charts is None:
+        tbv_batch_charts = ctk.CTkTabview(batches_curve_window, width=600, height=500, corner_radius=15,
+                                          segmented_button_fg_color="#009898",
+                                          segmented_button_unselected_color="#009898",
+                                          segmented_button_selected_color="#006464",
+                                          bg_color='#cfcfcf', fg_color='#cfcfcf')
+        tbv_batch_charts.pack()
+        tbv_batch_charts.add('Parts Qty')
+        tbv_batch_charts.add('Acq Cost')
 
-            # --- Saving the chart image in BytesIO() (memory) so it is not necessary to save as a file ---
-            tmp_img_batch_chart_items = BytesIO()
-            fig.savefig(tmp_img_batch_chart_items, format='png', transparent=True)
-            tmp_img_batch_chart_items.seek(0)
-
-            # Keeping the image in an Image object
-            batch_items_chart = Image.open(tmp_img_batch_chart_items)
-
-            # Loading into a CTk Image object
-            batch_items_image = ctk.CTkImage(batch_items_chart,
-                                           dark_image=batch_items_chart,
-                                           size=(600, 220))
-
-            # Annotation functions to connect with mplcursors
-            def set_annotations_bar(sel):
-                # Extracting month from parameters of Annotation text
-                annotation_text = sel.annotation.get_text()
-                # Extracting value after x= and before \n (in annotation params)
-                if 'x=' in annotation_text:
-                    start = annotation_text.find('x=') +2
-                    end = annotation_text.find('\n', start)
-                    x_value = annotation_text[start:end]
-                    # Formatting Data from YYYY-MM to MM/YYYY
-                    formatted_date = '/'.join(x_value.split('-')[::-1])
-                # Setting text
-                sel.annotation.set_text(
-                    'Date: ' + str(formatted_date) + "\n" +
-                    'PNs Qty: ' + str(round(sel.target[1]))
-                )
-            def set_annotations_line(sel):
-                # Extracting month from parameters of Annotation text
-                annotation_text = sel.annotation.get_text()
-                # Extracting value after x= and before \n (in annotation params)
-                if 'x=' in annotation_text:
-                    start = annotation_text.find('x=') + 2
-                    end = annotation_text.find('\n', start)
-                    x_value = annotation_text[start:end]
-                    # Formatting Data from YYYY-MM to MM/YYYY
-                    formatted_date = '/'.join(x_value.split('-')[::-1])
-                # Setting text
-                sel.annotation.set_text(
-                    'Date: ' + str(formatted_date) + "\n" +
-                    'PNs Qty (Accumulated): ' + str(round(sel.target[1]))
-                )
+    # Export to Excel button - Batches Info
 
-            # Inserting Hover with mplcursors
-            mpc.cursor(bar, hover=True).connect('add', lambda sel: set_annotations_bar(sel))
-            mpc.cursor(line, hover=True).connect('add', lambda sel: set_annotations_line(sel))
+    # Naming Frames
+    batch_qty_frame = tbv_batch_charts.tab('Parts Qty')
+    batch_cost_frame = tbv_batch_charts.tab('Acq Cost')
 
+    # If there's Batch Information, creates the chart, Else: it shows an alert label
+    if batches is not None:
 
-        # Based on Batches spreasheet, generates Chart Images for Acq Cost batch feature
-        def create_acqcost_batch_chart(df_grouped_acqcost_delivery_date: pd.DataFrame):
+        # Batch of each PN and grouped Qty/Acq Cost by Delivery Month
+        df_grouped_qty_delivery_date, df_grouped_acqcost_delivery_date = batches['qty'], batches['acq_cost']
+        df_batches = batches['batches']
+
+        # Copying content from pns_full_procurement_length to df_batches_full_info
+        df_batches_full_info = batches['parts'].copy()
+
+        # Specs of Parts Qty and Acq Cost Batch charts
+        spec_qty, spec_acqcost = batches_chart_specs(batches, df_scope_with_scenarios)
+
+        # Based on Batches spreasheet, generates the Batch chart (Parts Qty or Acq Cost) in its TabView frame
+        def create_batch_chart(master: ctk.CTkFrame, spec: dict, bar_description: str, bar_fmt, line_description: str, line_fmt):
             # Image size
             width, height = 680, 365
-            # Creating figure and axes to insert the chart: Batch Line Items
+            # Creating figure and axes to insert the chart
             fig, ax = plt.subplots(figsize=(width / 100, height / 100),
                                    layout='constrained')  # Layout property that handles "cutting" axes labels
             # Keeping background transparent
@@ -2129,117 +3367,33 @@ def generate_batches_curve(batches_curve_window: ctk.CTkFrame, scenarios_list: l
             fig.patch.set_alpha(0)
             ax.set_facecolor('None')
 
-            # Common index (X-Axis) for all charts in the figure
-            x_labels = df_grouped_acqcost_delivery_date['Delivery Month Hyp'].dt.to_timestamp()
-
-            # Colors list, so that each Batch has one distinct axvspan
-            colors_array = ['blue', 'orange', 'green', 'black', 'purple', 'gray']
-            # For each Batch, create a AXVSpan Chart (Vertical Dintinction of Batches)
-            for i, row in df_batches.iterrows():
-                ax.axvspan(
-                    xmin=row['Batch Start Date'],
-                    xmax=row['Batch Date'],
-                    ymin=0, ymax=1,
-                    color=colors_array[i],
-                    alpha=0.3,
-                    label=f"B{row['Batch']} ({row['Batch Date'].strftime('%m/%Y')}) - US$ {row['Total Part Acq Cost']/1_000_000:.2f} M"
-                )
-
-            # Bar Chart
-            bar = ax.bar(x=x_labels,
-                         height=df_grouped_acqcost_delivery_date['Total Acq Cost'],
-                         color='steelblue',
-                         width=22,
-                         edgecolor='black',
-                         linewidth=0.4
-                         )
-
-            # Line Chart (Cumulative)
-            line = ax.plot(x_labels,
-                           df_grouped_acqcost_delivery_date['Cumulative Acq Cost Qty'],
-                           color='black',
-                           marker='o',
-                           markersize=4)
-
-            # Acq Cost Batch Chart Settings
-            ax.set_ylabel('Acq Cost (US$)')
-            ax.set_title(f'PNs - Acq Cost (US$ {max(df_grouped_acqcost_delivery_date["Cumulative Acq Cost Qty"])/1_000_000:.2f} M)',
-                         fontsize=10)
-            ax.grid(True)
-            plt.legend(loc='upper left', fontsize=8)
-            # Rotating X labels
-            ax.tick_params(axis='x', rotation=45)
-            # Adjusting axis spacing to avoid cutting off labels
-            plt.subplots_adjust(left=0.15, right=0.9, bottom=0.2, top=0.9)
-            # Formatting y-axis to show Millions (US$)
-            def millions_formatter(x, pos):
-                return f'{x/1_000_000:.0f}M' if x >= 1_000_000 else f'{x/1_000:.0f}K' if x >= 1_000 else f'{x:.0f}'
-
-            ax.yaxis.set_major_formatter(FuncFormatter(millions_formatter))
-            # Formatting x-axis from YYYY-MM to MM/YYYY
-            ax.xaxis.set_major_formatter(DateFormatter('%m/%Y'))
+            bar, line = chart_rendering.draw_batches_chart(ax, spec)
 
             # Inserting chart into Canvas
-            canvas_batch_chart_items = FigureCanvasTkAgg(fig, master=batch_cost_frame)
+            canvas_batch_chart_items = FigureCanvasTkAgg(fig, master=master)
             canvas_batch_chart_items.draw()
             # Configuring Canvas background
             canvas_batch_chart_items.get_tk_widget().configure(background='#cfcfcf')
             canvas_batch_chart_items.get_tk_widget().place(relx=0.5, rely=0.46, anchor=ctk.CENTER)
 
-            # --- Saving the chart image in BytesIO() (memory) so it is not necessary to save as a file ---
-            tmp_img_batch_chart_items = BytesIO()
-            fig.savefig(tmp_img_batch_chart_items, format='png', transparent=True)
-            tmp_img_batch_chart_items.seek(0)
-
-            # Keeping the image in an Image object
-            batch_items_chart = Image.open(tmp_img_batch_chart_items)
-
-            # Loading into a CTk Image object
-            batch_items_image = ctk.CTkImage(batch_items_chart,
-                                             dark_image=batch_items_chart,
-                                             size=(600, 220))
-
-            # Annotation functions to connect with mplcursors
-            def set_annotations_bar(sel):
-                # Extracting month from parameters of Annotation text
-                annotation_text = sel.annotation.get_text()
-                # Extracting value after x= and before \n (in annotation params)
-                if 'x=' in annotation_text:
-                    start = annotation_text.find('x=') + 2
-                    end = annotation_text.find('\n', start)
-                    x_value = annotation_text[start:end]
-                    # Formatting Data from YYYY-MM to MM/YYYY
-                    formatted_date = '/'.join(x_value.split('-')[::-1])
-                # Setting text
-                sel.annotation.set_text(
-                    'Date: ' + str(formatted_date) + "\n" +
-                    'Acq Cost (US$): ' + str(round(sel.target[1]/1_000, 2)) + " K"
-                )
+            # Hover texts of each month (bars and line)
+            bar_texts = [f'Date: {month:%m/%Y}\n{bar_description}: {bar_fmt(value)}' for month, value in zip(spec['months'], spec['monthly'])]
+            line_texts = [f'Date: {month:%m/%Y}\n{line_description}: {line_fmt(value)}' for month, value in zip(spec['months'], spec['accumulated'])]
 
-            def set_annotations_line(sel):
-                # Extracting month from parameters of Annotation text
-                annotation_text = sel.annotation.get_text()
-                # Extracting value after x= and before \n (in annotation params)
-                if 'x=' in annotation_text:
-                    start = annotation_text.find('x=') + 2
-                    end = annotation_text.find('\n', start)
-                    x_value = annotation_text[start:end]
-                    # Formatting Data from YYYY-MM to MM/YYYY
-                    formatted_date = '/'.join(x_value.split('-')[::-1])
-                # Setting text
-                sel.annotation.set_text(
-                    'Date: ' + str(formatted_date) + "\n" +
-                    'Acq Cost US$ (Accumulated): ' + str(round(sel.target[1]/1_000_000, 2)) + " M"
-                )
+            # Inserting Hover
+            connect_hover_annotation(canvas_batch_chart_items, ax, series_hover_target(ax, [(line[0], line_texts)], [(bar, bar_texts)]))
 
-            # Inserting Hover with mplcursors
-            mpc.cursor(bar, hover=True).connect('add', lambda sel: set_annotations_bar(sel))
-            mpc.cursor(line, hover=True).connect('add', lambda sel: set_annotations_line(sel))
+            return canvas_batch_chart_items
 
-        # Calling create_qty_batch_chart() function
-        create_qty_batch_chart(df_grouped_qty_delivery_date)
-        # Calling create_acqcost_batch_chart() function
-        create_acqcost_batch_chart(df_grouped_acqcost_delivery_date)
+        # Registering Batch charts (replacing previous Scenario ones) and building them, as they are placed on creation
+        register_canvas('batches_qty', lambda: create_batch_chart(batch_qty_frame, spec_qty,
+                                                                  'PNs Qty', lambda y: str(round(y)),
+                                                                  'PNs Qty (Accumulated)', lambda y: str(round(y))))
+        register_canvas('batches_acqcost', lambda: create_batch_chart(batch_cost_frame, spec_acqcost,
+                                                                      'Acq Cost (US$)', lambda y: f'{round(y / 1_000, 2)} K',
+                                                                      'Acq Cost US$ (Accumulated)', lambda y: f'{round(y / 1_000_000, 2)} M'))
+        get_canvas('batches_qty')
+        get_canvas('batches_acqcost')
 
     else:
         # Label with the instruction to create a Scenario
@@ -2252,16 +3406,64 @@ def generate_batches_curve(batches_curve_window: ctk.CTkFrame, scenarios_list: l
         lbl_no_batches_curve.place(rely=0.5, relx=0.5, anchor=ctk.CENTER)  
 
 
+def figure_to_image(figure, dpi: float = None, facecolor: str = None) -> Image.Image:
+    '''
+    Rasterizes a matplotlib Figure into a PIL Image straight from the Agg RGBA buffer (buffer_rgba), with no PNG encode/decode round-trip.
+    :param figure: matplotlib Figure, attached to an Agg based canvas (FigureCanvasAgg / FigureCanvasTkAgg)
+    :param dpi: Image resolution. Default (or same as the figure): reuses the canvas renderer, as shown on screen
+    :param facecolor: Background color composited under the (transparent) chart, ex: 'white'. Default: keeps transparency
+    :return: RGBA PIL Image, owning its pixels (safe to be used after the canvas is redrawn or from other threads)
+    '''
+    if dpi is None or dpi == figure.dpi:
+        # Drawing through the figure's own Agg canvas and wrapping its RGBA memory (memoryview) without copying it
+        figure.canvas.draw()
+        rgba_buffer = figure.canvas.buffer_rgba()
+        image_size = (rgba_buffer.shape[1], rgba_buffer.shape[0])
+        image = Image.frombuffer('RGBA', image_size, rgba_buffer, 'raw', 'RGBA', 0, 1)
+    else:
+        # Another resolution requires a new render: Agg 'raw' output is already RGBA pixels (no compression)
+        pixels_buffer = BytesIO()
+        figure.savefig(pixels_buffer, format='raw', dpi=dpi)
+        # Agg truncates the pixel width (as int()), and the height is taken from the rendered buffer itself
+        image_width = int(figure.get_figwidth() * dpi)
+        image_size = (image_width, pixels_buffer.getbuffer().nbytes // (4 * image_width))
+        image = Image.frombuffer('RGBA', image_size, pixels_buffer.getbuffer(), 'raw', 'RGBA', 0, 1)
+
+    # The canvas buffer is reused on next draw, so pixels are detached with a single memory copy (flattened when a background is given)
+    if facecolor is None:
+        return image.copy()
+    background = Image.new('RGBA', image.size, facecolor)
+    return Image.alpha_composite(background, image)
+
+
+def figure_to_ctkimage(figure, size: tuple = None) -> ctk.CTkImage:
+    '''
+    Static CTkImage of a chart (ex: to be shown in a CTkLabel), built from the Agg RGBA buffer by figure_to_image.
+    :param figure: matplotlib Figure, attached to an Agg based canvas
+    :param size: CTkImage size (width, height). Default: figure size in pixels
+    :return: CTkImage with the same image for light and dark modes
+    '''
+    image = figure_to_image(figure)
+    return ctk.CTkImage(light_image=image, dark_image=image, size=size or image.size)
+
+
 @function_timer
-def save_chart_image(chart: Image, output_path: str, filename: str) -> None:
-    # Function that receveis as argument the chart Image object, as well as output path and filename, and saves it.
+def save_chart_image(chart, output_path: str, filename: str, dpi: float = None) -> None:
+    '''
+    Saves a chart Figure as a PNG file. The figure is only rasterized here (not when the chart is created): pixels are taken
+    from the Agg buffer on the Tk thread, while PNG encoding and file writing run in the export writer (see submit_export_job()).
+    :param chart: matplotlib Figure of the chart (shown in a FigureCanvasTkAgg)
+    :param output_path: Folder in which the Image will be saved
+    :param filename: Image file name, ex: 'bup_efficient_chart.png'
+    :param dpi: Image resolution. Default: same as shown on screen
+    '''
+    full_path = output_path + '\\' + filename
+    dpi = dpi or chart.dpi
 
-    try:
-        chart.save(output_path + '\\' + filename)
-        messagebox.showinfo(title="Success!", message=str("Image was exported to: " + output_path + '\\' + filename))
-    except Exception as ex:
-        messagebox.showinfo(title="Error!", message=str(ex) + "\n\nPlease make sure that the Image file is "
-                                                              "closed and you have access to the local Downloads folder.")
+    # Rasterizing the figure with white background (Transparent is to plot. White to save as a file) straight from the Agg buffer
+    chart_image = figure_to_image(chart, dpi=dpi, facecolor='white')
+
+    submit_export_job(chart.canvas.get_tk_widget(), full_path, lambda temp_path: chart_image.save(temp_path, format='PNG'))
 
 @function_timer
 def read_stock_data():
@@ -0,0 +1,177 @@
+'''
+Headless Build-Up report: for a Scope file and a set of Scenarios, renders every chart of the application off-screen (in the
+chart rendering worker processes) into one multi-page PDF, and writes all the chart data into a single Excel workbook.
+
+Usage:
+    python bup_report.py <scope_file.xlsx> <scenarios.json> [--output FOLDER] [--load-mode local|network] [--wacc 5.42]
+
+scenarios.json is a list of Scenarios, with the same information of Scenario creation screen (dates in DD/MM/YYYY). Only
+the Contractual Conditions are required, Procurement Length and Batch Settings have the same Defaults of the screen:
+    [
+        {"t0": "01/03/2025", "acft_delivery_start": "01/06/2027", "material_delivery_start": 24, "material_delivery_end": 30,
+         "hyp_t0_start": 3, "buffer": 45, "batches_qty": 4}
+    ]
+'''
+# Data Wrangling
+import pandas as pd
+
+# System
+import os, sys, json, argparse, time, logging, multiprocessing
+
+# Extras
+from PIL import Image
+
+import bup_plan_analyzer as bup  # Source file with program functions
+import bup_export  # Excel export engine
+import chart_rendering
+
+# Procurement Length and Batch Settings Defaults (same of Scenario creation screen, see bup.create_scenario())
+scenario_defaults = {
+    'hyp_t0_start': 3,
+    'pr_release_approval_vss': 5,
+    'po_commercial_condition': 30,
+    'po_conversion': 30,
+    'export_license': 0,
+    'buffer': 60,
+    'outbound_logistic': 30,
+    'batches_qty': None,
+    'batches_dates': None
+}
+
+# Colors list, so that each Scenario has a specific color (same of the application charts)
+colors_array = ['blue', 'orange', 'black', 'green', 'purple']
+
+# Rendering resolution of PDF pages. Chart sizes are the same of the application, scaled from 100 dpi
+report_dpi = 200
+
+
+def load_scenarios(scenarios_file_path: str, bup_scope: pd.DataFrame) -> list:
+    '''
+    Reads the Scenarios file and builds each Scenario dict as the Scenario creation screen does.
+    :param scenarios_file_path: JSON file with a list of Scenarios
+    :param bup_scope: DataFrame with Scope and additional information (used to optimize Batch Dates, when only its Qty is given)
+    :return: List with all Scenarios
+    '''
+    with open(scenarios_file_path, encoding='utf-8') as scenarios_file:
+        scenarios_values = json.load(scenarios_file)
+
+    scenarios = []
+    for values in scenarios_values:
+        scenario = {**scenario_defaults, **values}
+        # Dates and integers, as in Scenario creation screen
+        for date_key in ['t0', 'acft_delivery_start']:
+            scenario[date_key] = pd.to_datetime(scenario[date_key], format='%d/%m/%Y')
+        for int_key in ['hyp_t0_start', 'material_delivery_start', 'material_delivery_end', 'pr_release_approval_vss',
+                        'po_commercial_condition', 'po_conversion', 'export_license', 'buffer', 'outbound_logistic']:
+            scenario[int_key] = int(scenario[int_key])
+
+        # Summing up full Procurement Length values
+        scenario['full_procurement_length'] = (scenario['pr_release_approval_vss'] + scenario['po_commercial_condition'] + scenario['po_conversion'] +
+                                               scenario['export_license'] + scenario['buffer'] + scenario['outbound_logistic'])
+
+        # If only the Batches Quantity was given, the Batch Dates are chosen by the solver (minimum carrying cost)
+        if scenario['batches_qty'] and scenario['batches_dates'] is None:
+            batches_dates = bup.optimize_batches_dates(bup_scope, scenario, scenario['batches_qty'])
+            scenario['batches_dates'] = ', '.join([batch_date.strftime('%d/%m/%Y') for batch_date in batches_dates])
+
+        scenarios.append(scenario)
+
+    return scenarios
+
+
+@bup.function_timer
+def generate_report(scope_file_path: str, scenarios_file_path: str, output_path: str, load_mode: str, wacc_value: float) -> tuple:
+    '''
+    Calculates all Scenarios curves (same functions of the application, without GUI) and renders the report charts in parallel.
+    :param scope_file_path: Scope file (.xlsx)
+    :param scenarios_file_path: Scenarios file (.json)
+    :param output_path: Folder in which the PDF and the Excel workbook will be saved
+    :param load_mode: Complementary info source: 'local' or 'network' (see bup.read_scope_file())
+    :param wacc_value: WACC (% in US$) of Cost Avoidance and PN Present Values
+    :return: PDF and Excel workbook full paths
+    '''
+    # ------------------------------ Data Processing ------------------------------
+    bup_scope = bup.read_scope_file(scope_file_path, load_mode)
+    bup_cost = (bup_scope['Acq Cost'] * bup_scope['Qty']).sum()
+    scenarios = load_scenarios(scenarios_file_path, bup_scope)
+
+    scenario_dataframes = {}
+    df_scope_with_scenarios, df_dates_eff, df_dates_hyp = bup.calculate_scenarios_curves(bup_scope, scenarios, scenario_dataframes)
+    if wacc_value != bup.default_wacc_value:
+        df_scope_with_scenarios = bup.calculate_parts_npv(df_scope_with_scenarios, wacc_value)
+    bup.calculate_acqcost_curves(df_scope_with_scenarios, df_dates_eff, df_dates_hyp, scenario_dataframes)
+    cost_avoidance = bup.calculate_cost_avoidance_curves(scenario_dataframes, scenarios, df_scope_with_scenarios, df_dates_eff, df_dates_hyp,
+                                                         bup_cost, bup.calculate_monthly_wacc(wacc_value))
+    batches = bup.calculate_batches(scenarios, df_scope_with_scenarios) if scenarios[0]['batches_dates'] is not None else None
+
+    # ------------------------------ Charts (PDF pages) ------------------------------
+    # (chart type, spec, width, height) of each page, in report order
+    leadtime_spec = bup.leadtime_chart_spec(bup_scope)
+    pages = [('dispersion', leadtime_spec, 600, 235),
+             ('histogram', leadtime_spec, 600, 235),
+             ('buildup', bup.buildup_chart_spec(df_scope_with_scenarios, scenario_dataframes, 'eff'), 680, 435),
+             ('buildup', bup.buildup_chart_spec(df_scope_with_scenarios, scenario_dataframes, 'hyp'), 680, 435)]
+
+    for index, (scenario_name, scenario_df_list) in enumerate(scenario_dataframes.items()):
+        color = colors_array[index % len(colors_array)]
+        pages.append(('acqcost', bup.acqcost_chart_spec(scenario_df_list[2], 'Order Date (Eff)', df_scope_with_scenarios, index, color,
+                                                        f'Efficient Curve (US$): {scenario_name}', 'Acq Cost (US$) Order Qty'), 680, 435))
+        pages.append(('acqcost', bup.acqcost_chart_spec(scenario_df_list[3], 'Delivery Date (Hyp)', df_scope_with_scenarios, index, color,
+                                                        f'Hypothetical Curve (US$): {scenario_name}', 'Acq Cost (US$) Delivered Qty'), 680, 435))
+        pages.append(('cost_avoidance', bup.cost_avoidance_chart_spec(scenario_df_list[4], cost_avoidance['fill_between_mask'][index], bup_cost,
+                                                                      color, scenarios[index]['hyp_t0_start']), 680, 280))
+
+    if batches is not None:
+        spec_qty, spec_acqcost = bup.batches_chart_specs(batches, df_scope_with_scenarios)
+        pages.append(('batches', spec_qty, 680, 365))
+        pages.append(('batches', spec_acqcost, 680, 365))
+
+    # All charts are submitted at once, so that they are rendered in parallel by the worker processes
+    scale = report_dpi / 100
+    render_futures = [chart_rendering.submit_chart(chart_type, spec, int(width * scale), int(height * scale), report_dpi)
+                      for chart_type, spec, width, height in pages]
+
+    # ------------------------------ Excel workbook (while charts are rendered) ------------------------------
+    # Same sheets of the application 'Export All' (Scope, Scope with Scenarios, all curves, Cost Avoidance and Batches), streamed
+    workbook_path = os.path.join(output_path, 'BUP_Report_Data.xlsx')
+    bup_export.write_workbook(workbook_path, bup_export.application_sheets(bup_scope, df_scope_with_scenarios, scenario_dataframes,
+                                                                           batches['parts'] if batches is not None else None))
+
+    # ------------------------------ PDF ------------------------------
+    pdf_images = []
+    for render_future in render_futures:
+        width, height, rgba_bytes = render_future.result()
+        chart_image = Image.frombuffer('RGBA', (width, height), rgba_bytes, 'raw', 'RGBA', 0, 1)
+        # Transparent charts over white pages
+        pdf_page = Image.new('RGB', (width, height), 'white')
+        pdf_page.paste(chart_image, mask=chart_image)
+        pdf_images.append(pdf_page)
+
+    pdf_path = os.path.join(output_path, 'BUP_Report.pdf')
+    pdf_images[0].save(pdf_path, format='PDF', save_all=True, append_images=pdf_images[1:], resolution=report_dpi)
+
+    return pdf_path, workbook_path
+
+
+if __name__ == "__main__":
+    # Chart rendering workers are spawned processes, also when running as a frozen executable
+    multiprocessing.freeze_support()
+
+    parser = argparse.ArgumentParser(description='Build-Up Plan Analyzer - Headless report (multi-page PDF and Excel workbook)')
+    parser.add_argument('scope_file', help='Scope file (.xlsx), same format of the application')
+    parser.add_argument('scenarios_file', help='Scenarios file (.json), see bup_report.py documentation')
+    parser.add_argument('--output', default=os.path.join(os.path.expanduser('~'), 'Downloads'), help='Output folder. Default: Downloads')
+    parser.add_argument('--load-mode', default='local', choices=['local', 'network'], help='Complementary info source. Default: local')
+    parser.add_argument('--wacc', type=float, default=bup.default_wacc_value, help=f'WACC (%% in US$). Default: {bup.default_wacc_value}')
+    args = parser.parse_args()
+
+    start_time = time.time()
+    try:
+        pdf_path, workbook_path = generate_report(args.scope_file, args.scenarios_file, args.output, args.load_mode, args.wacc)
+    except Exception as ex:
+        logging.exception('Report generation failed.')
+        sys.exit(f'Report generation failed: {ex}')
+    finally:
+        chart_rendering.shutdown_rendering_pool()
+
+    print(f'Report generated in {time.time() - start_time:.1f} seconds:\n{pdf_path}\n{workbook_path}')
@@ -0,0 +1,183 @@
+'''
+Session files (.bups): the Scope read, the Scenarios created and all their calculated curves, so that an analysis is reopened
+without reading the Scope again (no Ecode Data/MARCSA access) and without recalculating the Scenarios.
+
+A session is a zip file with:
+- manifest.json: session structure (Scenarios parameters, DataFrames columns and dtypes, dicts/lists of the results) in which
+  every array is a reference to an array entry
+- arrays/<number>.npy: NumPy arrays (columns and indexes of DataFrames, result arrays), compressed by the zip
+
+Text and mixed-type columns are stored as text plus a type code of each value, so no pickle is used.
+'''
+# Data Wrangling
+import pandas as pd, numpy as np
+
+# System
+import io, json, zipfile
+
+# Session format version, checked when a session is opened
+session_version = 1
+session_extension = '.bups'
+
+# Type codes of values in text/mixed columns (object dtype)
+object_kinds = {'none': 0, 'str': 1, 'int': 2, 'float': 3, 'bool': 4, 'timestamp': 5}
+
+
+class SessionWriter:
+    '''
+    Writes arrays in the session zip as they are packed (see pack_value()), keeping only the manifest in memory.
+    '''
+    __slots__ = ('zip_file', 'arrays_count')
+
+    def __init__(self, zip_file: zipfile.ZipFile):
+        self.zip_file = zip_file
+        self.arrays_count = 0
+
+    def add_array(self, array: np.ndarray) -> str:
+        # Stores the array and returns its entry name
+        entry_name = f'arrays/{self.arrays_count}.npy'
+        self.arrays_count += 1
+        with self.zip_file.open(entry_name, 'w', force_zip64=True) as array_file:
+            np.lib.format.write_array(array_file, np.ascontiguousarray(array), allow_pickle=False)
+        return entry_name
+
+
+def pack_object_values(values) -> dict:
+    # Object dtype values (text, numbers read as text, empty values, Timestamps) as a text array and a type code array
+    kinds, texts = np.empty(len(values), dtype=np.int8), []
+    for position, value in enumerate(values):
+        if value is None or value is pd.NaT or value is pd.NA:
+            kinds[position], text = object_kinds['none'], ''
+        elif isinstance(value, str):
+            kinds[position], text = object_kinds['str'], value
+        elif isinstance(value, (bool, np.bool_)):
+            kinds[position], text = object_kinds['bool'], str(int(value))
+        elif isinstance(value, (int, np.integer)):
+            kinds[position], text = object_kinds['int'], str(value)
+        elif isinstance(value, (float, np.floating)):
+            kinds[position], text = object_kinds['float'], repr(float(value))
+        elif isinstance(value, pd.Timestamp):
+            kinds[position], text = object_kinds['timestamp'], value.isoformat()
+        else:
+            # Other objects (ex: Period, date) are kept as their text
+            kinds[position], text = object_kinds['str'], str(value)
+        texts.append(text)
+    return {'kinds': kinds, 'texts': np.array(texts, dtype=str)}
+
+
+def unpack_object_values(kinds: np.ndarray, texts: np.ndarray) -> np.ndarray:
+    # Inverse of pack_object_values(): object array, so that pandas does not infer another dtype (ex: ints with None as floats)
+    converters = {object_kinds['none']: lambda text: None, object_kinds['str']: str, object_kinds['int']: int,
+                  object_kinds['float']: float, object_kinds['bool']: lambda text: text == '1', object_kinds['timestamp']: pd.Timestamp}
+    values = np.empty(len(kinds), dtype=object)
+    values[:] = [converters[kind](text) for kind, text in zip(kinds.tolist(), texts.tolist())]
+    return values
+
+
+def pack_array(writer: SessionWriter, values) -> dict:
+    '''
+    :param writer: Session being written
+    :param values: Column, Index or array
+    :return: Manifest node of the array (entry names and how it is restored)
+    '''
+    if isinstance(values.dtype, pd.PeriodDtype):
+        return {'array': 'period', 'freq': values.dtype.freq.freqstr, 'ordinals': writer.add_array(values.array.asi8)}
+    # Text, mixed and pandas extension dtypes (ex: categories, nullable integers)
+    if values.dtype == object or pd.api.types.is_extension_array_dtype(values.dtype):
+        packed = pack_object_values(np.asarray(values, dtype=object))
+        return {'array': 'object', 'kinds': writer.add_array(packed['kinds']), 'texts': writer.add_array(packed['texts']),
+                'dtype': str(values.dtype) if values.dtype != object else None}
+    return {'array': 'numpy', 'data': writer.add_array(np.asarray(values))}
+
+
+def unpack_array(zip_file: zipfile.ZipFile, node: dict):
+    # Inverse of pack_array(): NumPy array, PeriodArray, object array or pandas extension array
+    def read(entry_name: str) -> np.ndarray:
+        with zip_file.open(entry_name) as array_file:
+            return np.lib.format.read_array(io.BytesIO(array_file.read()), allow_pickle=False)
+
+    if node['array'] == 'period':
+        return pd.arrays.PeriodArray(read(node['ordinals']), dtype=pd.PeriodDtype(node['freq']))
+    if node['array'] == 'object':
+        values = unpack_object_values(read(node['kinds']), read(node['texts']))
+        return pd.array(values, dtype=node['dtype']) if node['dtype'] is not None else values
+    return read(node['data'])
+
+
+def pack_value(writer: SessionWriter, value):
+    '''
+    Packs a value of the session: DataFrames, arrays, Index, Timestamps, dicts and lists of them, and JSON values.
+    :param writer: Session being written
+    :param value: Value to be packed
+    :return: Manifest node (JSON)
+    '''
+    if isinstance(value, pd.DataFrame):
+        return {'type': 'dataframe', 'columns': [pack_value(writer, column) for column in value.columns],
+                'data': [pack_array(writer, value[column]) for column in value.columns],
+                'index': pack_value(writer, value.index) if not isinstance(value.index, pd.RangeIndex) else None,
+                'range_index': [value.index.start, value.index.stop, value.index.step] if isinstance(value.index, pd.RangeIndex) else None}
+    if isinstance(value, pd.Index):
+        return {'type': 'index', 'name': value.name, 'data': pack_array(writer, value)}
+    if isinstance(value, (np.ndarray, pd.Series)):
+        return {'type': 'array', 'data': pack_array(writer, value)}
+    if isinstance(value, pd.Timestamp):
+        return {'type': 'timestamp', 'value': value.isoformat()}
+    if isinstance(value, dict):
+        return {'type': 'dict', 'items': [[pack_value(writer, key), pack_value(writer, item)] for key, item in value.items()]}
+    if isinstance(value, (list, tuple)):
+        return {'type': 'list' if isinstance(value, list) else 'tuple', 'items': [pack_value(writer, item) for item in value]}
+    if isinstance(value, np.generic):
+        value = value.item()
+    return {'type': 'value', 'value': value}
+
+
+def unpack_value(zip_file: zipfile.ZipFile, node: dict):
+    # Inverse of pack_value()
+    match node['type']:
+        case 'dataframe':
+            columns = [unpack_value(zip_file, column) for column in node['columns']]
+            index = (unpack_value(zip_file, node['index']) if node['index'] is not None else pd.RangeIndex(*node['range_index']))
+            df = pd.DataFrame({position: unpack_array(zip_file, data) for position, data in enumerate(node['data'])}, index=index)
+            df.columns = columns
+            return df
+        case 'index':
+            return pd.Index(unpack_array(zip_file, node['data']), name=node['name'])
+        case 'array':
+            return np.asarray(unpack_array(zip_file, node['data']))
+        case 'timestamp':
+            return pd.Timestamp(node['value'])
+        case 'dict':
+            return {unpack_value(zip_file, key): unpack_value(zip_file, item) for key, item in node['items']}
+        case 'list':
+            return [unpack_value(zip_file, item) for item in node['items']]
+        case 'tuple':
+            return tuple(unpack_value(zip_file, item) for item in node['items'])
+        case _:
+            return node['value']
+
+
+def save_session(full_path: str, session: dict) -> None:
+    '''
+    Writes a session file.
+    :param full_path: Session file full path (.bups)
+    :param session: Dict with 'scope_file' (Scope file name), 'bup_scope' (Scope DataFrame) and 'scenario_results' (results of the
+    last Scenario job: Scenarios, scenario_dataframes, df_scope_with_scenarios, cost_avoidance and batches. None without Scenarios)
+    '''
+    with zipfile.ZipFile(full_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+        writer = SessionWriter(zip_file)
+        manifest = {'version': session_version, 'created': pd.Timestamp.now().isoformat(),
+                    'session': pack_value(writer, session)}
+        zip_file.writestr('manifest.json', json.dumps(manifest))
+
+
+def load_session(full_path: str) -> dict:
+    '''
+    Reads a session file.
+    :param full_path: Session file full path (.bups)
+    :return: Session dict, as saved (see save_session())
+    '''
+    with zipfile.ZipFile(full_path) as zip_file:
+        manifest = json.loads(zip_file.read('manifest.json'))
+        if manifest['version'] != session_version:
+            raise ValueError(f"Session version {manifest['version']} is not supported (expected {session_version}).")
+        return unpack_value(zip_file, manifest['session'])
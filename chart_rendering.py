@@ -0,0 +1,428 @@
+# Data Wrangling
+import numpy as np
+
+# Data Viz (Agg only: no pyplot and no Tk, so that charts can be drawn in worker processes)
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.ticker import FuncFormatter
+from matplotlib.dates import DateFormatter, MonthLocator
+import matplotlib.lines as mlines
+from matplotlib.colors import to_rgba
+import matplotlib
+
+# System
+import os, logging, hashlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Extras
+from PIL import Image
+
+'''
+** CHART RENDERING SERVICE **:
+
+Per Scenario charts (Acq Cost and Cost Avoidance) are drawn off-screen with the Agg backend in a pool of worker processes,
+so that N Scenarios are rendered in about the time of one and the Tk thread is not blocked. The headless report (bup_report.py)
+renders all charts through the same pool.
+
+Workers receive only a chart "spec" (dict with the numeric curve arrays and labels of one chart, see bup_plan_analyzer
+*_chart_spec() functions) and return the rendered RGBA pixels. The same draw functions are used by the interactive
+(FigureCanvasTkAgg) charts, so both look exactly the same.
+'''
+
+# Scopes with more parts than this are drawn with small rasterized markers, one artist per SPC (see draw_dispersion_chart())
+dispersion_rasterize_threshold = 20000
+
+# Process pool, created on first chart submission (see get_rendering_pool())
+rendering_pool = None
+# Workers quantity. One core is left to the GUI
+rendering_workers = max(1, min(8, (os.cpu_count() or 2) - 1))
+
+# On-disk cache of rendered charts (PNG files named by the hash of chart type, size and spec data), evicted by least recently used
+chart_cache_path = 'chart_cache'
+chart_cache_max_bytes = 200 * 1024 ** 2
+# Changing the draw functions must change this version, so that old images are not reused
+chart_cache_version = '2'
+# Cache lookups of this process
+cache_hits, cache_misses = 0, 0
+
+
+# Function to format y-axis (float) to money format in million (US$ X M)
+def y_axis_acqcost_fmt(x, _):
+    return f'U$ {x/1e6:.2f}M'
+
+
+def draw_acqcost_chart(ax, spec: dict) -> tuple:
+    '''
+    Draws the Acq Cost chart (monthly bars and accumulated line) of a Scenario, for Efficient or Hypothetical curve.
+    :param ax: matplotlib Axes in which the chart will be drawn
+    :param spec: Chart spec (see bup_plan_analyzer.acqcost_chart_spec())
+    :return: Bars container and accumulated Line2D list, for the hover annotations
+    '''
+    # Bars - Monthly Acq Cost
+    bars = ax.bar(spec['dates'], spec['monthly'], label=spec['label'], color=spec['color'])
+
+    # Accumulated Line
+    line = ax.plot(spec['dates'], spec['accumulated'], label=spec['label'], color=spec['color'])
+    # Configuring the axis
+    ax.set_xticks(np.arange(len(spec['dates']))[::3], spec['dates'][::3], rotation=45, ha='right')
+
+    # Adding a vertical line at t0 and in acft_delivery_start
+    ax.axvline(x=spec['t0'], linestyle='--', color=spec['color'], label=f"t0: {spec['label']}")
+    ax.axvline(x=spec['acft_delivery_start'], linestyle='dotted', color=spec['color'],
+               label=f"Acft Delivery Start: {spec['label']}")
+
+    # Adding a material delivery range between the Start and End dates
+    ax.axvspan(spec['material_delivery_start'], spec['material_delivery_end'], alpha=0.5, color=spec['color'])
+
+    # Adding a note at the point where the Build-Up is completed (all items delivered)
+    x_max, y_max = spec['conclusion']
+    ax.scatter(x_max, y_max, color=spec['color'], marker='o', label=f'BUP Conclusion: {x_max}')
+
+    # Chart Settings
+    ax.set_ylabel(spec['ylabel'])
+    ax.tick_params(axis='both', labelsize=9)  # Adjusting labels size
+    ax.set_title(spec['title'], color='green', fontweight='bold')
+    ax.grid(True)
+    ax.yaxis.set_major_formatter(FuncFormatter(y_axis_acqcost_fmt))
+
+    return bars, line
+
+
+def draw_cost_avoidance_chart(ax, spec: dict) -> tuple:
+    '''
+    Draws the Cost Avoidance chart of a Scenario: Efficient accumulated Acq Cost, Hypothetical purchase and Cash Saved area.
+    :param ax: matplotlib Axes in which the chart will be drawn
+    :param spec: Chart spec (see bup_plan_analyzer.cost_avoidance_chart_spec())
+    :return: Efficient Line2D list and Hypothetical Bars container
+    '''
+    # Configuring the axis
+    ax.set_xticks(np.arange(len(spec['dates']))[::3], spec['dates'][::3], rotation=45, ha='right')
+
+    # Efficient Accumulated Line - Acq Cost
+    eff_line = ax.plot(spec['dates'], spec['eff_accumulated'], label='Efficient Curve', color=spec['color'], ls='dashed')
+
+    # Hypothetical Order Qty (Acq Cost) happens all in 'T0+X' Date
+    hyp_bars = ax.bar(spec['dates'], spec['hyp_amount'], label=spec['hyp_label'], color=spec['color'])
+
+    # Filling Cost Avoidance area, from Hypothetical Purchase date until Efficient Curve End Date
+    ax.fill_between(x=spec['dates'], y1=spec['bup_cost'], y2=spec['fill_between_ctrl'],
+                    where=spec['fill_between_mask'], interpolate=True,
+                    color=spec['color'], alpha=0.2, hatch='\\', label='Cash Saved')
+
+    # Chart Settings
+    ax.set_ylabel('Acq Cost (US$) Delivered Qty')
+    ax.tick_params(axis='both', labelsize=9)  # Adjusting labels size
+    ax.set_title('Cost Avoidance (Efficient Asset Allocation)', color=spec['color'], fontweight='bold')
+    ax.grid(True)
+    ax.legend(loc='lower right', fontsize=7, framealpha=0.8)
+    ax.yaxis.set_major_formatter(FuncFormatter(y_axis_acqcost_fmt))
+
+    return eff_line, hyp_bars
+
+
+def draw_dispersion_chart(ax, spec: dict):
+    '''
+    Draws the Acq Cost x Leadtime dispersion of Scope parts.
+    :param ax: matplotlib Axes in which the chart will be drawn
+    :param spec: Chart spec (see bup_plan_analyzer.leadtime_chart_spec())
+    :return: Artists of the parts (scatter collection, or one Line2D per SPC on large scopes)
+    '''
+    # Function to format y-axis values in thousands
+    def format_acq_cost(value, _):
+        return f'US$ {value / 1000:.0f}k'
+
+    # Scattering Items
+    if len(spec['leadtime']) > dispersion_rasterize_threshold:
+        # Markers of a single color are drawn much faster than a scatter with per point colors (about 30x at 100k parts)
+        scatter = [ax.plot(spec['leadtime'][spc_mask], spec['acq_cost'][spc_mask], linestyle='none', marker='o', markersize=2.5,
+                           markeredgewidth=0, color=color, alpha=0.5, rasterized=True)[0]
+                   for spc_mask, color in [(spec['expendable'], 'orange'), (~spec['expendable'], 'purple')]]
+    else:
+        # RGBA colors (color names of each point would be parsed one by one)
+        conditional_colors = np.where(spec['expendable'][:, None], to_rgba('orange'), to_rgba('purple'))
+        scatter = ax.scatter(spec['leadtime'], spec['acq_cost'], color=conditional_colors, marker='o', alpha=0.7)
+
+    # Custom Labels Patches
+    expendable_patch = mlines.Line2D([], [], marker='o', color='orange', markersize=6, lw=0, label='Expendable')
+    repairable_patch = mlines.Line2D([], [], marker='o', color='purple', markersize=6, lw=0, label='Repairable')
+
+    # Adding labels and legends
+    ax.set_xlabel('Leadtime', loc='right')
+    ax.set_ylabel('Acq Cost')
+    ax.set_title('Dispersion Acq Cost x Leadtime', fontsize=10)
+    ax.legend(handles=[expendable_patch, repairable_patch], fontsize=9, framealpha=0.6)
+    ax.grid(True)
+    # Setting personalized format to y-axis
+    ax.yaxis.set_major_formatter(FuncFormatter(format_acq_cost))
+
+    return scatter
+
+
+def draw_histogram(ax, spec: dict) -> tuple:
+    '''
+    Draws the Leadtime histogram of Scope parts, with Average and Standard Deviation.
+    :param ax: matplotlib Axes in which the chart will be drawn
+    :param spec: Chart spec (see bup_plan_analyzer.leadtime_chart_spec())
+    :return: Histogram counts, bins and patches
+    '''
+    # Inserting Average and Standard Deviation of Leadtimes - Before histogram plottation
+    avg_leadtimes = np.mean(spec['leadtime'])
+    sd_leadtimes = np.std(spec['leadtime'], ddof=1)
+    ax.axvline(x=avg_leadtimes, linestyle='--', color='black', label=f'Average: {round(avg_leadtimes)}')
+    ax.axvspan(avg_leadtimes - sd_leadtimes, avg_leadtimes + sd_leadtimes, alpha=0.4, color='#fccf03',
+               label=f'Std: {round(sd_leadtimes)}', hatch='/', edgecolor='black')
+
+    # Creating Histogram and saving the information in control variables
+    n, bins, patches = ax.hist(spec['leadtime'], bins=20, edgecolor='k', color='#1fa9a4', linewidth=0.7, alpha=0.9)
+
+    # Histogram settings
+    ax.set_ylabel('Materials Count')
+    ax.set_xlabel('Leadtime', loc='right')
+    ax.set_title('Leadtime Histogram (in days)', fontsize=10)
+    # Adjusting the y-axis limit (the largest bar was transcending the upper limit)
+    ax.set_ylim(0, max(n) + 50)  # Adding a margin to accommodate the count at the top of the bar
+
+    # Inserting the count into each bar
+    for count, bar in zip(n, patches):
+        x = bar.get_x() + bar.get_width() / 2
+        y = bar.get_height()
+        ax.text(x, y, f'{int(count)}', ha='center', va='bottom', fontdict={
+            'family': 'open sans',
+            'size': 9
+        })
+
+    # Legend
+    ax.legend(fontsize=9, framealpha=0.6)
+
+    return n, bins, patches
+
+
+def draw_buildup_chart(ax, spec: dict) -> None:
+    '''
+    Draws the Efficient or Hypothetical Build-Up chart (accumulated Parts Qty) with all Scenarios.
+    :param ax: matplotlib Axes in which the chart will be drawn
+    :param spec: Chart spec (see bup_plan_analyzer.buildup_chart_spec())
+    '''
+    for scenario in spec['scenarios']:
+        ax.plot(scenario['dates'], scenario['accumulated'], label=scenario['label'], color=scenario['color'])
+        # Adding vertical lines at t0 and in acft_delivery_start, and the material delivery range
+        ax.axvline(x=scenario['t0'], linestyle='--', color=scenario['color'], label=f"t0: {scenario['label']}")
+        ax.axvline(x=scenario['acft_delivery_start'], linestyle='dotted', color=scenario['color'],
+                   label=f"Acft Delivery Start: {scenario['label']}")
+        ax.axvspan(scenario['material_delivery_start'], scenario['material_delivery_end'], alpha=0.5, color=scenario['color'])
+        # Notes (Planning Start, BUP Conclusion, etc)
+        for x, y, marker, label in scenario['markers']:
+            ax.scatter(x, y, color=scenario['color'], marker=marker, label=label)
+
+    # Real dates on x-axis (a tick each 3 months)
+    ax.xaxis.set_major_locator(MonthLocator(interval=3))
+    ax.xaxis.set_major_formatter(DateFormatter('%m/%Y'))
+    ax.tick_params(axis='x', labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right')
+
+    # Chart settings
+    ax.set_ylabel(spec['ylabel'])
+    ax.set_title(spec['title'], color='#ad7102', fontweight='bold')
+    ax.grid(True)
+    ax.tick_params(axis='both', labelsize=9)  # Adjusting labels size
+    ax.legend(loc='upper left', fontsize=7, framealpha=0.8)
+
+
+def draw_batches_chart(ax, spec: dict) -> tuple:
+    '''
+    Draws a Batches chart (Parts Qty or Acq Cost by Hypothetical Delivery Month, with each Batch range).
+    :param ax: matplotlib Axes in which the chart will be drawn
+    :param spec: Chart spec (see bup_plan_analyzer.batches_chart_specs())
+    :return: Bars container and cumulative Line2D list, for the hover annotations
+    '''
+    # For each Batch, create a AXVSpan Chart (Vertical Dintinction of Batches)
+    for batch_start, batch_end, label, color in spec['batches']:
+        ax.axvspan(xmin=batch_start, xmax=batch_end, ymin=0, ymax=1, color=color, alpha=0.3, label=label)
+
+    # Bar Chart
+    bar = ax.bar(x=spec['months'], height=spec['monthly'], color='steelblue', width=22, edgecolor='black', linewidth=0.4)
+
+    # Line Chart (Cumulative)
+    line = ax.plot(spec['months'], spec['accumulated'], color='black', marker='o', markersize=4)
+
+    # Batch Chart Settings
+    ax.set_ylabel(spec['ylabel'])
+    ax.set_title(spec['title'], fontsize=10)
+    ax.grid(True)
+    ax.legend(loc='upper left', fontsize=8)
+    # Rotating X labels
+    ax.tick_params(axis='x', rotation=45)
+
+    # Formatting y-axis to show Millions (US$)
+    def millions_formatter(x, pos):
+        return f'{x/1_000_000:.0f}M' if x >= 1_000_000 else f'{x/1_000:.0f}K' if x >= 1_000 else f'{x:.0f}'
+
+    if spec['money']:
+        ax.yaxis.set_major_formatter(FuncFormatter(millions_formatter))
+    # Formatting x-axis from YYYY-MM to MM/YYYY
+    ax.xaxis.set_major_formatter(DateFormatter('%m/%Y'))
+
+    return bar, line
+
+
+# Draw function of each chart type
+chart_drawers = {
+    'dispersion': draw_dispersion_chart,
+    'histogram': draw_histogram,
+    'buildup': draw_buildup_chart,
+    'acqcost': draw_acqcost_chart,
+    'cost_avoidance': draw_cost_avoidance_chart,
+    'batches': draw_batches_chart
+}
+
+
+def render_chart(chart_type: str, spec: dict, width: int, height: int, dpi: float = 100) -> tuple:
+    '''
+    Renders a chart off-screen with the Agg backend. Runs in the worker processes (or in-process, as a fallback).
+    :param chart_type: Key of chart_drawers, ex: 'acqcost'
+    :param spec: Chart spec, with numeric arrays and labels only
+    :param width: Image width (px)
+    :param height: Image height (px)
+    :param dpi: Figure resolution
+    :return: Tuple (width, height, RGBA bytes) of the rendered image, with transparent background
+    '''
+    figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi, layout='constrained')
+    canvas = FigureCanvasAgg(figure)
+    # Keeping background transparent
+    figure.patch.set_facecolor("None")
+    figure.patch.set_alpha(0)
+    ax = figure.add_subplot(111)
+    ax.set_facecolor('None')
+
+    chart_drawers[chart_type](ax, spec)
+
+    canvas.draw()
+    rgba_buffer = canvas.buffer_rgba()
+    return rgba_buffer.shape[1], rgba_buffer.shape[0], bytes(rgba_buffer)
+
+
+def update_spec_hash(hasher, value) -> None:
+    # Feeds a chart spec into the hash: dict keys in order, NumPy arrays by dtype/shape/raw bytes, other values by repr()
+    if isinstance(value, dict):
+        for key in sorted(value):
+            hasher.update(f'<{key}>'.encode())
+            update_spec_hash(hasher, value[key])
+    elif isinstance(value, np.ndarray):
+        hasher.update(f'{value.dtype.str}{value.shape}'.encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f'[{len(value)}'.encode())
+        for item in value:
+            update_spec_hash(hasher, item)
+    else:
+        hasher.update(repr(value).encode())
+
+
+def chart_cache_key(chart_type: str, spec: dict, width: int, height: int, dpi: float) -> str:
+    # Content address of a rendered chart: same data, type, size and drawing code produce the same key
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(f'{chart_cache_version}|{matplotlib.__version__}|{chart_type}|{width}x{height}@{dpi}'.encode())
+    update_spec_hash(hasher, spec)
+    return hasher.hexdigest()
+
+
+def read_cached_chart(cache_key: str):
+    '''
+    :return: Cached render_chart() result (width, height, RGBA bytes), or None if the chart is not cached
+    '''
+    cache_file = os.path.join(chart_cache_path, cache_key + '.png')
+    try:
+        with Image.open(cache_file) as cached_image:
+            chart_image = cached_image.convert('RGBA')
+        # Marking it as recently used (eviction is by modification time)
+        os.utime(cache_file)
+    except (OSError, ValueError):
+        return None
+    return chart_image.width, chart_image.height, chart_image.tobytes()
+
+
+def write_cached_chart(cache_key: str, rendered_chart: tuple) -> None:
+    # Saves a rendered chart (temporary file, then renamed, so that a partial file is never read) and evicts old ones over the size limit
+    width, height, rgba_bytes = rendered_chart
+    cache_file = os.path.join(chart_cache_path, cache_key + '.png')
+    temp_file = f'{cache_file}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(chart_cache_path, exist_ok=True)
+        Image.frombuffer('RGBA', (width, height), rgba_bytes, 'raw', 'RGBA', 0, 1).save(temp_file, format='PNG', compress_level=1)
+        os.replace(temp_file, cache_file)
+        enforce_chart_cache_limit()
+    except OSError as ex:
+        logging.warning(f"Chart could not be cached ({ex}).")
+
+
+def enforce_chart_cache_limit() -> None:
+    # Removing least recently used images while the cache folder is over chart_cache_max_bytes
+    cache_files = [entry for entry in os.scandir(chart_cache_path) if entry.name.endswith('.png')]
+    cache_size = sum(entry.stat().st_size for entry in cache_files)
+    for entry in sorted(cache_files, key=lambda entry: entry.stat().st_mtime):
+        if cache_size <= chart_cache_max_bytes:
+            break
+        try:
+            cache_size -= entry.stat().st_size
+            os.remove(entry.path)
+        except OSError:
+            pass  # Already removed by another worker
+
+
+def render_and_cache_chart(chart_type: str, spec: dict, width: int, height: int, dpi: float, cache_key: str) -> tuple:
+    # Worker task: renders the chart and stores it in the on-disk cache
+    rendered_chart = render_chart(chart_type, spec, width, height, dpi)
+    write_cached_chart(cache_key, rendered_chart)
+    return rendered_chart
+
+
+def get_chart_cache_stats() -> str:
+    # Hits/misses of this process, to be logged
+    return f'Chart cache: {cache_hits} hits, {cache_misses} misses.'
+
+
+def get_rendering_pool() -> ProcessPoolExecutor:
+    # Returns the process pool, creating it on first use (workers are spawned on demand and kept for next Scenarios)
+    global rendering_pool
+
+    if rendering_pool is None:
+        rendering_pool = ProcessPoolExecutor(max_workers=rendering_workers)
+    return rendering_pool
+
+
+def submit_chart(chart_type: str, spec: dict, width: int, height: int, dpi: float = 100) -> Future:
+    '''
+    Submits a chart to be rendered by the worker processes (see render_chart() parameters). Charts with the same data,
+    type and size already rendered (also in previous sessions) are read from the on-disk cache instead.
+    :return: Future with the render_chart() result. If the pool is not available, the chart is rendered in-process
+    '''
+    global rendering_pool, cache_hits, cache_misses
+
+    cache_key = chart_cache_key(chart_type, spec, width, height, dpi)
+    future = Future()
+
+    cached_chart = read_cached_chart(cache_key)
+    if cached_chart is not None:
+        cache_hits += 1
+        future.set_result(cached_chart)
+        return future
+    cache_misses += 1
+
+    try:
+        return get_rendering_pool().submit(render_and_cache_chart, chart_type, spec, width, height, dpi, cache_key)
+    except (BrokenProcessPool, RuntimeError, OSError) as ex:
+        logging.warning(f"Chart rendering pool is not available ({ex}). Rendering '{chart_type}' chart in-process.")
+        rendering_pool = None
+        future.set_result(render_and_cache_chart(chart_type, spec, width, height, dpi, cache_key))
+        return future
+
+
+def shutdown_rendering_pool() -> None:
+    # Stops the worker processes, cancelling charts not rendered yet
+    global rendering_pool
+
+    if rendering_pool is not None:
+        rendering_pool.shutdown(wait=False, cancel_futures=True)
+        rendering_pool = None